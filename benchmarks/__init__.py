@@ -0,0 +1,6 @@
+"""
+Инициализация пакета benchmarks
+
+Замеры производительности mls, diff_eq и golden_ratio запускаются командой
+python -m benchmarks.run
+"""
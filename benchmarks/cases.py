@@ -0,0 +1,155 @@
+"""
+Наборы замеров производительности
+
+Каждый замер - это функция без аргументов. Данные для неё готовятся
+заранее и не входят в замер. Замеры вида "time" оцениваются по времени
+выполнения, замеры вида "count" возвращают количество вычислений
+целевой функции, которое не зависит от машины.
+
+Классы:
+    Case - описание одного замера
+
+Функции:
+    mls_cases - замеры метода наименьших квадратов
+    diff_eq_cases - замеры методов решения СДУ
+    golden_cases - замеры методов поиска минимума
+    all_cases - все замеры
+"""
+import functools
+import typing
+import numpy as np
+from mls import mls_algorythm
+from diff_eq.algorythm import Euler, RungeKutta
+from golden_ratio.algorythm import function, golden_algorythm, brent_search
+
+MLS_SIZES = (1_000, 100_000)
+MLS_DEGREES = (3, 8)
+DIFF_STEPS = (0.01, 0.001)
+DIFF_DIMENSIONS = (2, 64, 1024)
+GOLDEN_TOLERANCES = (1e-3, 1e-6, 1e-9)
+
+
+class Case(typing.NamedTuple):
+    """Описание одного замера
+
+    Поля:
+        name: str - уникальное имя замера
+        kind: str - "time" для времени выполнения или "count" для количества вычислений
+        run: typing.Callable - функция без аргументов
+    """
+    name: str
+    kind: str
+    run: typing.Callable
+
+
+def _name(group: str, **params) -> str:
+    """Имя замера с параметрами
+
+    :param group: модуль и функция
+    :param params: параметры замера
+    :return: имя вида group[key=value,...]
+    """
+    return f"{group}[{','.join(f'{key}={value}' for key, value in params.items())}]"
+
+
+def mls_cases() -> list:
+    """Замеры метода наименьших квадратов по числу точек и степени полинома
+
+    :return: список Case
+    """
+    rng = np.random.default_rng(0)
+    cases = []
+    for size in MLS_SIZES:
+        x_data = np.linspace(-1, 1, size)
+        y_data = np.sin(3 * x_data) + rng.normal(0, 0.1, size)
+        for degree in MLS_DEGREES:
+            system = mls_algorythm.coefs_calculate(x_data, y_data, degree)
+            poly = mls_algorythm.build_poly(x_data, y_data, degree)
+            params = {"n": size, "degree": degree}
+            cases += [
+                Case(_name("mls.coefs_calculate", **params), "time",
+                     functools.partial(mls_algorythm.coefs_calculate, x_data, y_data, degree)),
+                Case(_name("mls.solve_system", **params), "time",
+                     functools.partial(mls_algorythm.solve_system, system)),
+                Case(_name("mls.build_poly", **params), "time",
+                     functools.partial(mls_algorythm.build_poly, x_data, y_data, degree)),
+                Case(_name("mls.std_dev", **params), "time",
+                     functools.partial(mls_algorythm.std_dev, x_data, y_data, poly)),
+            ]
+    return cases
+
+
+def _decay(_: float, y_vector: np.ndarray, rates: np.ndarray) -> np.ndarray:
+    """Векторная правая часть y' = -rates * y
+
+    :param _: заглушка для общего вида функций
+    :param y_vector: вектор значений y
+    :param rates: скорости затухания компонент
+    :return: значения правой части
+    """
+    return -rates * y_vector
+
+
+def diff_eq_cases() -> list:
+    """Замеры методов решения СДУ по шагу сетки и размерности системы
+
+    :return: список Case
+    """
+    cases = []
+    for algorythm in (Euler, RungeKutta):
+        for dimension in DIFF_DIMENSIONS:
+            rhs = functools.partial(_decay, rates=np.linspace(0.1, 1, dimension))
+            for step in DIFF_STEPS:
+                cases.append(Case(
+                    _name(f"diff_eq.{algorythm.__name__}.run", step=step, dim=dimension),
+                    "time", functools.partial(algorythm(rhs).run, np.ones(dimension),
+                                              step, (0, 1))))
+    return cases
+
+
+def _count_evals(search: typing.Callable, eps: float) -> int:
+    """Количество вычислений искомой функции при поиске минимума
+
+    :param search: метод поиска с сигнатурой golden_algorythm
+    :param eps: точность
+    :return: количество вычислений
+    """
+    calls = []
+    search(0, 2, eps, func=lambda x_value: calls.append(x_value) or function(x_value))
+    return len(calls)
+
+
+def _search_algorythm(search: typing.Callable, start: float, end: float, eps: float, *,
+                      func: typing.Callable) -> float:
+    """Метод поиска с сигнатурой golden_algorythm
+
+    :param search: метод поиска с результатом SearchResult
+    :param start: нижняя граница отрезка
+    :param end: верхняя граница отрезка
+    :param eps: точность
+    :param func: функция одной переменной
+    :return: точка минимума
+    """
+    return search(func, start, end, xtol=eps).x
+
+
+def golden_cases() -> list:
+    """Замеры количества вычислений функции методами поиска минимума
+
+    :return: список Case
+    """
+    searches = {
+        "golden_algorythm": golden_algorythm,
+        "brent_search": functools.partial(_search_algorythm, brent_search),
+    }
+    return [Case(_name(f"golden_ratio.{name}.evals", eps=eps), "count",
+                 functools.partial(_count_evals, search, eps))
+            for name, search in searches.items() for eps in GOLDEN_TOLERANCES]
+
+
+def all_cases() -> list:
+    """Все замеры
+
+    :return: список Case
+    """
+    return mls_cases() + diff_eq_cases() + golden_cases()
@@ -0,0 +1,180 @@
+"""
+Запуск замеров производительности и сравнение с базовыми результатами
+
+Запуск: python -m benchmarks.run [--filter mls] [--update-baseline]
+
+Время замера "time" - наименьшее среди repeat повторов время одного
+вызова, количество вызовов в повторе подбирается так, чтобы повтор длился
+не меньше min_time. Результаты сохраняются в JSON и сравниваются с файлом
+базовых результатов: замер считается регрессией, если время выросло
+больше чем в threshold раз или количество вычислений выросло хоть на одно.
+Базовые результаты по времени зависят от машины и обновляются флагом
+--update-baseline в окружении с версиями из requirements.txt, окружение
+записывается в файл вместе с результатами.
+
+Функции:
+    measure - время одного вызова функции
+    run_cases - выполнение замеров
+    compare - сравнение результатов с базовыми
+    main - основная функция
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import typing
+import numpy as np
+from benchmarks.cases import all_cases
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+THRESHOLD = 1.5
+
+
+def measure(func: typing.Callable, min_time: float = 0.2, repeat: int = 3) -> float:
+    """Время одного вызова функции
+
+    :param func: функция без аргументов
+    :param min_time: минимальная длительность одного повтора в секундах
+    :param repeat: количество повторов
+    :return: наименьшее время одного вызова в секундах
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(10, int(1.2 * min_time / elapsed) + 1))
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+def run_cases(cases: list, min_time: float = 0.2, repeat: int = 3,
+              output: typing.TextIO = None) -> dict:
+    """Выполнение замеров
+
+    :param cases: список Case
+    :param min_time: минимальная длительность одного повтора в секундах
+    :param repeat: количество повторов
+    :param output: поток для вывода хода замеров или None
+    :return: словарь {имя замера: {"kind": вид, "value": значение}}
+    """
+    results = {}
+    for case in cases:
+        if case.kind == "count":
+            value = case.run()
+        else:
+            value = measure(case.run, min_time, repeat)
+        results[case.name] = {"kind": case.kind, "value": value}
+        if output is not None:
+            print(f"{case.name:<55} {_format(case.kind, value)}", file=output)
+    return results
+
+
+def _format(kind: str, value: float) -> str:
+    """Запись значения замера
+
+    :param kind: вид замера
+    :param value: значение
+    :return: строка
+    """
+    return f"{value:d}" if kind == "count" else f"{value * 1e3:.4f} ms"
+
+
+def compare(results: dict, baseline: dict, threshold: float = THRESHOLD) -> list:
+    """Сравнение результатов с базовыми
+
+    Замеры, которых нет в одном из словарей, пропускаются.
+
+    :param results: текущие результаты
+    :param baseline: базовые результаты
+    :param threshold: допустимый рост времени, во сколько раз
+    :return: список кортежей (имя замера, базовое значение, текущее значение)
+    для замеров с регрессией
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]["value"]
+        limit = base if result["kind"] == "count" else base * threshold
+        if result["value"] > limit:
+            regressions.append((name, base, result["value"]))
+    return regressions
+
+
+def _environment() -> dict:
+    """Описание окружения для файла результатов
+
+    :return: словарь с версиями и платформой
+    """
+    return {"python": platform.python_version(), "numpy": np.__version__,
+            "platform": platform.platform(), "processor": platform.processor()}
+
+
+def _dump(path: str, results: dict):
+    """Запись результатов и окружения в файл JSON
+
+    :param path: путь к файлу
+    :param results: результаты замеров
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"environment": _environment(), "results": results}, file, indent=2)
+        file.write("\n")
+
+
+def main(argv: list = None) -> int:
+    """Основная функция
+
+    :param argv: аргументы командной строки, по умолчанию sys.argv
+    :return: код возврата, 1 при регрессии
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run",
+                                     description="Замеры производительности")
+    parser.add_argument("--filter", default="", help="подстрока имени замера")
+    parser.add_argument("--output", default="bench_results.json",
+                        help="файл для сохранения результатов")
+    parser.add_argument("--baseline", default=BASELINE, help="файл базовых результатов")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="допустимый рост времени, во сколько раз")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="минимальная длительность повтора в секундах")
+    parser.add_argument("--repeat", type=int, default=3, help="количество повторов")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="записать результаты как базовые")
+    args = parser.parse_args(argv)
+
+    cases = [case for case in all_cases() if args.filter in case.name]
+    results = run_cases(cases, args.min_time, args.repeat, sys.stdout)
+    _dump(args.output, results)
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as file:
+                baseline = json.load(file)["results"]
+        baseline.update(results)
+        _dump(args.baseline, baseline)
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}, run with --update-baseline")
+        return 0
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)["results"]
+    regressions = compare(results, baseline, args.threshold)
+    for name, base, value in regressions:
+        kind = results[name]["kind"]
+        print(f"REGRESSION {name}: {_format(kind, base)} -> {_format(kind, value)}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
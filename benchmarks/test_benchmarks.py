@@ -0,0 +1,61 @@
+"""
+Тестирование запуска и сравнения замеров производительности
+
+Функции:
+    test_measure - тестирование измерения времени
+    test_compare - тестирование сравнения с базовыми результатами
+    test_cases - тестирование имён и видов замеров
+    test_main - тестирование запуска из командной строки
+"""
+import json
+from benchmarks.cases import all_cases
+from benchmarks.run import measure, compare, main
+
+
+def test_measure():
+    """Тестирование измерения времени"""
+    calls = []
+    value = measure(lambda: calls.append(1), min_time=0.001, repeat=2)
+    assert 0 < value < 0.001
+    assert len(calls) > 2
+
+
+def test_compare():
+    """Тестирование сравнения с базовыми результатами"""
+    baseline = {"a": {"kind": "time", "value": 1.0}, "b": {"kind": "count", "value": 10},
+                "c": {"kind": "time", "value": 1.0}}
+    results = {"a": {"kind": "time", "value": 1.4}, "b": {"kind": "count", "value": 11},
+               "c": {"kind": "time", "value": 1.6}, "d": {"kind": "time", "value": 9.0}}
+    assert compare(results, baseline) == [("b", 10, 11), ("c", 1.0, 1.6)]
+    assert compare(results, baseline, threshold=2) == [("b", 10, 11)]
+
+
+def test_cases():
+    """Тестирование имён и видов замеров"""
+    cases = all_cases()
+    names = [case.name for case in cases]
+    assert len(set(names)) == len(names)
+    assert {case.kind for case in cases} == {"time", "count"}
+    assert {name.split(".")[0] for name in names} == {"mls", "diff_eq", "golden_ratio"}
+
+
+def test_main(tmp_path, capsys):
+    """Тестирование запуска, записи результатов и обнаружения регрессии"""
+    output = str(tmp_path / "results.json")
+    baseline = str(tmp_path / "baseline.json")
+    arguments = ["--filter", "golden_ratio", "--output", output, "--baseline", baseline]
+    assert main(arguments + ["--update-baseline"]) == 0
+    with open(output, encoding="utf-8") as file:
+        results = json.load(file)["results"]
+    assert results and all(result["kind"] == "count" for result in results.values())
+    assert main(arguments) == 0
+    with open(baseline, encoding="utf-8") as file:
+        stored = json.load(file)
+    name = next(iter(stored["results"]))
+    stored["results"][name]["value"] -= 1
+    with open(baseline, "w", encoding="utf-8") as file:
+        json.dump(stored, file)
+    assert main(arguments) == 1
+    assert f"REGRESSION {name}" in capsys.readouterr().out
+    assert main(["--filter", "mls.solve_system[n=1000,degree=3]", "--output", output,
+                 "--baseline", baseline, "--min-time", "0.001", "--repeat", "1"]) == 0
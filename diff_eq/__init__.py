@@ -2,4 +2,3 @@
 Инициализация пакета diff_eq
 """
 import diff_eq.algorythm
-import diff_eq.test_diff
@@ -2,22 +2,30 @@
 Алгоритмы приближенного решения системы ДУ
 
 Классы:
+    ScalarSystem - адаптер списка скалярных функций к векторной правой части
     BaseAlgorythm - абстрактный класс, реализующий общую схему алгоритма
     Euler - класс, реализующий метод Эйлера
     RungeKutta - класс, реализующий метод Рунге-Кутта
+    StepStatistics - статистика шагов адаптивного метода
+    AdaptiveAlgorythm - абстрактный класс методов с адаптивным выбором шага
+    DormandPrince - класс, реализующий адаптивный метод Дормана-Принса
 
 Функции:
     func1 - первая функция в системе ДУ
     func2 - вторая функция в системе ДУ
+    system - векторная форма системы ДУ
+    trajectory - вычисление всех точек траектории
+    results_figure - описание графика с результатами работы метода
     plot_results - построение графика с результатами работы метода
     main - основная функция запуска методов и отрисовки
 """
 import abc
+import math
 import typing
 from abc import ABC
-import copy
 import numpy as np
-import matplotlib.pyplot as plt
+from diff_eq.dense import DenseSolution
+from rendering.batch import Curve, Figure, render
 
 
 def func1(_: float, y_vector: list) -> float:
@@ -40,22 +48,89 @@ def func2(x_value: float, _: list) -> float:
     return -0.01 * np.e ** (-0.8 * x_value)
 
 
+def system(x_value: float, y_vector: np.ndarray) -> np.ndarray:
+    """Векторная форма системы (func1, func2)
+
+    Вектор y может иметь любое число ведущих измерений,
+    компоненты системы расположены по последней оси.
+
+    :param x_value: значение x
+    :param y_vector: вектор (y1, y2) или массив таких векторов
+    :return: значения правой части в виде numpy.ndarray
+    """
+    result = np.empty(np.shape(y_vector))
+    result[..., 0] = np.asarray(y_vector)[..., 1]
+    result[..., 1] = -0.01 * np.exp(-0.8 * x_value)
+    return result
+
+
 # pylint: disable=too-few-public-methods
+class ScalarSystem:
+    """Адаптер, собирающий векторную правую часть из скалярных функций
+
+    Поля:
+        functions: tuple - функции f_i(x, y), образующие СДУ
+    """
+    def __init__(self, functions: tuple):
+        """Конструктор класса
+
+        :param functions: список функций, образующих СДУ
+        """
+        self.functions = tuple(functions)
+
+    def __call__(self, x_value: float, y_vector: np.ndarray) -> np.ndarray:
+        """Вычисление всех компонент правой части
+
+        :param x_value: значение x
+        :param y_vector: вектор значений y
+        :return: значения правой части в виде numpy.ndarray
+        """
+        return np.array([func(x_value, y_vector) for func in self.functions], dtype=float)
+
+
 class BaseAlgorythm(ABC):
     """Абстрактный класс, реализующий общую схему алгоритма
 
+    Система задаётся либо одной векторной функцией f(x, y) -> numpy.ndarray,
+    либо списком скалярных функций f_i(x, y), которые объединяются
+    адаптером ScalarSystem. Шаг метода вычисляется для всего вектора y
+    сразу.
+
     Методы:
         run - запуска алгоритма
+        record - запуск алгоритма с записью траектории в массивы
+        stream - запуск алгоритма с выдачей траектории блоками
+        dense - запуск алгоритма с плотным выводом решения
     """
-    def __init__(self, functions: tuple):
+    def __init__(self, functions: typing.Union[typing.Callable, tuple]):
         """Конструктор класса
 
-        :param functions: список функций, образующих СДУ
+        :param functions: векторная функция f(x, y) или список функций,
+        образующих СДУ
         """
-        self.__functions = copy.copy(functions)
+        if callable(functions):
+            self._rhs = functions
+        else:
+            self._rhs = ScalarSystem(functions)
         self._current_x = 0.
-        self._current_y = [0., 0.]
+        self._current_y = np.zeros(2)
         self._step = 0.
+        self._node_slope = None
+
+    @staticmethod
+    def _step_count(step: float, x_lim: tuple) -> int:
+        """Количество шагов сетки на диапазоне
+
+        Количество вычисляется заранее как целое число, поэтому накопление
+        ошибки округления в x не добавляет лишний шаг.
+
+        :param step: шаг сетки
+        :param x_lim: диапазон сетки
+        :return: количество шагов
+        """
+        if step <= 0:
+            raise ValueError("step should be positive")
+        return max(math.ceil(round((x_lim[1] - x_lim[0]) / step, 9)), 0)
 
     def run(self, start_points: list, step: float, x_lim: tuple = (0, 1),
             *, action: typing.Callable = None) -> tuple:
@@ -67,109 +142,542 @@ class BaseAlgorythm(ABC):
         :param action: опциональное действие в начале каждой итерации
         :return: значение итоговой точки
         """
+        count = self._step_count(step, x_lim)
         self._current_x = x_lim[0]
-        self._current_y = np.array(start_points).astype("float")
+        self._current_y = np.array(start_points, dtype=float)
         self._step = step
-        while self._current_x < x_lim[1]:
+        for index in range(1, count + 1):
             if action is not None:
                 action(self._current_x, tuple(self._current_y))
-            self.__one_step()
+            self._one_step()
+            self._current_x = x_lim[0] + index * step
         return self._current_x, self._current_y
 
-    def __one_step(self):
+    def record(self, start_points: list, step: float, x_lim: tuple = (0, 1),
+               record_every: int = 1) -> tuple:
+        """Запуск метода с записью траектории в массивы
+
+        Записываются начальная точка, каждая record_every-я точка
+        и итоговая точка.
+
+        :param start_points: начальные условия СДУ
+        :param step: шаг сетки
+        :param x_lim: диапазон сетки
+        :param record_every: шаг прореживания записи
+        :return: массив значений x и массив значений y, объединённые в кортеж
+        """
+        if record_every < 1:
+            raise ValueError("record_every should be >=1 ")
+        count = self._step_count(step, x_lim)
+        indexes = np.arange(0, count + 1, record_every)
+        if indexes[-1] != count:
+            indexes = np.append(indexes, count)
+        self._current_x = x_lim[0]
+        self._current_y = np.array(start_points, dtype=float)
+        self._step = step
+        x_values = x_lim[0] + indexes * step
+        y_values = np.empty((indexes.size,) + self._current_y.shape)
+        y_values[0] = self._current_y
+        targets = indexes.tolist()
+        row = 1
+        for index in range(1, count + 1):
+            self._one_step()
+            self._current_x = x_lim[0] + index * step
+            if index == targets[row]:
+                y_values[row] = self._current_y
+                row += 1
+        return x_values, y_values
+
+    # pylint: disable=too-many-arguments
+    def stream(self, start_points: list, step: float, x_lim: tuple = (0, 1),
+               chunk_size: int = 1024, *, first_step: int = 0) -> typing.Iterator:
+        """Запуск метода с выдачей траектории блоками фиксированного размера
+
+        В памяти одновременно находится только один блок, поэтому расход
+        памяти не зависит от длины диапазона. Для продолжения прерванного
+        расчёта start_points задают состояние в узле сетки first_step.
+
+        :param start_points: начальные условия СДУ
+        :param step: шаг сетки
+        :param x_lim: диапазон сетки
+        :param chunk_size: количество точек в блоке
+        :param first_step: номер узла сетки, с которого начинается расчёт
+        :return: генератор пар (массив значений x, массив значений y)
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size should be >=1")
+        count = self._step_count(step, x_lim)
+        if not 0 <= first_step <= count:
+            raise ValueError(f"first_step should lie within [0, {count}]")
+        self._current_x = x_lim[0] + first_step * step
+        self._current_y = np.array(start_points, dtype=float)
+        self._step = step
+        for begin in range(first_step, count + 1, chunk_size):
+            indexes = np.arange(begin, min(begin + chunk_size, count + 1))
+            y_block = np.empty((indexes.size,) + self._current_y.shape)
+            for row, index in enumerate(indexes.tolist()):
+                if index > first_step:
+                    self._one_step()
+                    self._current_x = x_lim[0] + index * step
+                y_block[row] = self._current_y
+            yield x_lim[0] + indexes * step, y_block
+
+    def dense(self, start_points: list, step: float,
+              x_lim: tuple = (0, 1)) -> DenseSolution:
+        """Запуск метода с плотным выводом решения
+
+        Значение правой части в узле сохраняется шагом метода, поэтому
+        дополнительно правая часть вычисляется только в итоговой точке.
+
+        :param start_points: начальные условия СДУ
+        :param step: шаг сетки
+        :param x_lim: диапазон сетки
+        :return: решение, вычисляемое в произвольных точках диапазона
+        """
+        count = self._step_count(step, x_lim)
+        self._current_x = x_lim[0]
+        self._current_y = np.array(start_points, dtype=float)
+        self._step = step
+        y_values = np.empty((count + 1,) + self._current_y.shape)
+        slopes = np.empty_like(y_values)
+        y_values[0] = self._current_y
+        for index in range(1, count + 1):
+            self._node_slope = None
+            x_value = self._current_x
+            previous_y = self._current_y
+            self._one_step()
+            slopes[index - 1] = (self._rhs(x_value, previous_y) if self._node_slope is None
+                                 else self._node_slope)
+            self._current_x = x_lim[0] + index * step
+            y_values[index] = self._current_y
+        slopes[count] = self._rhs(self._current_x, self._current_y)
+        return DenseSolution(x_lim[0] + np.arange(count + 1) * step, y_values, slopes)
+
+    def _one_step(self):
         """Шаг итерации"""
-        for index, value in enumerate(self._current_y):
-            func = self.__functions[index]
-            f_value = self._step_function(func)
-            self._current_y[index] = value + self._step * f_value
+        self._current_y = self._current_y + self._step * self._step_function(self._rhs)
         self._current_x += self._step
 
     @abc.abstractmethod
-    def _step_function(self, func: typing.Callable) -> float:
+    def _step_function(self, func: typing.Callable) -> np.ndarray:
         """Функция вычисления шагового множителя
 
-        :param func: функция из СДУ
-        :return: множитель
+        :param func: векторная правая часть СДУ
+        :return: множитель для всего вектора y
         """
 
 
 class Euler(BaseAlgorythm):
     """Метод Эйлера приближенного решения СДУ"""
-    def _step_function(self, func: typing.Callable) -> float:
+    def _step_function(self, func: typing.Callable) -> np.ndarray:
         """Реализация множителя для метода Эйлера
 
-        :param func: функция из СДУ
+        Множитель совпадает со значением правой части в узле и
+        сохраняется для плотного вывода.
+
+        :param func: векторная правая часть СДУ
         :return: множитель
         """
-        return func(self._current_x, self._current_y)
+        self._node_slope = func(self._current_x, self._current_y)
+        return self._node_slope
 
 
 class RungeKutta(BaseAlgorythm):
     """Метод Рунге-Кутта приближенного решения СДУ"""
-    def _step_function(self, func: typing.Callable) -> float:
+    def _step_function(self, func: typing.Callable) -> np.ndarray:
         """Реализация множителя для метода Рунге-Кутта
 
-        :param func: функция из СДУ
+        Первая стадия - значение правой части в узле - сохраняется
+        для плотного вывода.
+
+        :param func: векторная правая часть СДУ
         :return: множитель
         """
-        temp_x = copy.copy(self._current_x)
-        temp_y = copy.copy(self._current_y)
-        value_1 = func(temp_x, temp_y)
-        temp_x += self._step / 2
-        temp_y = self._current_y + value_1 * self._step / 2
-        value_2 = func(temp_x, temp_y)
-        temp_y = self._current_y + value_2 * self._step / 2
-        value_3 = func(temp_x, temp_y)
-        temp_x += self._step / 2
-        temp_y = self._current_y + value_3 * self._step
-        value_4 = func(temp_x, temp_y)
-        f_value = value_1 + 2 * value_2 + 2 * value_3 + value_4
-        return f_value / 6
-
-
-# pylint: disable=no-member
-def plot_results(algorythm: BaseAlgorythm, params: list, path: str = ""):
-    """Отрисовка результатов работы алгоритма
+        half_x = self._current_x + self._step / 2
+        value_1 = func(self._current_x, self._current_y)
+        self._node_slope = value_1
+        value_2 = func(half_x, self._current_y + value_1 * (self._step / 2))
+        value_3 = func(half_x, self._current_y + value_2 * (self._step / 2))
+        value_4 = func(self._current_x + self._step, self._current_y + value_3 * self._step)
+        return (value_1 + 2 * (value_2 + value_3) + value_4) / 6
+
+
+class StepStatistics(typing.NamedTuple):
+    """Статистика шагов адаптивного метода
+
+    Поля:
+        accepted: int - количество принятых шагов
+        rejected: int - количество отклонённых шагов
+        evaluations: int - количество вычислений правой части
+    """
+    accepted: int
+    rejected: int
+    evaluations: int
+
+
+# pylint: disable=too-many-instance-attributes, abstract-method
+class AdaptiveAlgorythm(BaseAlgorythm):
+    """Абстрактный класс методов с адаптивным выбором шага
+
+    Наследник вычисляет шаговый множитель и сохраняет оценку локальной
+    ошибки в _error, а шаг подбирается так, чтобы эта оценка не превышала
+    atol + rtol * |y|. Порядок оценки ошибки задаётся полем ERROR_ORDER.
+    Для массива состояний (например, ансамбля) норма ошибки вычисляется
+    по последней оси, и шаг выбирается по состоянию с наибольшей ошибкой.
+
+    Методы:
+        run - запуск алгоритма, step задаёт начальный шаг
+        record - запуск алгоритма с записью принятых точек в массивы
+        stream - запуск алгоритма с выдачей принятых точек блоками
+        dense - запуск алгоритма с плотным выводом решения
+        statistics - статистика шагов последнего запуска
+    """
+    ERROR_ORDER = 1
+    MIN_FACTOR = 0.2
+    MAX_FACTOR = 5.
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, functions: typing.Union[typing.Callable, tuple],
+                 rtol: float = 1e-6, atol: float = 1e-9,
+                 max_step: float = np.inf, safety: float = 0.9):
+        """Конструктор класса
+
+        :param functions: векторная функция f(x, y) или список функций,
+        образующих СДУ
+        :param rtol: относительная точность
+        :param atol: абсолютная точность
+        :param max_step: максимальный шаг
+        :param safety: коэффициент запаса при выборе шага
+        """
+        super().__init__(functions)
+        if rtol <= 0 and atol <= 0:
+            raise ValueError("rtol or atol should be positive")
+        self.rtol = rtol
+        self.atol = atol
+        self.max_step = max_step
+        self.safety = safety
+        self._error = None
+        self._accepted = 0
+        self._rejected = 0
+        self._evaluations = 0
+
+    def statistics(self) -> StepStatistics:
+        """Статистика шагов последнего запуска
+
+        :return: статистика в виде StepStatistics
+        """
+        return StepStatistics(self._accepted, self._rejected, self._evaluations)
+
+    def _reset(self):
+        """Сброс состояния перед запуском"""
+        self._accepted = self._rejected = self._evaluations = 0
+
+    def _accept(self):
+        """Действие после принятия шага"""
+
+    def _reject(self):
+        """Действие после отклонения шага"""
+
+    def _next_step(self, factor: float) -> float:
+        """Следующий шаг
+
+        :param factor: рекомендуемый коэффициент изменения шага
+        :return: следующий шаг
+        """
+        return min(self._step * factor, self.max_step)
+
+    def _accepted_steps(self, start_points: list, step: float,
+                        x_lim: tuple) -> typing.Iterator:
+        """Генератор принятых шагов
+
+        :param start_points: начальные условия СДУ
+        :param step: начальный шаг
+        :param x_lim: диапазон сетки
+        :return: генератор, выполняющий очередной принятый шаг
+        """
+        if step <= 0:
+            raise ValueError("step should be positive")
+        self._current_x = x_lim[0]
+        self._current_y = np.array(start_points, dtype=float)
+        self._reset()
+        span = x_lim[1] - x_lim[0]
+        exponent = -1 / self.ERROR_ORDER
+        step = min(step, self.max_step)
+        while x_lim[1] - self._current_x > 1e-12 * max(abs(span), 1.):
+            self._step = min(step, x_lim[1] - self._current_x)
+            new_y = self._current_y + self._step * self._step_function(self._rhs)
+            scale = self.atol + self.rtol * np.maximum(np.abs(self._current_y), np.abs(new_y))
+            norm = float(np.sqrt(np.mean((self._error / scale) ** 2, axis=-1)).max())
+            if norm <= 1:
+                self._accepted += 1
+                self._current_x += self._step
+                self._current_y = new_y
+                self._accept()
+                factor = self.MAX_FACTOR if norm == 0 else \
+                    min(self.MAX_FACTOR, self.safety * norm ** exponent)
+                yield
+            else:
+                self._rejected += 1
+                self._reject()
+                factor = max(self.MIN_FACTOR, self.safety * norm ** exponent)
+            step = self._next_step(factor)
+            if step <= 1e-14 * max(abs(self._current_x), 1.):
+                raise RuntimeError(f"step size too small at x={self._current_x}")
+        self._current_x = float(x_lim[1])
+
+    def run(self, start_points: list, step: float, x_lim: tuple = (0, 1),
+            *, action: typing.Callable = None) -> tuple:
+        """Запуск метода
+
+        :param start_points: начальные условия СДУ
+        :param step: начальный шаг
+        :param x_lim: диапазон сетки
+        :param action: опциональное действие в начале каждого принятого шага
+        :return: значение итоговой точки
+        """
+        last = (x_lim[0], tuple(np.array(start_points, dtype=float)))
+        for _ in self._accepted_steps(start_points, step, x_lim):
+            if action is not None:
+                action(*last)
+                last = (self._current_x, tuple(self._current_y))
+        return self._current_x, self._current_y
+
+    def record(self, start_points: list, step: float, x_lim: tuple = (0, 1),
+               record_every: int = 1) -> tuple:
+        """Запуск метода с записью принятых точек в массивы
+
+        :param start_points: начальные условия СДУ
+        :param step: начальный шаг
+        :param x_lim: диапазон сетки
+        :param record_every: шаг прореживания записи
+        :return: массив значений x и массив значений y, объединённые в кортеж
+        """
+        if record_every < 1:
+            raise ValueError("record_every should be >=1 ")
+        x_values = [x_lim[0]]
+        y_values = [np.array(start_points, dtype=float)]
+        for _ in self._accepted_steps(start_points, step, x_lim):
+            if self._accepted % record_every == 0:
+                x_values.append(self._current_x)
+                y_values.append(self._current_y)
+        if x_values[-1] != self._current_x:
+            x_values.append(self._current_x)
+            y_values.append(self._current_y)
+        return np.array(x_values), np.array(y_values)
+
+    # pylint: disable=arguments-differ
+    def stream(self, start_points: list, step: float, x_lim: tuple = (0, 1),
+               chunk_size: int = 1024) -> typing.Iterator:
+        """Запуск метода с выдачей принятых точек блоками
+
+        Количество точек заранее неизвестно, поэтому прерванный расчёт
+        продолжается новым запуском из последней выданной точки.
+
+        :param start_points: начальные условия СДУ
+        :param step: начальный шаг
+        :param x_lim: диапазон сетки
+        :param chunk_size: количество точек в блоке
+        :return: генератор пар (массив значений x, массив значений y)
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size should be >=1")
+        x_values = [x_lim[0]]
+        y_values = [np.array(start_points, dtype=float)]
+        for _ in self._accepted_steps(start_points, step, x_lim):
+            if len(x_values) == chunk_size:
+                yield np.array(x_values), np.array(y_values)
+                x_values, y_values = [], []
+            x_values.append(self._current_x)
+            y_values.append(self._current_y)
+        x_values[-1] = self._current_x
+        yield np.array(x_values), np.array(y_values)
+
+    def dense(self, start_points: list, step: float,
+              x_lim: tuple = (0, 1)) -> DenseSolution:
+        """Запуск метода с плотным выводом решения
+
+        Значение правой части в начале принятого шага сохраняется шагом
+        метода в _node_slope, дополнительно правая часть вычисляется
+        только в итоговой точке.
+
+        :param start_points: начальные условия СДУ
+        :param step: начальный шаг
+        :param x_lim: диапазон сетки
+        :return: решение, вычисляемое в произвольных точках диапазона
+        """
+        x_values = [x_lim[0]]
+        y_values = [np.array(start_points, dtype=float)]
+        slopes = []
+        for _ in self._accepted_steps(start_points, step, x_lim):
+            slopes.append(self._node_slope)
+            x_values.append(self._current_x)
+            y_values.append(self._current_y)
+        x_values[-1] = self._current_x
+        slopes.append(self._rhs(self._current_x, self._current_y))
+        self._evaluations += 1
+        return DenseSolution(x_values, y_values, slopes)
+
+
+class DormandPrince(AdaptiveAlgorythm):
+    """Метод Дормана-Принса 5(4) с адаптивным выбором шага
+
+    На каждом шаге решение пятого порядка сравнивается со встроенным
+    решением четвёртого порядка, и шаг подбирается так, чтобы оценка
+    локальной ошибки не превышала atol + rtol * |y|. Последняя стадия
+    принятого шага совпадает с первой стадией следующего.
+
+    Методы:
+        run - запуск алгоритма, step задаёт начальный шаг
+        record - запуск алгоритма с записью принятых точек в массивы
+        stream - запуск алгоритма с выдачей принятых точек блоками
+        dense - запуск алгоритма с плотным выводом решения
+        statistics - статистика шагов последнего запуска
+    """
+    ERROR_ORDER = 5
+    NODES = (0., 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1., 1.)
+    MATRIX = (
+        (),
+        (1 / 5,),
+        (3 / 40, 9 / 40),
+        (44 / 45, -56 / 15, 32 / 9),
+        (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+        (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+        (35 / 384, 0., 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+    )
+    ERROR = (71 / 57600, 0., -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40)
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, functions: typing.Union[typing.Callable, tuple],
+                 rtol: float = 1e-6, atol: float = 1e-9,
+                 max_step: float = np.inf, safety: float = 0.9):
+        """Конструктор класса
+
+        :param functions: векторная функция f(x, y) или список функций,
+        образующих СДУ
+        :param rtol: относительная точность
+        :param atol: абсолютная точность
+        :param max_step: максимальный шаг
+        :param safety: коэффициент запаса при выборе шага
+        """
+        super().__init__(functions, rtol, atol, max_step, safety)
+        self._first_stage = None
+        self._start_stage = None
+        self._last_stage = None
+
+    def _step_function(self, func: typing.Callable) -> np.ndarray:
+        """Реализация множителя для метода Дормана-Принса
+
+        Кроме множителя пятого порядка сохраняет оценку локальной ошибки
+        и последнюю стадию для следующего шага.
+
+        :param func: векторная правая часть СДУ
+        :return: множитель
+        """
+        if self._first_stage is None:
+            self._first_stage = func(self._current_x, self._current_y)
+            self._start_stage = self._first_stage
+            self._evaluations += 1
+        stages = [self._first_stage]
+        for node, row in zip(self.NODES[1:], self.MATRIX[1:]):
+            temp_y = self._current_y + self._step * sum(
+                coef * stage for coef, stage in zip(row, stages) if coef)
+            stages.append(func(self._current_x + node * self._step, temp_y))
+        self._evaluations += 6
+        self._error = self._step * sum(coef * stage for coef, stage in zip(self.ERROR, stages)
+                                       if coef)
+        self._last_stage = stages[-1]
+        return sum(coef * stage for coef, stage in zip(self.MATRIX[-1], stages) if coef)
+
+    def _reset(self):
+        """Сброс состояния перед запуском"""
+        super()._reset()
+        self._first_stage = None
+
+    def _accept(self):
+        """Последняя стадия принятого шага становится первой стадией следующего"""
+        self._first_stage = self._last_stage
+
+    def dense(self, start_points: list, step: float,
+              x_lim: tuple = (0, 1)) -> DenseSolution:
+        """Запуск метода с плотным выводом решения
+
+        Значения правой части в узлах берутся из последней стадии
+        принятых шагов и не требуют дополнительных вычислений.
+
+        :param start_points: начальные условия СДУ
+        :param step: начальный шаг
+        :param x_lim: диапазон сетки
+        :return: решение, вычисляемое в произвольных точках диапазона
+        """
+        x_values = [x_lim[0]]
+        y_values = [np.array(start_points, dtype=float)]
+        slopes = []
+        for _ in self._accepted_steps(start_points, step, x_lim):
+            if not slopes:
+                slopes.append(self._start_stage)
+            x_values.append(self._current_x)
+            y_values.append(self._current_y)
+            slopes.append(self._first_stage)
+        x_values[-1] = self._current_x
+        return DenseSolution(x_values, y_values, slopes)
+
+
+def trajectory(algorythm: BaseAlgorythm, params: list) -> tuple:
+    """Вычисление всех точек траектории
+
+    :param algorythm: алгоритм
+    :param params: список параметров
+    :return: массив значений x и массив значений y, объединённые в кортеж
+    """
+    return algorythm.record(*params)
+
+
+def results_figure(algorythm: BaseAlgorythm, params: list, path: str) -> Figure:
+    """Описание графика с результатами работы алгоритма
 
     :param algorythm: алгоритм
     :param params: список параметров
     :param path: путь для сохранения
+    :return: описание графика
     """
-    x_values = []
-    y_values = []
+    x_values, y_values = trajectory(algorythm, params)
+    return Figure(path, (Curve(x_values, y_values[:, 0], "ro", "y1"),
+                         Curve(x_values, y_values[:, 1], "g*", "y2")))
 
-    def action(current_x, current_y):
-        """Сохранение результатов итерации"""
-        x_values.append(current_x)
-        y_values.append(current_y)
 
-    res = algorythm.run(*params, action=action)
-    x_values.append(res[0])
-    y_values.append(res[1])
-    y_values = np.array(y_values)
+# pylint: disable=no-member, import-outside-toplevel
+def plot_results(algorythm: BaseAlgorythm, params: list, path: str = "",
+                 show: bool = True):
+    """Отрисовка результатов работы алгоритма
+
+    :param algorythm: алгоритм
+    :param params: список параметров
+    :param path: путь для сохранения
+    :param show: показывать ли окно с графиком
+    """
+    import matplotlib.pyplot as plt
+
+    x_values, y_values = trajectory(algorythm, params)
 
     plt.plot(x_values, y_values[:, 0], "ro")
     plt.plot(x_values, y_values[:, 1], "g*")
     plt.legend(["y1", "y2"])
     if path:
         plt.savefig(path)
-    plt.show()
+    if show:
+        plt.show()
 
 
 def main():
-    """Основная функция, запускающая алгоритмы"""
+    """Основная функция, запускающая алгоритмы и сохраняющая графики"""
     start_points = (0, 0.5)
-    functions = (func1, func2)
-    params = [start_points, 0.1, (0, 3)]
-    plot_results(Euler(functions), params, path="../graphics/euler_0.1.jpg")
-    params[1] = 0.05
-    plot_results(Euler(functions), params, path="../graphics/euler_0.05.jpg")
-    params[1] = 0.1
-    plot_results(RungeKutta(functions), params,
-                 path="../graphics/runge_0.1.jpg")
-    params[1] = 0.05
-    plot_results(RungeKutta(functions), params,
-                 path="../graphics/runge_0.05.jpg")
+    figures = []
+    for algorythm, name in ((Euler, "euler"), (RungeKutta, "runge")):
+        for step in (0.1, 0.05):
+            params = [start_points, step, (0, 3)]
+            figures.append(results_figure(algorythm(system), params,
+                                          f"../graphics/{name}_{step}.jpg"))
+    render(figures)
 
 
 if __name__ == "__main__":
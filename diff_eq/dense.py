@@ -0,0 +1,69 @@
+"""
+Плотный вывод решения СДУ
+
+Для каждого принятого шага сохраняются значения решения и правой части
+на его концах, между узлами решение восстанавливается кубическим
+интерполянтом Эрмита. Это позволяет делать крупные шаги и получать
+значения решения в произвольных точках диапазона.
+
+Классы:
+    DenseSolution - решение СДУ, вычисляемое в произвольных точках
+"""
+import numpy as np
+
+
+class DenseSolution:
+    """Решение СДУ, вычисляемое в произвольных точках диапазона
+
+    Поля:
+        x_values: numpy.ndarray - узлы сетки
+        y_values: numpy.ndarray - значения решения в узлах
+        slopes: numpy.ndarray - значения правой части в узлах
+        x_lim: tuple - диапазон решения
+    """
+    def __init__(self, x_values: np.ndarray, y_values: np.ndarray, slopes: np.ndarray):
+        """Конструктор класса
+
+        :param x_values: возрастающие узлы сетки
+        :param y_values: значения решения в узлах
+        :param slopes: значения правой части в узлах
+        """
+        self.x_values = np.asarray(x_values, dtype=float)
+        self.y_values = np.asarray(y_values, dtype=float)
+        self.slopes = np.asarray(slopes, dtype=float)
+        if self.x_values.ndim != 1 or self.x_values.size < 2:
+            raise ValueError("x_values should contain at least two nodes")
+        if np.any(np.diff(self.x_values) <= 0):
+            raise ValueError("x_values should be strictly increasing")
+        if self.y_values.shape != self.slopes.shape or \
+                self.y_values.shape[0] != self.x_values.size:
+            raise ValueError("y_values and slopes should have one row per node")
+
+    @property
+    def x_lim(self) -> tuple:
+        """Диапазон решения"""
+        return float(self.x_values[0]), float(self.x_values[-1])
+
+    def __call__(self, x_query) -> np.ndarray:
+        """Вычисление решения в произвольных точках диапазона
+
+        :param x_query: одно значение или массив значений x
+        :return: значения решения, по строке на каждое значение x
+        """
+        x_query = np.asarray(x_query, dtype=float)
+        low, high = self.x_lim
+        if np.any((x_query < low) | (x_query > high)):
+            raise ValueError(f"x_query should lie within x_lim={self.x_lim}")
+        index = np.clip(np.searchsorted(self.x_values, x_query, "right") - 1,
+                        0, self.x_values.size - 2)
+        width = self.x_values[index + 1] - self.x_values[index]
+        share = (x_query - self.x_values[index]) / width
+        extra_axes = (Ellipsis,) + (None,) * (self.y_values.ndim - 1)
+        share = share[extra_axes]
+        width = width[extra_axes]
+        share2 = share * share
+        share3 = share2 * share
+        return ((2 * share3 - 3 * share2 + 1) * self.y_values[index]
+                + (share3 - 2 * share2 + share) * width * self.slopes[index]
+                + (3 * share2 - 2 * share3) * self.y_values[index + 1]
+                + (share3 - share2) * width * self.slopes[index + 1])
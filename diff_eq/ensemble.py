@@ -0,0 +1,132 @@
+"""
+Решение СДУ сразу для множества начальных условий и параметров
+
+Состояние ансамбля хранится в массиве формы (число членов, размерность),
+поэтому векторная правая часть f(x, y), работающая по последней оси,
+продвигает все члены ансамбля одной операцией над массивом. Члены с
+разным шагом сетки группируются по шагу, большие ансамбли можно
+разделить между процессами. Для этого правая часть и параметры должны
+передаваться в другой процесс через pickle, то есть правая часть должна
+быть функцией уровня модуля, а не lambda или вложенной функцией.
+
+Классы:
+    BoundSystem - правая часть с параметрами, закреплёнными за членами ансамбля
+
+Функции:
+    run_ensemble - решение СДУ для ансамбля начальных условий
+"""
+import functools
+import pickle
+import typing
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from diff_eq.algorythm import BaseAlgorythm
+
+
+# pylint: disable=too-few-public-methods
+class BoundSystem:
+    """Правая часть f(x, y, params) с закреплёнными параметрами членов ансамбля
+
+    Поля:
+        function: typing.Callable - векторная функция f(x, y, params)
+        params: numpy.ndarray - параметры членов ансамбля
+    """
+    def __init__(self, function: typing.Callable, params: np.ndarray):
+        """Конструктор класса
+
+        :param function: векторная функция f(x, y, params)
+        :param params: параметры членов ансамбля, по строке на член
+        """
+        self.function = function
+        self.params = params
+
+    def __call__(self, x_value: float, y_vector: np.ndarray) -> np.ndarray:
+        """Вычисление правой части для всех членов ансамбля
+
+        :param x_value: значение x
+        :param y_vector: состояния членов ансамбля
+        :return: значения правой части
+        """
+        return self.function(x_value, y_vector, self.params)
+
+
+# pylint: disable=too-many-arguments
+def _run_members(algorythm: type, function: typing.Callable, start_points: np.ndarray,
+                 step: float, x_lim: tuple, *, params: np.ndarray = None) -> tuple:
+    """Решение СДУ для части ансамбля с общим шагом
+
+    :param algorythm: класс алгоритма
+    :param function: векторная правая часть
+    :param start_points: начальные условия членов ансамбля
+    :param step: шаг сетки
+    :param x_lim: диапазон сетки
+    :param params: параметры членов ансамбля или None
+    :return: итоговое значение x и итоговые состояния членов ансамбля
+    """
+    if params is not None:
+        function = BoundSystem(function, params)
+    return algorythm(function).run(start_points, step, x_lim)
+
+
+# pylint: disable=too-many-locals
+def run_ensemble(algorythm: type, function: typing.Callable, start_points: np.ndarray,
+                 step: typing.Union[float, np.ndarray], x_lim: tuple = (0, 1), *,
+                 params: np.ndarray = None, processes: int = 1) -> tuple:
+    """Решение СДУ для ансамбля начальных условий
+
+    :param algorythm: класс алгоритма, наследник BaseAlgorythm
+    :param function: векторная правая часть f(x, y) или f(x, y, params),
+    работающая по последней оси массива y
+    :param start_points: начальные условия формы (число членов, размерность)
+    :param step: общий шаг сетки или массив шагов членов ансамбля
+    :param x_lim: диапазон сетки
+    :param params: параметры членов ансамбля, по строке на член
+    :param processes: количество процессов, 1 - без пула; при processes > 1
+    правая часть должна передаваться через pickle (функция уровня модуля)
+    :return: массив итоговых x и массив итоговых состояний членов ансамбля,
+    объединённые в кортеж
+    """
+    if not issubclass(algorythm, BaseAlgorythm):
+        raise TypeError("algorythm should be a BaseAlgorythm subclass")
+    if not callable(function):
+        raise TypeError("ensemble requires a vectorized right-hand side")
+    start_points = np.asarray(start_points, dtype=float)
+    if start_points.ndim != 2:
+        raise ValueError("start_points should have shape (members, dimension)")
+    members = start_points.shape[0]
+    steps = np.broadcast_to(np.asarray(step, dtype=float), (members,))
+    if params is not None:
+        params = np.asarray(params)
+        if params.shape[0] != members:
+            raise ValueError("params should have one row per member")
+
+    tasks = []
+    for value in np.unique(steps):
+        group = np.flatnonzero(steps == value)
+        for part in np.array_split(group, max(processes, 1)):
+            if part.size:
+                tasks.append((part, float(value)))
+
+    def job(part, value):
+        """Решение для части ансамбля с закреплёнными аргументами"""
+        return functools.partial(_run_members, algorythm, function, start_points[part],
+                                 value, x_lim,
+                                 params=None if params is None else params[part])
+
+    x_result = np.empty(members)
+    y_result = np.empty_like(start_points)
+    if processes > 1 and len(tasks) > 1:
+        try:
+            pickle.dumps(function)
+        except (pickle.PicklingError, AttributeError, TypeError) as error:
+            raise TypeError("processes > 1 requires a picklable right-hand side, "
+                            "define it at module level") from error
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [executor.submit(job(*task)) for task in tasks]
+            results = [future.result() for future in futures]
+    else:
+        results = [job(*task)() for task in tasks]
+    for (part, _), (x_value, y_value) in zip(tasks, results):
+        x_result[part] = x_value
+        y_result[part] = y_value
+    return x_result, y_result
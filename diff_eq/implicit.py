@@ -0,0 +1,422 @@
+"""
+Неявный метод решения жёстких СДУ
+
+Метод Розенброка ROS2 является W-методом: второй порядок сохраняется
+при любом приближении матрицы Якоби, поэтому матрица Якоби и разложение
+матрицы W = I - gamma * h * J переиспользуются на многих шагах. Матрица
+Якоби пересчитывается только после отклонения шага, а разложение - при
+изменении шага, причём небольшое увеличение шага откладывается.
+
+Матрица Якоби задаётся аналитически или вычисляется конечными разностями.
+Для ленточной матрицы столбцы, не пересекающиеся по строкам, возмущаются
+одновременно, и на вычисление уходит lower + upper + 1 вычислений правой
+части вместо n. Небольшие системы решаются через обратную матрицу,
+большие ленточные - ленточным LU-разложением.
+
+Классы:
+    ImplicitStatistics - статистика шагов неявного метода
+    DenseFactor - разложение плотной матрицы
+    BandFactor - LU-разложение ленточной матрицы
+    Rosenbrock - класс, реализующий метод Розенброка ROS2
+
+Функции:
+    to_band - ленточное представление матрицы
+    from_band - плотная матрица по ленточному представлению
+    numeric_jacobian - конечно-разностная матрица Якоби
+"""
+import typing
+import numpy as np
+from diff_eq.algorythm import AdaptiveAlgorythm
+
+
+class ImplicitStatistics(typing.NamedTuple):
+    """Статистика шагов неявного метода
+
+    Поля:
+        accepted: int - количество принятых шагов
+        rejected: int - количество отклонённых шагов
+        evaluations: int - количество вычислений правой части
+        jacobians: int - количество вычислений матрицы Якоби
+        factorizations: int - количество разложений матрицы W
+    """
+    accepted: int
+    rejected: int
+    evaluations: int
+    jacobians: int
+    factorizations: int
+
+
+def to_band(matrix: np.ndarray, lower: int, upper: int) -> np.ndarray:
+    """Ленточное представление матрицы
+
+    Элемент A[i, j] хранится в band[i, j - i + lower], элементы
+    за пределами матрицы равны нулю.
+
+    :param matrix: квадратная матрица
+    :param lower: количество поддиагоналей
+    :param upper: количество наддиагоналей
+    :return: массив формы (n, lower + upper + 1)
+    """
+    size = matrix.shape[0]
+    rows = np.arange(size)[:, None]
+    cols = rows + np.arange(-lower, upper + 1)
+    inside = (cols >= 0) & (cols < size)
+    return np.where(inside, matrix[rows, np.clip(cols, 0, size - 1)], 0.)
+
+
+def from_band(band: np.ndarray, lower: int) -> np.ndarray:
+    """Плотная матрица по ленточному представлению
+
+    :param band: ленточное представление формы (n, lower + upper + 1)
+    :param lower: количество поддиагоналей
+    :return: квадратная матрица
+    """
+    size = band.shape[0]
+    matrix = np.zeros((size, size))
+    rows = np.arange(size)[:, None]
+    cols = rows + np.arange(band.shape[1]) - lower
+    inside = (cols >= 0) & (cols < size)
+    matrix[np.broadcast_to(rows, cols.shape)[inside], cols[inside]] = band[inside]
+    return matrix
+
+
+def _column_groups(size: int, lower: int, upper: int) -> typing.Iterator:
+    """Группы столбцов ленточной матрицы, возмущаемых одновременно
+
+    В одну группу входят столбцы с одинаковым остатком от деления
+    на ширину ленты, их ненулевые элементы лежат в разных строках.
+
+    :param size: размерность матрицы
+    :param lower: количество поддиагоналей
+    :param upper: количество наддиагоналей
+    :return: генератор кортежей (столбцы группы, строки ненулевых
+    элементов, столбцы ненулевых элементов)
+    """
+    width = min(lower + upper + 1, size)
+    for group in range(width):
+        cols = np.arange(group, size, width)
+        rows = cols[:, None] + np.arange(-upper, lower + 1)
+        inside = (rows >= 0) & (rows < size)
+        yield cols, rows[inside], np.broadcast_to(cols[:, None], inside.shape)[inside]
+
+
+def _perturb(func: typing.Callable, x_value: float, y_vector: np.ndarray,
+             f_flat: np.ndarray, cols: np.ndarray) -> tuple:
+    """Изменение правой части при возмущении группы столбцов
+
+    :param func: векторная правая часть f(x, y)
+    :param x_value: значение x
+    :param y_vector: вектор значений y
+    :param f_flat: значение f(x, y), вытянутое в вектор
+    :param cols: номера возмущаемых компонент y
+    :return: изменение правой части и вектор приращений y
+    """
+    y_flat = y_vector.ravel()
+    shifted = y_flat.copy()
+    shifted[cols] += np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(y_flat[cols]), 1.)
+    change = np.asarray(func(x_value, shifted.reshape(y_vector.shape)), dtype=float).ravel()
+    return change - f_flat, shifted - y_flat
+
+
+# pylint: disable=too-many-arguments
+def numeric_jacobian(func: typing.Callable, x_value: float, y_vector: np.ndarray,
+                     f_value: np.ndarray = None, bandwidth: tuple = None) -> np.ndarray:
+    """Конечно-разностная матрица Якоби правой части по y
+
+    Для ленточной матрицы возмущаются сразу все столбцы с одинаковым
+    остатком от деления на ширину ленты.
+
+    :param func: векторная правая часть f(x, y)
+    :param x_value: значение x
+    :param y_vector: вектор значений y
+    :param f_value: значение f(x, y), если уже вычислено
+    :param bandwidth: количество поддиагоналей и наддиагоналей или None
+    :return: матрица формы (n, n) или ленточное представление,
+    если задан bandwidth
+    """
+    y_vector = np.asarray(y_vector, dtype=float)
+    size = y_vector.size
+    if f_value is None:
+        f_value = func(x_value, y_vector)
+    f_flat = np.asarray(f_value, dtype=float).ravel()
+    lower, upper = bandwidth if bandwidth is not None else (size - 1, size - 1)
+    result = np.zeros((size, lower + upper + 1) if bandwidth is not None else (size, size))
+    for cols, rows, entry_cols in _column_groups(size, lower, upper):
+        change, step = _perturb(func, x_value, y_vector, f_flat, cols)
+        if bandwidth is not None:
+            result[rows, entry_cols - rows + lower] = change[rows] / step[entry_cols]
+        else:
+            result[rows, entry_cols] = change[rows] / step[entry_cols]
+    return result
+
+
+# pylint: disable=too-few-public-methods
+class DenseFactor:
+    """Разложение плотной матрицы
+
+    Небольшая матрица обращается один раз, после чего каждое решение
+    системы сводится к умножению на обратную матрицу.
+
+    Поля:
+        inverse: numpy.ndarray - обратная матрица
+    """
+    def __init__(self, matrix: np.ndarray):
+        """Конструктор класса
+
+        :param matrix: квадратная матрица
+        """
+        self.inverse = np.linalg.inv(matrix)
+
+    def solve(self, rhs: np.ndarray) -> np.ndarray:
+        """Решение системы с разложенной матрицей
+
+        :param rhs: правая часть
+        :return: решение
+        """
+        return self.inverse @ rhs
+
+
+class BandFactor:
+    """LU-разложение ленточной матрицы без выбора ведущего элемента
+
+    Матрица W = I - gamma * h * J для диссипативных систем имеет
+    преобладающую диагональ, поэтому выбор ведущего элемента не нужен,
+    а множители L и строки U остаются внутри ленты.
+
+    Поля:
+        band: numpy.ndarray - ленточное представление U
+        multipliers: numpy.ndarray - множители L под диагональю
+        lower: int - количество поддиагоналей
+        upper: int - количество наддиагоналей
+    """
+    def __init__(self, band: np.ndarray, lower: int, upper: int):
+        """Конструктор класса
+
+        :param band: ленточное представление матрицы
+        :param lower: количество поддиагоналей
+        :param upper: количество наддиагоналей
+        """
+        band = np.array(band, dtype=float)
+        size = band.shape[0]
+        multipliers = np.zeros((size, lower))
+        offsets = np.arange(1, lower + 1)
+        for index in range(size):
+            pivot = band[index, lower]
+            if pivot == 0:
+                raise np.linalg.LinAlgError(f"zero pivot in row {index}")
+            count = min(lower, size - 1 - index)
+            if count:
+                below = offsets[:count]
+                factors = band[index + below, lower - below] / pivot
+                multipliers[index, :count] = factors
+                band[index + below[:, None], lower - below[:, None] + np.arange(upper + 1)] -= \
+                    factors[:, None] * band[index, lower:]
+        self.band = band
+        self.multipliers = multipliers
+        self.lower = lower
+        self.upper = upper
+
+    def solve(self, rhs: np.ndarray) -> np.ndarray:
+        """Решение системы с разложенной матрицей
+
+        :param rhs: правая часть
+        :return: решение
+        """
+        result = np.array(rhs, dtype=float)
+        size = result.size
+        for index in range(size - 1):
+            count = min(self.lower, size - 1 - index)
+            result[index + 1:index + 1 + count] -= self.multipliers[index, :count] * result[index]
+        for index in range(size - 1, -1, -1):
+            count = min(self.upper, size - 1 - index)
+            result[index] = (result[index] - self.band[index, self.lower + 1:
+                                                       self.lower + 1 + count]
+                             @ result[index + 1:index + 1 + count]) / self.band[index, self.lower]
+        return result
+
+
+# pylint: disable=too-many-instance-attributes
+class Rosenbrock(AdaptiveAlgorythm):
+    """Метод Розенброка ROS2 для жёстких СДУ с адаптивным выбором шага
+
+    Шаг метода:
+        W k1 = f(x, y) + gamma h f_x
+        W k2 = f(x + h, y + h k1) - gamma h f_x - 2 k1
+        y_new = y + h (3 k1 + k2) / 2,
+    где W = I - gamma * h * J, gamma = 1 + 1 / sqrt(2), f_x - производная
+    правой части по x. Ошибка оценивается сравнением с линейно-неявным
+    методом Эйлера y + h k1.
+
+    Матрица Якоби переиспользуется на нескольких шагах и пересчитывается
+    после отклонения шага, при уменьшении шага более чем в 1 / REFRESH_FACTOR
+    раз и через JACOBIAN_AGE принятых шагов.
+
+    Методы:
+        run - запуск алгоритма, step задаёт начальный шаг
+        record - запуск алгоритма с записью принятых точек в массивы
+        stream - запуск алгоритма с выдачей принятых точек блоками
+        dense - запуск алгоритма с плотным выводом решения
+        statistics - статистика шагов последнего запуска
+    """
+    ERROR_ORDER = 2
+    GAMMA = 1 + 1 / np.sqrt(2)
+    STEP_HOLD = 1.2
+    REFRESH_FACTOR = 0.5
+    JACOBIAN_AGE = 50
+    DENSE_LIMIT = 64
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, functions: typing.Union[typing.Callable, tuple],
+                 rtol: float = 1e-4, atol: float = 1e-7,
+                 max_step: float = np.inf, safety: float = 0.9, *,
+                 jacobian: typing.Callable = None, bandwidth: tuple = None,
+                 autonomous: bool = False):
+        """Конструктор класса
+
+        :param functions: векторная функция f(x, y) или список функций,
+        образующих СДУ
+        :param rtol: относительная точность
+        :param atol: абсолютная точность
+        :param max_step: максимальный шаг
+        :param safety: коэффициент запаса при выборе шага
+        :param jacobian: аналитическая матрица Якоби J(x, y) формы (n, n)
+        или None для конечно-разностного вычисления
+        :param bandwidth: количество поддиагоналей и наддиагоналей
+        ленточной матрицы Якоби или None для плотной матрицы
+        :param autonomous: не зависит ли правая часть от x явно,
+        для автономной системы производная по x не вычисляется
+        """
+        super().__init__(functions, rtol, atol, max_step, safety)
+        if bandwidth is not None and min(bandwidth) < 0:
+            raise ValueError("bandwidth should be non-negative")
+        self.jacobian = jacobian
+        self.bandwidth = bandwidth
+        self.autonomous = autonomous
+        self._slope = None
+        self._jacobian = None
+        self._time_derivative = None
+        self._age = 0
+        self._factor = None
+        self._factor_step = None
+        self._jacobians = 0
+        self._factorizations = 0
+
+    def statistics(self) -> ImplicitStatistics:
+        """Статистика шагов последнего запуска
+
+        :return: статистика в виде ImplicitStatistics
+        """
+        return ImplicitStatistics(self._accepted, self._rejected, self._evaluations,
+                                  self._jacobians, self._factorizations)
+
+    def _banded(self, size: int) -> bool:
+        """Используется ли ленточное разложение
+
+        :param size: размерность системы
+        :return: True для больших систем с заданной шириной ленты
+        """
+        return self.bandwidth is not None and size > self.DENSE_LIMIT
+
+    def _compute_jacobian(self, func: typing.Callable) -> np.ndarray:
+        """Матрица Якоби в текущей точке
+
+        :param func: векторная правая часть СДУ
+        :return: плотная матрица или ленточное представление
+        """
+        size = self._current_y.size
+        if self.jacobian is not None:
+            matrix = np.asarray(self.jacobian(self._current_x, self._current_y), dtype=float)
+            return to_band(matrix, *self.bandwidth) if self._banded(size) else matrix
+        result = numeric_jacobian(func, self._current_x, self._current_y,
+                                  self._slope, self.bandwidth)
+        if self.bandwidth is None:
+            self._evaluations += size
+        else:
+            self._evaluations += min(sum(self.bandwidth) + 1, size)
+            if not self._banded(size):
+                result = from_band(result, self.bandwidth[0])
+        return result
+
+    def _factorize(self) -> typing.Union[DenseFactor, BandFactor]:
+        """Разложение матрицы W = I - gamma * h * J
+
+        :return: разложение
+        """
+        scaled = -self.GAMMA * self._step * self._jacobian
+        if self._banded(self._current_y.size):
+            scaled[:, self.bandwidth[0]] += 1.
+            return BandFactor(scaled, *self.bandwidth)
+        scaled[np.diag_indices_from(scaled)] += 1.
+        return DenseFactor(scaled)
+
+    def _step_function(self, func: typing.Callable) -> np.ndarray:
+        """Реализация множителя для метода Розенброка
+
+        Значение правой части, матрица Якоби и разложение сохраняются
+        и переиспользуются, пока остаются действительными.
+
+        :param func: векторная правая часть СДУ
+        :return: множитель
+        """
+        shape = self._current_y.shape
+        if self._slope is None:
+            self._slope = func(self._current_x, self._current_y)
+            self._node_slope = self._slope
+            self._evaluations += 1
+            if self.autonomous:
+                self._time_derivative = 0.
+            else:
+                delta = np.sqrt(np.finfo(float).eps) * max(abs(self._current_x), 1.)
+                self._time_derivative = (func(self._current_x + delta, self._current_y)
+                                         - self._slope) / delta
+                self._evaluations += 1
+        if self._jacobian is None:
+            self._jacobian = self._compute_jacobian(func)
+            self._jacobians += 1
+            self._age = 0
+            self._factor = None
+        if self._factor is None or self._factor_step != self._step:
+            self._factor = self._factorize()
+            self._factor_step = self._step
+            self._factorizations += 1
+        correction = self.GAMMA * self._step * self._time_derivative
+        stage_1 = self._factor.solve(np.ravel(self._slope + correction)).reshape(shape)
+        value = func(self._current_x + self._step, self._current_y + self._step * stage_1)
+        self._evaluations += 1
+        stage_2 = self._factor.solve(np.ravel(value - correction - 2 * stage_1)).reshape(shape)
+        self._error = self._step * (stage_1 + stage_2) / 2
+        return (3 * stage_1 + stage_2) / 2
+
+    def _reset(self):
+        """Сброс состояния перед запуском"""
+        super()._reset()
+        self._slope = None
+        self._jacobian = None
+        self._factor = None
+        self._jacobians = self._factorizations = 0
+
+    def _accept(self):
+        """Переход в новую точку, матрица Якоби становится устаревшей"""
+        self._slope = None
+        self._age += 1
+
+    def _reject(self):
+        """Пересчёт устаревшей матрицы Якоби после отклонения шага"""
+        if self._age:
+            self._jacobian = None
+
+    def _next_step(self, factor: float) -> float:
+        """Следующий шаг, небольшое увеличение откладывается ради
+        переиспользования разложения
+
+        Устаревшая матрица Якоби пересчитывается, если шаг сильно
+        уменьшается или матрица используется слишком долго.
+
+        :param factor: рекомендуемый коэффициент изменения шага
+        :return: следующий шаг
+        """
+        if self._age and (factor < self.REFRESH_FACTOR or self._age >= self.JACOBIAN_AGE):
+            self._jacobian = None
+        if 1 <= factor <= self.STEP_HOLD:
+            factor = 1.
+        return super()._next_step(factor)
@@ -0,0 +1,105 @@
+"""
+Тестирование плотного вывода решения СДУ
+
+Функции:
+    exact_system - точное решение векторной системы ДУ
+    test_dense - тестирование точности плотного вывода
+    test_dense_cost - тестирование количества вычислений правой части
+    test_dense_fixed_cost - тестирование количества вычислений правой части
+    методов с постоянным шагом
+    test_dense_nodes - тестирование значений в узлах сетки
+    test_dense_bad - тестирование обработки некорректных параметров
+"""
+import pytest
+import numpy as np
+from diff_eq.algorythm import system, Euler, RungeKutta, DormandPrince
+from diff_eq.dense import DenseSolution
+
+
+def exact_system(x_val):
+    """Точное решение векторной системы ДУ при y(0) = (0, 0.5)
+
+    :param x_val: значение или массив значений x
+    :return: значения решения, по строке на каждое значение x
+    """
+    x_val = np.asarray(x_val, dtype=float)
+    decay = np.exp(-0.8 * x_val)
+    return np.stack([0.4875 * x_val + 0.015625 * (1 - decay),
+                     0.5 + 0.0125 * (decay - 1)], axis=-1)
+
+
+@pytest.mark.parametrize(("algorythm", "step", "acc"), [
+    (DormandPrince(system, rtol=1e-8, atol=1e-10), 0.1, 1e-6),
+    (RungeKutta(system), 0.5, 1e-5),
+    (Euler(system), 0.01, 1e-2)
+])
+def test_dense(algorythm, step: float, acc: float):
+    """Тестирование точности плотного вывода в произвольных точках
+
+    :param algorythm: алгоритм
+    :param step: шаг сетки
+    :param acc: точность
+    """
+    solution = algorythm.dense((0, 0.5), step, (0, 30))
+    x_query = np.random.default_rng(0).uniform(0, 30, 500)
+    values = solution(x_query)
+    assert values.shape == (500, 2)
+    assert np.abs(values - exact_system(x_query)).max() < acc
+    assert solution(3.0) == pytest.approx(exact_system(3.0), abs=acc)
+    assert solution.x_lim == (0, 30)
+
+
+def test_dense_cost():
+    """Тестирование количества вычислений правой части адаптивного метода"""
+    algorythm = DormandPrince(system, rtol=1e-8, atol=1e-10)
+    algorythm.run((0, 0.5), 0.1, (0, 30))
+    evaluations = algorythm.statistics().evaluations
+    solution = algorythm.dense((0, 0.5), 0.1, (0, 30))
+    assert algorythm.statistics().evaluations == evaluations
+    assert solution.x_values.size == algorythm.statistics().accepted + 1
+    assert solution.slopes[1:] == pytest.approx(
+        np.array([system(x_val, y_val) for x_val, y_val
+                  in zip(solution.x_values[1:], solution.y_values[1:])]))
+
+
+@pytest.mark.parametrize(("algorythm", "stages"), [(RungeKutta, 4), (Euler, 1)])
+def test_dense_fixed_cost(algorythm, stages: int):
+    """Тестирование количества вычислений правой части методов с постоянным шагом
+
+    :param algorythm: алгоритм
+    :param stages: количество вычислений правой части на шаг
+    """
+    calls = []
+
+    def counted(x_val, y_val):
+        calls.append(x_val)
+        return system(x_val, y_val)
+
+    solution = algorythm(counted).dense((0, 0.5), 0.25, (0, 5))
+    assert len(calls) == 20 * stages + 1
+    assert solution.slopes == pytest.approx(
+        np.array([system(x_val, y_val) for x_val, y_val
+                  in zip(solution.x_values, solution.y_values)]))
+
+
+def test_dense_nodes():
+    """Тестирование совпадения плотного вывода с решением в узлах"""
+    x_values, y_values = RungeKutta(system).record((0, 0.5), 0.25, (0, 5))
+    solution = RungeKutta(system).dense((0, 0.5), 0.25, (0, 5))
+    assert np.array_equal(solution.x_values, x_values)
+    assert np.allclose(solution(x_values), y_values, rtol=0, atol=1e-15)
+
+
+def test_dense_bad():
+    """Тестирование обработки некорректных параметров"""
+    solution = RungeKutta(system).dense((0, 0.5), 0.5, (0, 5))
+    with pytest.raises(ValueError):
+        solution(5.5)
+    with pytest.raises(ValueError):
+        solution([-1, 1])
+    with pytest.raises(ValueError):
+        DenseSolution([0], [[0]], [[0]])
+    with pytest.raises(ValueError):
+        DenseSolution([0, 1, 1], np.zeros((3, 2)), np.zeros((3, 2)))
+    with pytest.raises(ValueError):
+        DenseSolution([0, 1], np.zeros((2, 2)), np.zeros((2, 3)))
@@ -4,9 +4,20 @@
 Функции:
     test_func - тестирование СДУ
     test_algorythm - тестирование алгоритмов
+    test_system - тестирование векторной формы СДУ
+    test_vector_rhs - тестирование векторной правой части
+    test_large_system - тестирование системы большой размерности
+    test_step_count - тестирование количества шагов
+    test_record - тестирование записи траектории в массивы
+    test_record_bad - тестирование обработки некорректных параметров записи
+    test_dormand_prince - тестирование адаптивного метода
+    test_dormand_prince_cost - тестирование количества вычислений правой части
+    test_dormand_prince_steps - тестирование выбора шага адаптивного метода
 """
 import pytest
-from diff_eq.algorythm import func1, func2, Euler, RungeKutta
+import numpy as np
+from diff_eq.algorythm import func1, func2, system, Euler, RungeKutta, \
+    DormandPrince
 
 
 @pytest.mark.parametrize(
@@ -62,3 +73,166 @@ def test_algorythm(algorythm, params, functions, expected, acc):
 
     assert x_res == pytest.approx(expected[0], abs=acc)
     assert y_res == pytest.approx(expected[1], abs=acc)
+
+
+@pytest.mark.parametrize(
+    ("x_val", "y_val"), [
+        (0, [5, 3]),
+        (1.5, [-1, 2]),
+        (0.3, [[1, 2], [3, 4], [5, 6]])
+    ]
+)
+def test_system(x_val, y_val):
+    """Тестирование векторной формы СДУ
+
+    :param x_val: значение x
+    :param y_val: вектор или массив векторов y
+    """
+    result = system(x_val, np.array(y_val, dtype=float))
+    for y_row, value in zip(np.reshape(y_val, (-1, 2)), np.reshape(result, (-1, 2))):
+        assert value.tolist() == pytest.approx([func1(x_val, y_row), func2(x_val, y_row)])
+
+
+@pytest.mark.parametrize("algorythm", [Euler, RungeKutta])
+def test_vector_rhs(algorythm):
+    """Тестирование совпадения векторной правой части со списком функций
+
+    :param algorythm: алгоритм
+    """
+    params = [(0, 0.5), 0.1, (0, 3)]
+    x_vector, y_vector = algorythm(system).run(*params)
+    x_scalar, y_scalar = algorythm((func1, func2)).run(*params)
+    assert x_vector == pytest.approx(x_scalar)
+    assert y_vector == pytest.approx(y_scalar)
+
+
+def test_large_system():
+    """Тестирование системы y_i' = -k_i * y_i размерности 1000"""
+    rates = np.linspace(0.1, 2, 1000)
+
+    def decay(_, y_vector):
+        """Векторная правая часть"""
+        return -rates * y_vector
+
+    _, result = RungeKutta(decay).run(np.ones(1000), 0.01, (0, 1))
+    assert result == pytest.approx(np.exp(-rates), rel=1e-7)
+
+
+@pytest.mark.parametrize(
+    ("step", "x_lim", "expected"), [
+        (0.1, (0, 3), 30),
+        (0.01, (0, 1), 100),
+        (0.3, (0, 1), 4),
+        (0.05, (0.1, 0.3), 4),
+        (1, (0, 0), 0)
+    ]
+)
+def test_step_count(step, x_lim, expected):
+    """Тестирование количества шагов без накопления ошибки округления
+
+    :param step: шаг сетки
+    :param x_lim: диапазон сетки
+    :param expected: ожидаемое количество шагов
+    """
+    calls = []
+    result = Euler(system).run((0, 0.5), step, x_lim,
+                               action=lambda x_val, _: calls.append(x_val))
+    assert len(calls) == expected
+    assert result[0] == pytest.approx(x_lim[0] + expected * step)
+
+
+@pytest.mark.parametrize(
+    ("algorythm", "record_every"), [
+        (Euler, 1),
+        (RungeKutta, 1),
+        (RungeKutta, 4),
+        (Euler, 7)
+    ]
+)
+def test_record(algorythm, record_every):
+    """Тестирование совпадения записанной траектории с action
+
+    :param algorythm: алгоритм
+    :param record_every: шаг прореживания записи
+    """
+    x_res = []
+    y_res = []
+
+    def steps_check(x_val, y_val):
+        """Сохранение промежуточных данных"""
+        x_res.append(x_val)
+        y_res.append(y_val)
+
+    params = [(0, 0.5), 0.1, (0, 3)]
+    res = algorythm(system).run(*params, action=steps_check)
+    x_res.append(res[0])
+    y_res.append(tuple(res[1]))
+    x_values, y_values = algorythm(system).record(*params, record_every=record_every)
+    indexes = list(range(0, 31, record_every))
+    if indexes[-1] != 30:
+        indexes.append(30)
+    assert x_values == pytest.approx(np.array(x_res)[indexes])
+    assert y_values == pytest.approx(np.array(y_res)[indexes])
+
+
+def test_record_bad():
+    """Тестирование обработки некорректных параметров записи"""
+    with pytest.raises(ValueError):
+        Euler(system).record((0, 0.5), 0.1, record_every=0)
+    with pytest.raises(ValueError):
+        Euler(system).record((0, 0.5), -0.1)
+
+
+def exact_system(x_val):
+    """Точное решение системы (func1, func2) с начальными условиями (0, 0.5)
+
+    :param x_val: значение x
+    :return: вектор (y1, y2)
+    """
+    decay = np.exp(-0.8 * x_val)
+    return np.array([0.4875 * x_val + 0.015625 * (1 - decay), 0.5 + 0.0125 * (decay - 1)])
+
+
+@pytest.mark.parametrize("rtol", [1e-6, 1e-10])
+def test_dormand_prince(rtol):
+    """Тестирование адаптивного метода на системе с известным решением
+
+    :param rtol: относительная точность
+    """
+    algorythm = DormandPrince(system, rtol=rtol, atol=rtol * 1e-2)
+    x_res, y_res = algorythm.run((0, 0.5), 0.1, (0, 30))
+    accepted, rejected, evaluations = algorythm.statistics()
+    assert x_res == 30
+    assert y_res == pytest.approx(exact_system(30), rel=100 * rtol)
+    assert evaluations == 1 + 6 * (accepted + rejected)
+
+
+def test_dormand_prince_cost():
+    """Тестирование количества вычислений правой части в сравнении с методом Рунге-Кутта"""
+    algorythm = DormandPrince(system, rtol=1e-10, atol=1e-12)
+    _, y_adaptive = algorythm.run((0, 0.5), 0.1, (0, 30))
+    _, y_fixed = RungeKutta(system).run((0, 0.5), 0.1, (0, 30))
+    rk4_evaluations = 4 * round(30 / 0.1)
+    assert y_adaptive == pytest.approx(exact_system(30), rel=0, abs=1e-8)
+    assert y_fixed == pytest.approx(exact_system(30), rel=0, abs=1e-8)
+    assert np.abs(y_adaptive - exact_system(30)).max() < \
+        np.abs(y_fixed - exact_system(30)).max()
+    assert algorythm.statistics().evaluations < rk4_evaluations
+
+
+def test_dormand_prince_steps():
+    """Тестирование выбора шага и записи принятых точек"""
+    algorythm = DormandPrince(lambda x_val, y_val: -50 * (y_val - np.cos(x_val)), rtol=1e-6)
+    x_values, y_values = algorythm.record([0.], 0.5, (0, 2))
+    accepted, rejected, _ = algorythm.statistics()
+    assert rejected > 0
+    assert x_values.size == accepted + 1
+    assert np.all(np.diff(x_values) > 0)
+    assert x_values[-1] == 2
+    expected = (2500 * np.cos(2) + 50 * np.sin(2) - 2500 * np.exp(-100)) / 2501
+    assert y_values[-1, 0] == pytest.approx(expected, abs=1e-5)
+    calls = []
+    algorythm.run([0.], 0.5, (0, 2), action=lambda x_val, _: calls.append(x_val))
+    assert calls == pytest.approx(x_values[:-1].tolist())
+    with pytest.raises(ValueError):
+        DormandPrince(system, rtol=0, atol=0)
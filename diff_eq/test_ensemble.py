@@ -0,0 +1,120 @@
+"""
+Тестирование решения СДУ для ансамбля начальных условий
+
+Функции:
+    decay - правая часть y' = -k * y с параметром k
+    test_ensemble - тестирование совпадения с решением по одному
+    test_params - тестирование параметров членов ансамбля
+    oscillator - правая часть гармонического осциллятора с параметром k
+    test_adaptive - тестирование адаптивного метода на ансамбле
+    test_bad - тестирование обработки некорректных данных
+    test_unpicklable - тестирование правой части, которую нельзя передать в процесс
+"""
+import pytest
+import numpy as np
+from diff_eq.algorythm import system, Euler, RungeKutta, DormandPrince
+from diff_eq.ensemble import run_ensemble
+
+
+def decay(_, y_vector: np.ndarray, params: np.ndarray) -> np.ndarray:
+    """Правая часть y' = -k * y
+
+    :param _: заглушка для общего вида функций
+    :param y_vector: состояния членов ансамбля
+    :param params: параметры k членов ансамбля
+    :return: значения правой части
+    """
+    return -params * y_vector
+
+
+@pytest.mark.parametrize(
+    ("algorythm", "step", "processes"), [
+        (Euler, 0.1, 1),
+        (RungeKutta, 0.05, 1),
+        (RungeKutta, [0.1, 0.05, 0.1, 0.2, 0.05], 1),
+        (RungeKutta, [0.1, 0.05, 0.1, 0.2, 0.05], 2)
+    ]
+)
+def test_ensemble(algorythm, step, processes):
+    """Тестирование совпадения с решением для каждого члена по одному
+
+    :param algorythm: алгоритм
+    :param step: шаг или шаги членов ансамбля
+    :param processes: количество процессов
+    """
+    start_points = np.random.default_rng(0).normal(size=(5, 2))
+    steps = np.broadcast_to(step, (5,))
+    x_res, y_res = run_ensemble(algorythm, system, start_points, step, (0, 3), processes=processes)
+    for index, start in enumerate(start_points):
+        expected = algorythm(system).run(start, steps[index], (0, 3))
+        assert x_res[index] == pytest.approx(expected[0])
+        assert y_res[index] == pytest.approx(expected[1])
+
+
+@pytest.mark.parametrize("processes", [1, 3])
+def test_params(processes):
+    """Тестирование параметров членов ансамбля
+
+    :param processes: количество процессов
+    """
+    rates = np.linspace(0.5, 2, 7)[:, None]
+    _, y_res = run_ensemble(RungeKutta, decay, np.ones((7, 1)), 0.01, (0, 1),
+                            params=rates, processes=processes)
+    assert y_res == pytest.approx(np.exp(-rates), rel=1e-7)
+
+
+def oscillator(_, y_vector: np.ndarray, params: np.ndarray) -> np.ndarray:
+    """Правая часть гармонического осциллятора y1' = y2, y2' = -k * y1
+
+    :param _: заглушка для общего вида функций
+    :param y_vector: состояния членов ансамбля
+    :param params: параметры k членов ансамбля
+    :return: значения правой части
+    """
+    return np.stack([y_vector[..., 1], -params[..., 0] * y_vector[..., 0]], axis=-1)
+
+
+def test_adaptive():
+    """Тестирование точности быстрого члена ансамбля с адаптивным шагом"""
+    rates = np.full((1000, 1), 0.01)
+    rates[0] = 400
+    start_points = np.tile([1., 0.], (1000, 1))
+    _, y_res = run_ensemble(DormandPrince, oscillator, start_points, 0.1, (0, 10),
+                            params=rates)
+    _, y_alone = DormandPrince(lambda x, y: oscillator(x, y, rates[0])).run(
+        start_points[0], 0.1, (0, 10))
+    expected = np.stack([np.cos(np.sqrt(rates[:, 0]) * 10),
+                         -np.sqrt(rates[:, 0]) * np.sin(np.sqrt(rates[:, 0]) * 10)], axis=-1)
+    fast_error = np.abs(y_res[0] - expected[0]).max()
+    assert fast_error <= 2 * np.abs(y_alone - expected[0]).max()
+    assert np.abs(y_res[1:] - expected[1:]).max() < 1e-6
+
+
+@pytest.mark.parametrize(
+    ("algorythm", "function", "start_points", "params", "exception"), [
+        (object, system, np.ones((2, 2)), None, TypeError),
+        (Euler, (system,), np.ones((2, 2)), None, TypeError),
+        (Euler, system, np.ones(2), None, ValueError),
+        (Euler, decay, np.ones((2, 1)), np.ones((3, 1)), ValueError)
+    ]
+)
+def test_bad(algorythm, function, start_points, params, exception):
+    """Тестирование обработки некорректных данных
+
+    :param algorythm: алгоритм
+    :param function: правая часть
+    :param start_points: начальные условия
+    :param params: параметры членов ансамбля
+    :param exception: ожидаемая ошибка
+    """
+    with pytest.raises(exception):
+        run_ensemble(algorythm, function, start_points, 0.1, params=params)
+
+
+def test_unpicklable():
+    """Тестирование понятной ошибки для lambda при решении в нескольких процессах"""
+    with pytest.raises(TypeError, match="picklable"):
+        run_ensemble(RungeKutta, lambda _, y_val: -y_val, np.ones((4, 1)), 0.1,
+                     processes=2)
+    _, y_res = run_ensemble(RungeKutta, lambda _, y_val: -y_val, np.ones((4, 1)), 0.1)
+    assert y_res == pytest.approx(np.full((4, 1), np.exp(-1)))
@@ -0,0 +1,216 @@
+"""
+Тестирование неявного метода решения жёстких СДУ
+
+Функции:
+    heat - дискретизация уравнения теплопроводности
+    heat_jacobian - матрица Якоби дискретизации
+    test_band - тестирование ленточного представления и разложения
+    test_numeric_jacobian - тестирование конечно-разностной матрицы Якоби
+    test_rosenbrock_stiff - тестирование на жёсткой неавтономной задаче
+    robertson - правая часть задачи Робертсона
+    test_rosenbrock_robertson - тестирование на задаче Робертсона
+    test_rosenbrock_robertson_long - тестирование на задаче Робертсона
+    на длинном диапазоне
+    test_rosenbrock_banded - тестирование ленточной системы большой размерности
+    test_rosenbrock_dense - тестирование плотного вывода
+    test_rosenbrock_bad - тестирование обработки некорректных параметров
+"""
+import pytest
+import numpy as np
+from diff_eq.algorythm import DormandPrince
+from diff_eq.implicit import to_band, from_band, numeric_jacobian, BandFactor, \
+    DenseFactor, Rosenbrock
+
+SIZE = 100
+DELTA = 1 / (SIZE + 1)
+
+
+def heat(_: float, y_vector: np.ndarray) -> np.ndarray:
+    """Дискретизация уравнения теплопроводности u_t = u_xx с нулевыми границами
+
+    :param _: заглушка для общего вида функций
+    :param y_vector: значения во внутренних узлах
+    :return: значения правой части
+    """
+    result = -2 * y_vector
+    result[1:] += y_vector[:-1]
+    result[:-1] += y_vector[1:]
+    return result / DELTA ** 2
+
+
+def heat_jacobian(_: float, y_vector: np.ndarray) -> np.ndarray:
+    """Матрица Якоби дискретизации уравнения теплопроводности
+
+    :param _: заглушка для общего вида функций
+    :param y_vector: значения во внутренних узлах
+    :return: трёхдиагональная матрица
+    """
+    size = len(y_vector)
+    return (np.eye(size, k=-1) - 2 * np.eye(size) + np.eye(size, k=1)) / DELTA ** 2
+
+
+def test_band():
+    """Тестирование ленточного представления и разложения"""
+    rng = np.random.default_rng(0)
+    matrix = np.triu(np.tril(rng.normal(size=(9, 9)), 1), -2) + 10 * np.eye(9)
+    band = to_band(matrix, 2, 1)
+    assert band.shape == (9, 4)
+    assert np.array_equal(from_band(band, 2), matrix)
+    rhs = rng.normal(size=9)
+    expected = np.linalg.solve(matrix, rhs)
+    assert BandFactor(band, 2, 1).solve(rhs) == pytest.approx(expected)
+    assert DenseFactor(matrix).solve(rhs) == pytest.approx(expected)
+    with pytest.raises(np.linalg.LinAlgError):
+        BandFactor(np.zeros((3, 3)), 1, 1)
+
+
+def test_numeric_jacobian():
+    """Тестирование конечно-разностной матрицы Якоби"""
+    calls = []
+
+    def counted(x_val, y_val):
+        calls.append(x_val)
+        return heat(x_val, y_val)
+
+    y_vector = np.sin(np.linspace(0, 3, SIZE))
+    expected = heat_jacobian(0, y_vector)
+    dense = numeric_jacobian(counted, 0, y_vector, heat(0, y_vector))
+    assert len(calls) == SIZE
+    assert np.allclose(dense, expected, rtol=1e-5, atol=1e-2)
+    calls.clear()
+    band = numeric_jacobian(counted, 0, y_vector, heat(0, y_vector), bandwidth=(1, 1))
+    assert len(calls) == 3
+    assert np.allclose(band, to_band(expected, 1, 1), rtol=1e-5, atol=1e-2)
+
+
+def test_rosenbrock_stiff():
+    """Тестирование на жёсткой неавтономной задаче в сравнении с явным методом"""
+    def stiff(x_val, y_val):
+        return -1000 * (y_val - np.cos(x_val))
+
+    expected = (1e6 * np.cos(10) + 1e3 * np.sin(10)) / (1e6 + 1)
+    implicit = Rosenbrock(stiff, rtol=1e-3, atol=1e-6)
+    explicit = DormandPrince(stiff, rtol=1e-3, atol=1e-6)
+    x_res, y_res = implicit.run([0.], 0.01, (0, 10))
+    explicit.run([0.], 0.01, (0, 10))
+    statistics = implicit.statistics()
+    assert x_res == 10
+    assert y_res[0] == pytest.approx(expected, abs=1e-2)
+    assert statistics.accepted * 5 < explicit.statistics().accepted
+    assert statistics.evaluations * 10 < explicit.statistics().evaluations
+    assert statistics.rejected * 10 < statistics.accepted
+    assert statistics.jacobians * 10 < statistics.accepted
+
+
+def robertson(_: float, y_vector: np.ndarray) -> np.ndarray:
+    """Правая часть задачи Робертсона
+
+    :param _: заглушка для общего вида функций
+    :param y_vector: концентрации веществ
+    :return: значения правой части
+    """
+    return np.array([-0.04 * y_vector[0] + 1e4 * y_vector[1] * y_vector[2],
+                     0.04 * y_vector[0] - 1e4 * y_vector[1] * y_vector[2]
+                     - 3e7 * y_vector[1] ** 2,
+                     3e7 * y_vector[1] ** 2])
+
+
+ROBERTSON_JACOBIAN = [None, lambda _, y_val: np.array([
+    [-0.04, 1e4 * y_val[2], 1e4 * y_val[1]],
+    [0.04, -1e4 * y_val[2] - 6e7 * y_val[1], -1e4 * y_val[1]],
+    [0., 6e7 * y_val[1], 0.]])]
+
+
+@pytest.mark.parametrize("jacobian", ROBERTSON_JACOBIAN)
+def test_rosenbrock_robertson(jacobian):
+    """Тестирование на задаче Робертсона
+
+    :param jacobian: аналитическая матрица Якоби или None
+    """
+    algorythm = Rosenbrock(robertson, rtol=1e-4, atol=1e-8, jacobian=jacobian,
+                           autonomous=True)
+    _, y_res = algorythm.run([1., 0., 0.], 1e-6, (0, 40))
+    assert y_res == pytest.approx([0.7158271, 9.185535e-6, 0.2841637], rel=1e-3)
+    assert y_res.sum() == pytest.approx(1)
+    accepted, rejected, evaluations, jacobians, _ = algorythm.statistics()
+    assert accepted < 600
+    expected = 0 if jacobian else 3 * jacobians
+    assert evaluations == expected + 2 * accepted + rejected
+
+
+@pytest.mark.parametrize("jacobian", ROBERTSON_JACOBIAN)
+def test_rosenbrock_robertson_long(jacobian):
+    """Тестирование на задаче Робертсона на длинном диапазоне, где
+    устаревшая матрица Якоби резко уменьшает шаг
+
+    :param jacobian: аналитическая матрица Якоби или None
+    """
+    algorythm = Rosenbrock(robertson, rtol=1e-4, atol=1e-8, jacobian=jacobian,
+                           autonomous=True)
+    _, y_res = algorythm.run([1., 0., 0.], 1e-6, (0, 4e5))
+    assert y_res[0] == pytest.approx(4.9394e-3, rel=5e-3)
+    assert y_res.sum() == pytest.approx(1)
+    statistics = algorythm.statistics()
+    assert statistics.accepted < 2000
+    assert statistics.jacobians * 20 < statistics.accepted
+
+
+@pytest.mark.parametrize(("bandwidth", "jacobian"), [
+    ((1, 1), None), ((1, 1), heat_jacobian), (None, None)
+])
+def test_rosenbrock_banded(bandwidth, jacobian):
+    """Тестирование ленточной системы большой размерности
+
+    :param bandwidth: ширина ленты матрицы Якоби
+    :param jacobian: аналитическая матрица Якоби или None
+    """
+    grid = np.arange(1, SIZE + 1) * DELTA
+    start = np.sin(np.pi * grid)
+    algorythm = Rosenbrock(heat, rtol=1e-4, atol=1e-8, jacobian=jacobian,
+                           bandwidth=bandwidth, autonomous=True)
+    _, y_res = algorythm.run(start, 1e-4, (0, 0.1))
+    rate = (2 - 2 * np.cos(np.pi * DELTA)) / DELTA ** 2
+    assert y_res == pytest.approx(start * np.exp(-rate * 0.1), abs=1e-4)
+    statistics = algorythm.statistics()
+    assert statistics.accepted < 200
+    assert statistics.jacobians == statistics.accepted // Rosenbrock.JACOBIAN_AGE + 1
+    assert statistics.factorizations < statistics.accepted / 10
+    expected = 0 if jacobian else (3 if bandwidth else SIZE) * statistics.jacobians
+    assert statistics.evaluations == \
+        expected + 2 * statistics.accepted + statistics.rejected
+
+
+@pytest.mark.parametrize(("function", "start", "exact"), [
+    (lambda x_val, y_val: -1000 * (y_val - np.cos(x_val)), 0.,
+     lambda x_val: (1e6 * np.cos(x_val) + 1e3 * np.sin(x_val)
+                    - 1e6 * np.exp(-1000 * x_val)) / (1e6 + 1)),
+    (lambda _, y_val: -y_val, 1., lambda x_val: np.exp(-x_val))
+])
+def test_rosenbrock_dense(function, start: float, exact):
+    """Тестирование плотного вывода по принятым шагам
+
+    :param function: правая часть
+    :param start: начальное условие
+    :param exact: точное решение
+    """
+    algorythm = Rosenbrock(function, rtol=1e-5, atol=1e-8)
+    x_res, y_res = algorythm.run([start], 0.01, (0, 1))
+    evaluations = algorythm.statistics().evaluations
+    solution = algorythm.dense([start], 0.01, (0, 1))
+    assert algorythm.statistics().evaluations == evaluations + 1
+    assert solution(x_res) == pytest.approx(y_res, rel=1e-12)
+    assert solution.slopes == pytest.approx(
+        np.array([function(x_val, y_val) for x_val, y_val
+                  in zip(solution.x_values, solution.y_values)]))
+    x_query = np.linspace(0, 1, 500)
+    assert solution(x_query)[:, 0] == pytest.approx(exact(x_query), abs=1e-3)
+
+
+def test_rosenbrock_bad():
+    """Тестирование обработки некорректных параметров"""
+    with pytest.raises(ValueError):
+        Rosenbrock(heat, bandwidth=(-1, 1))
+    with pytest.raises(ValueError):
+        Rosenbrock(heat, rtol=0, atol=0)
+    with pytest.raises(ValueError):
+        Rosenbrock(heat).run([1.], 0, (0, 1))
@@ -0,0 +1,96 @@
+"""
+Тестирование потоковой выдачи и записи траекторий в файл
+
+Функции:
+    test_stream - тестирование выдачи траектории блоками
+    test_stream_adaptive - тестирование выдачи принятых точек блоками
+    test_write_trajectory - тестирование записи траектории в файл
+    test_write_resume - тестирование продолжения прерванного расчёта
+    test_write_bad - тестирование обработки некорректных параметров
+"""
+import json
+import pytest
+import numpy as np
+from diff_eq.algorythm import system, Euler, RungeKutta, DormandPrince
+from diff_eq.trajectory_file import checkpoint_path, write_trajectory
+
+
+@pytest.mark.parametrize("algorythm", [Euler, RungeKutta])
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_stream(algorythm, chunk_size: int):
+    """Тестирование выдачи траектории блоками
+
+    :param algorythm: класс алгоритма
+    :param chunk_size: количество точек в блоке
+    """
+    x_values, y_values = algorythm(system).record((0, 0.5), 0.01, (0, 3))
+    blocks = list(algorythm(system).stream((0, 0.5), 0.01, (0, 3), chunk_size))
+    assert all(x_block.size == chunk_size for x_block, _ in blocks[:-1])
+    assert np.array_equal(np.concatenate([x_block for x_block, _ in blocks]), x_values)
+    assert np.array_equal(np.concatenate([y_block for _, y_block in blocks]), y_values)
+    resumed = list(algorythm(system).stream(y_values[120], 0.01, (0, 3), chunk_size,
+                                            first_step=120))
+    assert np.array_equal(np.concatenate([y_block for _, y_block in resumed]),
+                          y_values[120:])
+
+
+def test_stream_adaptive():
+    """Тестирование выдачи принятых точек адаптивного метода блоками"""
+    x_values, y_values = DormandPrince(system, rtol=1e-8).record((0, 0.5), 0.1, (0, 30))
+    blocks = list(DormandPrince(system, rtol=1e-8).stream((0, 0.5), 0.1, (0, 30), 5))
+    assert all(x_block.size == 5 for x_block, _ in blocks[:-1])
+    assert np.array_equal(np.concatenate([x_block for x_block, _ in blocks]), x_values)
+    assert np.array_equal(np.concatenate([y_block for _, y_block in blocks]), y_values)
+
+
+def test_write_trajectory(tmp_path):
+    """Тестирование записи траектории в файл"""
+    path = str(tmp_path / "trajectory.npy")
+    x_values, y_values = RungeKutta(system).record((0, 0.5), 0.01, (0, 3))
+    result = write_trajectory(RungeKutta(system), path, (0, 0.5), 0.01, (0, 3), chunk_size=64)
+    assert result.shape == (301, 3)
+    assert np.array_equal(result[:, 0], x_values)
+    assert np.array_equal(result[:, 1:], y_values)
+    with open(checkpoint_path(path), encoding="utf-8") as file:
+        assert json.load(file)["rows"] == 301
+    calls = []
+    write_trajectory(RungeKutta(lambda x_val, y_val: calls.append(x_val) or system(x_val, y_val)),
+                     path, (0, 0.5), 0.01, (0, 3), chunk_size=64)
+    assert not calls
+
+
+def test_write_resume(tmp_path):
+    """Тестирование продолжения прерванного расчёта"""
+    path = str(tmp_path / "trajectory.npy")
+    calls = []
+
+    def failing(x_val, y_val):
+        calls.append(x_val)
+        if len(calls) > 4 * 150:
+            raise RuntimeError("interrupted")
+        return system(x_val, y_val)
+
+    with pytest.raises(RuntimeError):
+        write_trajectory(RungeKutta(failing), path, (0, 0.5), 0.01, (0, 3), chunk_size=64)
+    with open(checkpoint_path(path), encoding="utf-8") as file:
+        assert json.load(file)["rows"] == 128
+    calls.clear()
+    result = write_trajectory(RungeKutta(system), path, (0, 0.5), 0.01, (0, 3), chunk_size=64)
+    _, y_values = RungeKutta(system).record((0, 0.5), 0.01, (0, 3))
+    assert np.array_equal(result[:, 1:], y_values)
+    restarted = write_trajectory(RungeKutta(system), path, (0, 1), 0.01, (0, 3), chunk_size=64,
+                                 resume=False)
+    assert restarted[0, 2] == 1
+
+
+def test_write_bad(tmp_path):
+    """Тестирование обработки некорректных параметров"""
+    path = str(tmp_path / "trajectory.npy")
+    with pytest.raises(TypeError):
+        write_trajectory(DormandPrince(system), path, (0, 0.5), 0.01)
+    with pytest.raises(ValueError):
+        write_trajectory(Euler(system), path, [(0, 0.5)], 0.01)
+    with pytest.raises(ValueError):
+        next(Euler(system).stream((0, 0.5), 0.01, chunk_size=0))
+    with pytest.raises(ValueError):
+        next(Euler(system).stream((0, 0.5), 0.01, first_step=101))
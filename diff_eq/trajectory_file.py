@@ -0,0 +1,130 @@
+"""
+Запись длинных траекторий СДУ в файл .npy
+
+Траектория на равномерной сетке записывается блоками в заранее выделенный
+файл .npy, открытый через numpy.memmap, поэтому расход памяти не зависит
+от длины диапазона. После каждого блока данные сбрасываются на диск, и
+количество записанных строк сохраняется в файле контрольной точки рядом с
+траекторией. Прерванный расчёт продолжается с последней записанной строки.
+
+Строка файла содержит значение x и вектор y: (x, y1, ..., yn).
+
+Функции:
+    checkpoint_path - путь к файлу контрольной точки
+    write_trajectory - запись траектории в файл .npy с контрольными точками
+"""
+import json
+import os
+import numpy as np
+from diff_eq.algorythm import BaseAlgorythm, AdaptiveAlgorythm
+
+
+def checkpoint_path(path: str) -> str:
+    """Путь к файлу контрольной точки траектории
+
+    :param path: путь к файлу траектории
+    :return: путь к файлу контрольной точки
+    """
+    return f"{path}.checkpoint.json"
+
+
+def _save_checkpoint(path: str, state: dict):
+    """Атомарная запись контрольной точки
+
+    :param path: путь к файлу контрольной точки
+    :param state: состояние расчёта
+    """
+    temp = f"{path}.{os.getpid()}.tmp"
+    with open(temp, "w", encoding="utf-8") as file:
+        json.dump(state, file)
+    os.replace(temp, path)
+
+
+def _load_checkpoint(path: str, state: dict) -> int:
+    """Количество записанных строк из контрольной точки того же расчёта
+
+    :param path: путь к файлу контрольной точки
+    :param state: параметры текущего расчёта
+    :return: количество записанных строк или 0, если контрольной точки
+    нет или она относится к другому расчёту
+    """
+    if not os.path.exists(path):
+        return 0
+    with open(path, encoding="utf-8") as file:
+        saved = json.load(file)
+    rows = saved.pop("rows", 0)
+    return rows if saved == state else 0
+
+
+def _open_output(path: str, state: dict, count: int, resume: bool) -> tuple:
+    """Открытие файла траектории, прерванный расчёт продолжается
+
+    :param path: путь к файлу .npy
+    :param state: параметры текущего расчёта
+    :param count: количество шагов сетки
+    :param resume: продолжать ли прерванный расчёт
+    :return: файл, открытый через numpy.memmap, количество уже записанных
+    строк и состояние в последней записанной строке
+    """
+    checkpoint = checkpoint_path(path)
+    rows = _load_checkpoint(checkpoint, state) if resume and os.path.exists(path) else 0
+    if rows:
+        output = np.lib.format.open_memmap(path, mode="r+")
+        return output, rows, np.array(output[rows - 1, 1:])
+    start_points = np.array(state["start_points"], dtype=float)
+    output = np.lib.format.open_memmap(path, mode="w+", dtype=float,
+                                       shape=(count + 1, start_points.size + 1))
+    return output, 0, start_points
+
+
+def _write_block(output: np.memmap, begin: int, x_block: np.ndarray,
+                 y_block: np.ndarray) -> int:
+    """Запись блока траектории со сбросом на диск
+
+    :param output: файл траектории
+    :param begin: номер первой строки блока
+    :param x_block: значения x блока
+    :param y_block: значения y блока
+    :return: номер строки, следующей за блоком
+    """
+    end = begin + x_block.size
+    output[begin:end, 0] = x_block
+    output[begin:end, 1:] = y_block
+    output.flush()
+    return end
+
+
+# pylint: disable=too-many-arguments
+def write_trajectory(algorythm: BaseAlgorythm, path: str, start_points: list,
+                     step: float, x_lim: tuple = (0, 1), *, chunk_size: int = 4096,
+                     resume: bool = True) -> np.memmap:
+    """Запись траектории в файл .npy с контрольными точками
+
+    :param algorythm: алгоритм с равномерной сеткой
+    :param path: путь к файлу .npy
+    :param start_points: начальные условия СДУ
+    :param step: шаг сетки
+    :param x_lim: диапазон сетки
+    :param chunk_size: количество строк в блоке
+    :param resume: продолжать ли прерванный расчёт с теми же параметрами
+    :return: траектория, открытая только для чтения,
+    по строке (x, y1, ..., yn) на узел сетки
+    """
+    if isinstance(algorythm, AdaptiveAlgorythm):
+        raise TypeError("adaptive algorythms have no preallocated grid, use stream")
+    start_points = np.array(start_points, dtype=float)
+    if start_points.ndim != 1:
+        raise ValueError("start_points should be a vector")
+    # pylint: disable=protected-access
+    count = algorythm._step_count(step, x_lim)
+    state = {"algorythm": type(algorythm).__name__, "start_points": start_points.tolist(),
+             "step": step, "x_lim": list(x_lim)}
+    output, rows, start_points = _open_output(path, state, count, resume)
+    if rows <= count:
+        first_step = max(rows - 1, 0)
+        for x_block, y_block in algorythm.stream(start_points, step, x_lim, chunk_size,
+                                                 first_step=first_step):
+            first_step = _write_block(output, first_step, x_block, y_block)
+            _save_checkpoint(checkpoint_path(path), dict(state, rows=first_step))
+    del output
+    return np.load(path, mmap_mode="r")
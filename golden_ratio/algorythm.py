@@ -1,47 +1,313 @@
 """
 Поиск минимума функции одной переменной методом золотого сечения
+
+Одна из двух внутренних точек отрезка переходит на следующую итерацию
+вместе со значением функции в ней, поэтому каждая итерация требует одного
+вычисления функции. Это важно для дорогих целевых функций, например
+запусков моделирования.
+
+Метод Брента использует параболическую интерполяцию по трём лучшим точкам
+и переходит к шагу золотого сечения, когда парабола ненадёжна, поэтому на
+гладких функциях сходится сверхлинейно при той же сигнатуре и результате.
+
+Пакетный поиск ведёт множество независимых поисков одновременно: отрезки
+и параметры функции задаются массивами, функция вычисляется одним вызовом
+для всех ещё не сошедшихся поисков, а сошедшиеся выбывают.
+
+Классы:
+    SearchResult - результат поиска минимума
+    BatchSearchResult - результаты пакетного поиска минимума
+
+Функции:
+    function - искомая функция
+    golden_search - метод золотого сечения с ограничением числа вычислений
+    golden_search_batch - пакетный метод золотого сечения
+    brent_search - метод Брента с ограничением числа вычислений
+    golden_algorythm - метод золотого сечения для искомой функции
+    calculate_golden_right - вычисление правой точки золотого сечения
+    calculate_golden_left - вычисление левой точки золотого сечения
+    main - основная функция
 """
+import typing
 from typing import Union
-import matplotlib.pyplot as plt
 import numpy as np
+from rendering.batch import Curve, Figure, render
 A_VALUE = 4.0
 B_VALUE = -0.25
-GS_VALUE = 0.618
+GS_VALUE = (np.sqrt(5) - 1) / 2
 
 
-def function(x_value: Union[float, np.ndarray]) -> float:
-    """Искомая функция
+def function(x_value: Union[float, np.ndarray], a_value: Union[float, np.ndarray] = A_VALUE,
+             b_value: Union[float, np.ndarray] = B_VALUE) -> float:
+    """Искомая функция x^2 + a * e^(b * x)
 
     :param x_value: одно или несколько значений
+    :param a_value: одно или несколько значений параметра a
+    :param b_value: одно или несколько значений параметра b
     :return: одно или несколько значений
     """
-    return x_value ** 2 + A_VALUE * np.exp(B_VALUE * x_value)
+    return x_value ** 2 + a_value * np.exp(b_value * x_value)
 
 
-def golden_algorythm(start: float, end: float, eps: float = 0.001) -> float:
-    """Метод золотого сечения для нахождения минимума функции
+class SearchResult(typing.NamedTuple):
+    """Результат поиска минимума
 
+    Поля:
+        x: float - найденная точка минимума
+        fun: float - значение функции в точке минимума
+        n_evals: int - количество вычислений функции
+        n_iter: int - количество итераций
+        converged: bool - достигнута ли заданная точность
+    """
+    x: float
+    fun: float
+    n_evals: int
+    n_iter: int
+    converged: bool
+
+
+# pylint: disable=too-many-arguments
+def golden_search(func: typing.Callable, start: float, end: float, *,
+                  xtol: float = 0.001, ftol: float = 0.,
+                  max_evals: int = None) -> SearchResult:
+    """Метод золотого сечения для нахождения минимума унимодальной функции
+
+    Поиск останавливается, когда длина отрезка не превышает xtol, разность
+    значений функции во внутренних точках не превышает ftol или исчерпан
+    бюджет max_evals вычислений функции.
+
+    :param func: функция одной переменной
     :param start: нижняя граница отрезка
     :param end: верхняя граница отрезка
-    :param eps: точность
-    :return: точка минимума
+    :param xtol: точность по x
+    :param ftol: точность по значению функции, 0 - не учитывается
+    :param max_evals: максимальное количество вычислений функции
+    :return: результат в виде SearchResult
     """
+    if end < start:
+        raise ValueError("end should be >= start")
+    if max_evals is not None and max_evals < 2:
+        raise ValueError("max_evals should be >=2")
     current_a = start
     current_b = end
     current_left = calculate_golden_left(start, end)
     current_right = calculate_golden_right(start, end)
+    value_left = func(current_left)
+    value_right = func(current_right)
+    n_evals = 2
+    n_iter = 0
 
-    while current_b - current_a > eps:
-        if function(current_left) < function(current_right):
+    while True:
+        converged = current_b - current_a <= xtol or \
+            (ftol > 0 and abs(value_left - value_right) <= ftol)
+        if converged or (max_evals is not None and n_evals >= max_evals):
+            break
+        if value_left < value_right:
             current_b = current_right
-            current_right = current_left
+            current_right, value_right = current_left, value_left
             current_left = calculate_golden_left(current_a, current_b)
+            value_left = func(current_left)
         else:
             current_a = current_left
-            current_left = current_right
+            current_left, value_left = current_right, value_right
             current_right = calculate_golden_right(current_a, current_b)
+            value_right = func(current_right)
+        n_evals += 1
+        n_iter += 1
+
+    if value_left < value_right:
+        return SearchResult(current_left, value_left, n_evals, n_iter, converged)
+    return SearchResult(current_right, value_right, n_evals, n_iter, converged)
+
+
+class BatchSearchResult(typing.NamedTuple):
+    """Результаты пакетного поиска минимума
+
+    Поля:
+        x: numpy.ndarray - найденные точки минимума
+        fun: numpy.ndarray - значения функции в точках минимума
+        n_evals: numpy.ndarray - количество вычислений функции для каждого поиска
+        n_iter: numpy.ndarray - количество итераций для каждого поиска
+        converged: numpy.ndarray - достигнута ли заданная точность
+    """
+    x: np.ndarray
+    fun: np.ndarray
+    n_evals: np.ndarray
+    n_iter: np.ndarray
+    converged: np.ndarray
+
+
+# pylint: disable=too-many-arguments, too-many-locals
+def golden_search_batch(func: typing.Callable, starts: np.ndarray, ends: np.ndarray,
+                        params: tuple = (), *, xtol: float = 0.001, ftol: float = 0.,
+                        max_evals: int = None) -> BatchSearchResult:
+    """Пакетный метод золотого сечения
+
+    Границы отрезков и параметры функции приводятся к общей форме,
+    каждый элемент которой задаёт отдельный поиск. Условия остановки
+    совпадают с golden_search и проверяются для каждого поиска отдельно.
+
+    :param func: векторная функция func(x, *params)
+    :param starts: нижние границы отрезков
+    :param ends: верхние границы отрезков
+    :param params: массивы параметров функции
+    :param xtol: точность по x
+    :param ftol: точность по значению функции, 0 - не учитывается
+    :param max_evals: максимальное количество вычислений функции для каждого поиска
+    :return: результаты в виде BatchSearchResult с массивами общей формы
+    """
+    if max_evals is not None and max_evals < 2:
+        raise ValueError("max_evals should be >=2")
+    arrays = np.broadcast_arrays(np.asarray(starts, dtype=float),
+                                 np.asarray(ends, dtype=float),
+                                 *(np.asarray(param) for param in params))
+    shape = arrays[0].shape
+    current_a, current_b = (np.array(array, dtype=float).ravel() for array in arrays[:2])
+    params = [np.ravel(array) for array in arrays[2:]]
+    if np.any(current_b < current_a):
+        raise ValueError("ends should be >= starts")
+    current_left = calculate_golden_left(current_a, current_b)
+    current_right = calculate_golden_right(current_a, current_b)
+    value_left = np.asarray(func(current_left, *params), dtype=float)
+    value_right = np.asarray(func(current_right, *params), dtype=float)
+    n_evals = np.full(current_a.size, 2)
+    n_iter = np.zeros(current_a.size, dtype=int)
+    converged = np.zeros(current_a.size, dtype=bool)
+    active = np.arange(current_a.size)
 
-    return (current_b + current_a) * 0.5
+    while active.size:
+        done = current_b[active] - current_a[active] <= xtol
+        if ftol > 0:
+            done |= np.abs(value_left[active] - value_right[active]) <= ftol
+        converged[active[done]] = True
+        if max_evals is not None:
+            done |= n_evals[active] >= max_evals
+        active = active[~done]
+        if not active.size:
+            break
+        move_left = value_left[active] < value_right[active]
+        left, right = active[move_left], active[~move_left]
+        current_b[left] = current_right[left]
+        current_right[left] = current_left[left]
+        value_right[left] = value_left[left]
+        current_left[left] = calculate_golden_left(current_a[left], current_b[left])
+        current_a[right] = current_left[right]
+        current_left[right] = current_right[right]
+        value_left[right] = value_right[right]
+        current_right[right] = calculate_golden_right(current_a[right], current_b[right])
+        points = np.where(move_left, current_left[active], current_right[active])
+        values = np.asarray(func(points, *(param[active] for param in params)), dtype=float)
+        value_left[left] = values[move_left]
+        value_right[right] = values[~move_left]
+        n_evals[active] += 1
+        n_iter[active] += 1
+
+    use_left = value_left < value_right
+    return BatchSearchResult(np.where(use_left, current_left, current_right).reshape(shape),
+                             np.where(use_left, value_left, value_right).reshape(shape),
+                             n_evals.reshape(shape), n_iter.reshape(shape),
+                             converged.reshape(shape))
+
+
+# pylint: disable=too-many-arguments, too-many-locals, too-many-branches, too-many-statements
+def brent_search(func: typing.Callable, start: float, end: float, *,
+                 xtol: float = 0.001, ftol: float = 0.,
+                 max_evals: int = None) -> SearchResult:
+    """Метод Брента для нахождения минимума унимодальной функции
+
+    Следующая точка находится как минимум параболы, проведённой через три
+    лучшие точки. Если минимум параболы выходит за отрезок или шаг не
+    уменьшается вдвое за две итерации, выполняется шаг золотого сечения.
+    Поиск останавливается, когда отрезок, содержащий минимум, сужается до
+    xtol, разность двух лучших значений функции не превышает ftol или
+    исчерпан бюджет max_evals вычислений функции.
+
+    :param func: функция одной переменной
+    :param start: нижняя граница отрезка
+    :param end: верхняя граница отрезка
+    :param xtol: точность по x
+    :param ftol: точность по значению функции, 0 - не учитывается
+    :param max_evals: максимальное количество вычислений функции
+    :return: результат в виде SearchResult
+    """
+    if end < start:
+        raise ValueError("end should be >= start")
+    if max_evals is not None and max_evals < 1:
+        raise ValueError("max_evals should be >=1")
+    golden_step = 1 - GS_VALUE
+    sqrt_eps = np.sqrt(np.finfo(float).eps)
+    current_a, current_b = start, end
+    best = second = third = calculate_golden_left(start, end)
+    value_best = value_second = value_third = func(best)
+    step = previous_step = 0.
+    n_evals = 1
+    n_iter = 0
+
+    while True:
+        middle = (current_a + current_b) / 2
+        tol = sqrt_eps * abs(best) + xtol / 3
+        converged = abs(best - middle) <= 2 * tol - (current_b - current_a) / 2 or \
+            (ftol > 0 and second != best and abs(value_second - value_best) <= ftol)
+        if converged or (max_evals is not None and n_evals >= max_evals):
+            break
+        parabolic = False
+        if abs(previous_step) > tol:
+            temp_r = (best - second) * (value_best - value_third)
+            temp_q = (best - third) * (value_best - value_second)
+            temp_p = (best - third) * temp_q - (best - second) * temp_r
+            temp_q = 2 * (temp_q - temp_r)
+            if temp_q > 0:
+                temp_p = -temp_p
+            temp_q = abs(temp_q)
+            last_step = previous_step
+            previous_step = step
+            parabolic = abs(temp_p) < abs(temp_q * last_step / 2) and \
+                temp_q * (current_a - best) < temp_p < temp_q * (current_b - best)
+        if parabolic:
+            step = temp_p / temp_q
+            point = best + step
+            if point - current_a < 2 * tol or current_b - point < 2 * tol:
+                step = tol if best < middle else -tol
+        else:
+            previous_step = (current_b if best < middle else current_a) - best
+            step = golden_step * previous_step
+        point = best + (step if abs(step) >= tol else np.copysign(tol, step))
+        value = func(point)
+        n_evals += 1
+        n_iter += 1
+        if value <= value_best:
+            if point < best:
+                current_b = best
+            else:
+                current_a = best
+            third, value_third = second, value_second
+            second, value_second = best, value_best
+            best, value_best = point, value
+        else:
+            if point < best:
+                current_a = point
+            else:
+                current_b = point
+            if value <= value_second or second == best:
+                third, value_third = second, value_second
+                second, value_second = point, value
+            elif value <= value_third or third in (best, second):
+                third, value_third = point, value
+
+    return SearchResult(best, value_best, n_evals, n_iter, converged)
+
+
+def golden_algorythm(start: float, end: float, eps: float = 0.001, *,
+                     func: typing.Callable = function) -> float:
+    """Метод золотого сечения для нахождения минимума функции
+
+    :param start: нижняя граница отрезка
+    :param end: верхняя граница отрезка
+    :param eps: точность
+    :param func: функция одной переменной, по умолчанию искомая функция
+    :return: точка минимума
+    """
+    return golden_search(func, start, end, xtol=eps).x
 
 
 def calculate_golden_right(start: float, end: float) -> float:
@@ -56,17 +322,12 @@ def calculate_golden_left(start: float, end: float) -> float:
 
 def main():
     """Основная функция"""
-    plt.title(r"График функции $x^2 + ae^{bx}$")
-    plt.xlabel("x")
-    plt.ylabel("y")
-
     x_values = np.linspace(-1, 0, 100)
-    plt.plot(x_values, function(x_values))
-
     minimum = golden_algorythm(-1, 0)
-    plt.plot(minimum, function(minimum), "ro")
-    plt.savefig("../graphics/golden.jpg")
-    plt.show()
+    curves = (Curve(x_values, function(x_values)),
+              Curve([minimum], [function(minimum)], "ro"))
+    render([Figure("../graphics/golden.jpg", curves,
+                   title=r"График функции $x^2 + ae^{bx}$", xlabel="x", ylabel="y")])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,117 @@
+"""
+Поиск всех локальных минимумов функции на широком отрезке
+
+Функция вычисляется на грубой равномерной сетке одним векторным вызовом,
+каждый локальный минимум сетки заключается в отрезок из соседних узлов,
+и отрезки уточняются одновременно в пуле потоков или процессов методом
+Брента или золотого сечения. Пул потоков подходит для функций, которые
+освобождают GIL или запускают внешние программы, пул процессов - для
+функций на чистом Python, которые можно передать в другой процесс.
+
+Функции:
+    bracket_minima - отрезки, содержащие локальные минимумы сетки
+    find_minima - поиск всех локальных минимумов
+"""
+import functools
+import typing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+from golden_ratio.algorythm import SearchResult, golden_search, brent_search
+
+METHODS = {"golden": golden_search, "brent": brent_search}
+
+
+def bracket_minima(x_values: np.ndarray, f_values: np.ndarray) -> list:
+    """Отрезки, содержащие локальные минимумы функции на сетке
+
+    Узел сетки считается минимумом, если значение в нём меньше значения
+    в левом соседе и не больше значения в правом. Минимум на границе
+    заключается в отрезок из граничного узла и его соседа.
+
+    :param x_values: возрастающие узлы сетки
+    :param f_values: значения функции в узлах
+    :return: список кортежей (start, end)
+    """
+    x_values = np.asarray(x_values, dtype=float)
+    f_values = np.asarray(f_values, dtype=float)
+    if x_values.size < 2:
+        raise ValueError("grid should contain at least two nodes")
+    left = np.r_[np.inf, f_values[:-1]]
+    right = np.r_[f_values[1:], np.inf]
+    indexes = np.flatnonzero((f_values < left) & (f_values <= right))
+    last = x_values.size - 1
+    return [(float(x_values[max(index - 1, 0)]), float(x_values[min(index + 1, last)]))
+            for index in indexes]
+
+
+def _refine(bracket: tuple, search: typing.Callable, func: typing.Callable,
+            options: dict) -> SearchResult:
+    """Уточнение минимума на одном отрезке
+
+    :param bracket: отрезок (start, end)
+    :param search: метод поиска
+    :param func: функция одной переменной
+    :param options: параметры остановки метода поиска
+    :return: результат в виде SearchResult
+    """
+    return search(func, *bracket, **options)
+
+
+def _scan(func: typing.Callable, x_values: np.ndarray, refine: typing.Callable,
+          vectorized: bool, mapper: typing.Callable = map) -> list:
+    """Вычисление функции на сетке и уточнение минимумов на найденных отрезках
+
+    :param func: функция одной переменной
+    :param x_values: узлы сетки
+    :param refine: уточнение минимума на одном отрезке
+    :param vectorized: вычисляется ли функция сразу для массива значений
+    :param mapper: отображение map или метод map пула
+    :return: список SearchResult в порядке отрезков
+    """
+    f_values = func(x_values) if vectorized else list(mapper(func, x_values))
+    return list(mapper(refine, bracket_minima(x_values, f_values)))
+
+
+# pylint: disable=too-many-arguments
+def find_minima(func: typing.Callable, start: float, end: float, *,
+                samples: int = 101, method: str = "brent", xtol: float = 1e-6,
+                ftol: float = 0., max_evals: int = None, workers: int = None,
+                use_processes: bool = False, vectorized: bool = True) -> list:
+    """Поиск всех локальных минимумов функции на отрезке
+
+    Минимумы, расстояние между которыми меньше шага сетки, могут
+    слиться в один, поэтому samples выбирается по масштабу функции.
+    Сетка стоит samples вычислений функции, они не входят в n_evals
+    результатов.
+
+    :param func: функция одной переменной
+    :param start: нижняя граница отрезка
+    :param end: верхняя граница отрезка
+    :param samples: количество узлов сетки
+    :param method: метод уточнения, ключ METHODS
+    :param xtol: точность по x
+    :param ftol: точность по значению функции, 0 - не учитывается
+    :param max_evals: максимальное количество вычислений функции на один минимум
+    :param workers: количество потоков или процессов, 1 - без пула,
+    по умолчанию выбирается пулом
+    :param use_processes: использовать ли пул процессов вместо пула потоков
+    :param vectorized: вычисляется ли функция сразу для массива значений,
+    иначе узлы сетки вычисляются в пуле
+    :return: список SearchResult, упорядоченный по возрастанию значения функции
+    """
+    if method not in METHODS:
+        raise ValueError(f"method should be one of {sorted(METHODS)}")
+    if end <= start:
+        raise ValueError("end should be > start")
+    if samples < 2:
+        raise ValueError("samples should be >=2")
+    x_values = np.linspace(start, end, samples)
+    refine = functools.partial(_refine, search=METHODS[method], func=func,
+                               options={"xtol": xtol, "ftol": ftol, "max_evals": max_evals})
+    if workers == 1:
+        results = _scan(func, x_values, refine, vectorized)
+    else:
+        with (ProcessPoolExecutor if use_processes else ThreadPoolExecutor)(
+                max_workers=workers) as executor:
+            results = _scan(func, x_values, refine, vectorized, executor.map)
+    return sorted(results, key=lambda result: result.fun)
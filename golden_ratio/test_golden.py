@@ -0,0 +1,168 @@
+"""
+Тестирование поиска минимума методом золотого сечения
+
+Функции:
+    exact_minimum - точка минимума искомой функции
+    test_constant - тестирование константы золотого сечения
+    test_golden_algorythm - тестирование метода золотого сечения
+    test_golden_search - тестирование количества вычислений функции
+    test_golden_budget - тестирование ограничения числа вычислений
+    test_golden_bad - тестирование обработки некорректных параметров
+    test_golden_batch - тестирование пакетного метода золотого сечения
+    test_golden_batch_budget - тестирование условий остановки пакетного метода
+    test_brent_search - тестирование метода Брента
+    test_brent_fallback - тестирование шагов золотого сечения в методе Брента
+"""
+import math
+import pytest
+import numpy as np
+from golden_ratio.algorythm import A_VALUE, B_VALUE, GS_VALUE, function, \
+    golden_algorythm, golden_search, golden_search_batch, brent_search
+
+
+def exact_minimum() -> float:
+    """Точка минимума искомой функции, найденная методом Ньютона
+
+    :return: точка минимума
+    """
+    x_value = 0.
+    for _ in range(50):
+        derivative = 2 * x_value + A_VALUE * B_VALUE * np.exp(B_VALUE * x_value)
+        second = 2 + A_VALUE * B_VALUE ** 2 * np.exp(B_VALUE * x_value)
+        x_value -= derivative / second
+    return x_value
+
+
+def test_constant():
+    """Тестирование константы золотого сечения"""
+    assert GS_VALUE ** 2 == pytest.approx(1 - GS_VALUE, rel=1e-15)
+
+
+@pytest.mark.parametrize("eps", [1e-3, 1e-6])
+def test_golden_algorythm(eps: float):
+    """Тестирование метода золотого сечения на искомой функции
+
+    :param eps: точность
+    """
+    assert golden_algorythm(0, 2, eps) == pytest.approx(exact_minimum(), abs=eps)
+    assert golden_algorythm(0, 2, eps, func=lambda x: (x - 1.5) ** 2) == \
+        pytest.approx(1.5, abs=eps)
+
+
+@pytest.mark.parametrize("xtol", [1e-3, 1e-6])
+def test_golden_search(xtol: float):
+    """Тестирование количества вычислений функции
+
+    :param xtol: точность по x
+    """
+    calls = []
+
+    def counted(x_value):
+        calls.append(x_value)
+        return function(x_value)
+
+    result = golden_search(counted, 0, 2, xtol=xtol)
+    assert result.converged
+    assert result.n_evals == len(calls) == result.n_iter + 2
+    assert len(set(calls)) == len(calls)
+    assert result.n_iter == math.ceil(math.log(xtol / 2) / math.log(GS_VALUE))
+    assert result.fun == function(result.x)
+    assert result.x == pytest.approx(exact_minimum(), abs=xtol)
+
+
+def test_golden_budget():
+    """Тестирование ограничения числа вычислений и точности по значению"""
+    result = golden_search(function, 0, 2, xtol=1e-12, max_evals=10)
+    assert not result.converged
+    assert result.n_evals == 10
+    assert result.x == pytest.approx(exact_minimum(), abs=2 * GS_VALUE ** 8)
+    result = golden_search(function, 0, 2, xtol=0, ftol=1e-6)
+    assert result.converged
+    assert result.n_evals < golden_search(function, 0, 2, xtol=1e-9).n_evals
+
+
+def test_golden_bad():
+    """Тестирование обработки некорректных параметров"""
+    with pytest.raises(ValueError):
+        golden_search(function, 0, -1)
+    with pytest.raises(ValueError):
+        golden_search(function, 0, 2, max_evals=1)
+
+
+def test_golden_batch():
+    """Тестирование пакетного метода в сравнении с последовательным"""
+    rng = np.random.default_rng(0)
+    a_values = rng.uniform(1, 8, 200)
+    b_values = rng.uniform(-1, -0.1, 200)
+    ends = rng.uniform(1, 20, 200)
+    sizes = []
+
+    def counted(x_value, a_value, b_value):
+        sizes.append(x_value.size)
+        return function(x_value, a_value, b_value)
+
+    result = golden_search_batch(counted, 0, ends, (a_values, b_values), xtol=1e-6)
+    assert result.x.shape == (200,)
+    assert result.converged.all()
+    assert sum(sizes) == result.n_evals.sum()
+    assert sizes[-1] < 200
+    for index in range(0, 200, 20):
+        expected = golden_search(lambda x, i=index: function(x, a_values[i], b_values[i]),
+                                 0, ends[index], xtol=1e-6)
+        assert result.x[index] == expected.x
+        assert result.fun[index] == expected.fun
+        assert result.n_evals[index] == expected.n_evals
+        assert result.n_iter[index] == expected.n_iter
+
+
+def test_golden_batch_budget():
+    """Тестирование условий остановки и формы результатов пакетного метода"""
+    a_values = np.array([[1.], [4.]])
+    result = golden_search_batch(function, 0, [2, 4, 8], (a_values, B_VALUE),
+                                 xtol=1e-12, max_evals=10)
+    assert result.x.shape == (2, 3)
+    assert not result.converged.any()
+    assert (result.n_evals == 10).all()
+    result = golden_search_batch(function, [0, 0], [2, 2], (A_VALUE, [B_VALUE, -1.]),
+                                 xtol=0, ftol=1e-6)
+    assert result.converged.all()
+    assert result.fun[0] == golden_search(function, 0, 2, xtol=0, ftol=1e-6).fun
+    with pytest.raises(ValueError):
+        golden_search_batch(function, [0, 1], [1, 0])
+
+
+@pytest.mark.parametrize("xtol", [1e-3, 1e-6, 1e-9])
+def test_brent_search(xtol: float):
+    """Тестирование метода Брента в сравнении с методом золотого сечения
+
+    :param xtol: точность по x
+    """
+    calls = []
+
+    def counted(x_value):
+        calls.append(x_value)
+        return function(x_value)
+
+    result = brent_search(counted, 0, 2, xtol=xtol)
+    golden = golden_search(function, 0, 2, xtol=xtol)
+    assert result.converged
+    assert result.n_evals == len(calls) == result.n_iter + 1
+    assert result.fun == function(result.x) <= golden.fun + 1e-12
+    assert result.x == pytest.approx(exact_minimum(), abs=max(xtol, 1e-7))
+    assert result.n_evals * 2 < golden.n_evals
+    assert brent_search(lambda x: (x - 1.5) ** 2, 0, 2, xtol=xtol).x == pytest.approx(1.5)
+
+
+def test_brent_fallback():
+    """Тестирование метода Брента на функциях, где парабола ненадёжна"""
+    result = brent_search(lambda x: abs(x - 0.3), 0, 2, xtol=1e-6)
+    assert result.converged
+    assert result.x == pytest.approx(0.3, abs=1e-6)
+    result = brent_search(lambda x: x, 0, 2, xtol=1e-6)
+    assert result.x == pytest.approx(0, abs=1e-6)
+    result = brent_search(function, 0, 2, xtol=1e-12, max_evals=4)
+    assert not result.converged
+    assert result.n_evals == 4
+    result = brent_search(function, 0, 2, xtol=0, ftol=1e-12)
+    assert result.converged
+    assert result.x == pytest.approx(exact_minimum(), abs=1e-6)
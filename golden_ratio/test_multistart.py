@@ -0,0 +1,78 @@
+"""
+Тестирование поиска всех локальных минимумов
+
+Функции:
+    multimodal - функция с несколькими локальными минимумами
+    test_bracket_minima - тестирование выделения отрезков с минимумами
+    test_find_minima - тестирование поиска всех локальных минимумов
+    test_find_minima_pool - тестирование уточнения в пуле потоков и процессов
+    test_find_minima_bad - тестирование обработки некорректных параметров
+"""
+import pytest
+import numpy as np
+from golden_ratio.multistart import bracket_minima, find_minima
+
+
+def multimodal(x_value):
+    """Функция sin(3x) + 0.1 x^2 с несколькими локальными минимумами
+
+    :param x_value: одно или несколько значений
+    :return: одно или несколько значений
+    """
+    return np.sin(3 * x_value) + 0.1 * x_value ** 2
+
+
+def test_bracket_minima():
+    """Тестирование выделения отрезков с минимумами сетки"""
+    x_values = np.arange(7.)
+    assert bracket_minima(x_values, [3, 1, 2, 0, 0, 1, 0]) == [(0, 2), (2, 4), (5, 6)]
+    assert bracket_minima(x_values, [0, 1, 2, 3, 4, 5, 6]) == [(0, 1)]
+    assert bracket_minima(x_values[:2], [1, 1]) == [(0, 1)]
+    with pytest.raises(ValueError):
+        bracket_minima([0], [1])
+
+
+@pytest.mark.parametrize("method", ["brent", "golden"])
+def test_find_minima(method: str):
+    """Тестирование поиска всех локальных минимумов
+
+    :param method: метод уточнения
+    """
+    results = find_minima(multimodal, -5, 5, samples=51, method=method, xtol=1e-7,
+                          workers=1)
+    grid = np.linspace(-5, 5, 100001)
+    values = np.r_[np.inf, multimodal(grid), np.inf]
+    expected = grid[(values[1:-1] < values[:-2]) & (values[1:-1] < values[2:])]
+    assert len(results) == expected.size
+    assert [result.fun for result in results] == sorted(result.fun for result in results)
+    assert sorted(result.x for result in results) == pytest.approx(expected, abs=1e-4)
+    assert all(result.converged for result in results)
+    derivative = [3 * np.cos(3 * result.x) + 0.2 * result.x for result in results
+                  if abs(result.x) < 5 - 1e-6]
+    assert derivative == pytest.approx(np.zeros(len(derivative)), abs=1e-5)
+
+
+@pytest.mark.parametrize(("workers", "use_processes", "vectorized"), [
+    (None, False, True), (4, False, False), (2, True, True), (2, True, False)
+])
+def test_find_minima_pool(workers: int, use_processes: bool, vectorized: bool):
+    """Тестирование уточнения в пуле потоков и процессов
+
+    :param workers: количество потоков или процессов
+    :param use_processes: использовать ли пул процессов
+    :param vectorized: вычисляется ли функция сразу для массива значений
+    """
+    expected = find_minima(multimodal, -5, 5, workers=1)
+    results = find_minima(multimodal, -5, 5, workers=workers, use_processes=use_processes,
+                          vectorized=vectorized)
+    assert results == expected
+
+
+def test_find_minima_bad():
+    """Тестирование обработки некорректных параметров"""
+    with pytest.raises(ValueError):
+        find_minima(multimodal, -5, 5, method="newton")
+    with pytest.raises(ValueError):
+        find_minima(multimodal, 5, -5)
+    with pytest.raises(ValueError):
+        find_minima(multimodal, -5, 5, samples=1)
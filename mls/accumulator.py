@@ -0,0 +1,278 @@
+"""Потоковая аппроксимация методом наименьших квадратов
+
+Для построения полинома степени d достаточно 2d+1 сумм степеней аргумента,
+d+1 сумм произведений x^k * y и суммы квадратов значений функции, поэтому
+данные можно обрабатывать частями, не загружая их в память целиком.
+Накопленные суммы аддитивны, поэтому накопители, построенные по разным
+частям данных, можно объединять, в том числе полученные в разных процессах.
+
+Классы:
+    MomentAccumulator - накопитель сумм для потоковой аппроксимации
+
+Функции:
+    iter_chunks(str, int) - чтение файла с данными частями
+    fit_chunks(iterable, int) -> MomentAccumulator
+    fit_file(str, int) -> MomentAccumulator
+    parallel_fit(list, int) -> MomentAccumulator
+"""
+import functools
+import typing
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from mls import mls_algorythm as mls
+
+BLOCK_SIZE = 1 << 20
+
+
+class MomentAccumulator:
+    """Накопитель сумм для потоковой аппроксимации полиномом
+
+    Суммы накапливаются по масштабированному аргументу
+    t = (x - shift) / scale, что улучшает обусловленность системы для
+    высоких степеней, если границы данных известны заранее.
+
+    Поля:
+        degree: int - степень полинома
+        shift: float - сдвиг аргумента
+        scale: float - масштаб аргумента
+        count: int - количество обработанных точек
+        power_sums: numpy.ndarray - суммы t^k, k = 0..2d
+        weighted_sums: numpy.ndarray - суммы y * t^k, k = 0..d
+        square_sum: float - сумма y^2
+    Методы:
+        partial_fit(numpy.ndarray, numpy.ndarray) -> MomentAccumulator
+        merge(MomentAccumulator) -> MomentAccumulator
+        system() -> numpy.ndarray
+        solve() -> mls.Polynomial
+        residual(mls.Polynomial) -> float
+    """
+    def __init__(self, degree: int, shift: float = 0., scale: float = 1.):
+        """Конструктор класса
+
+        :param degree: степень полинома
+        :param shift: сдвиг аргумента
+        :param scale: масштаб аргумента
+        """
+        if degree < 1:
+            raise ValueError("degree should be >=1 ")
+        if scale == 0:
+            raise ValueError("scale should be non-zero")
+        self.degree = degree
+        self.shift = float(shift)
+        self.scale = float(scale)
+        self.count = 0
+        self.power_sums = np.zeros(2 * degree + 1)
+        self.weighted_sums = np.zeros(degree + 1)
+        self.square_sum = 0.
+
+    def partial_fit(self, x_chunk: np.ndarray, y_chunk: np.ndarray) -> "MomentAccumulator":
+        """Добавление части данных
+
+        :param x_chunk: значения аргумента
+        :param y_chunk: значения функции
+        :return: текущий накопитель
+        """
+        if len(x_chunk) != len(y_chunk):
+            raise ValueError("x_chunk and y_chunk should have same length")
+        y_chunk = np.asarray(y_chunk, dtype=float)
+        t_chunk = np.asarray(x_chunk, dtype=float)
+        if self.shift != 0 or self.scale != 1:
+            t_chunk = (t_chunk - self.shift) / self.scale
+        self.power_sums += mls.power_sums(t_chunk, self.power_sums.size)
+        self.weighted_sums += mls.power_sums(t_chunk, self.weighted_sums.size, y_chunk)
+        self.square_sum += float(y_chunk @ y_chunk)
+        self.count += y_chunk.size
+        return self
+
+    def merge(self, other: "MomentAccumulator") -> "MomentAccumulator":
+        """Объединение с накопителем, построенным по другой части данных
+
+        :param other: накопитель с теми же степенью, сдвигом и масштабом
+        :return: текущий накопитель
+        """
+        if (other.degree, other.shift, other.scale) != (self.degree, self.shift, self.scale):
+            raise ValueError("accumulators should share degree, shift and scale")
+        self.power_sums += other.power_sums
+        self.weighted_sums += other.weighted_sums
+        self.square_sum += other.square_sum
+        self.count += other.count
+        return self
+
+    def system(self) -> np.ndarray:
+        """Расширенная матрица СЛАУ из накопленных сумм
+
+        :return: СЛАУ в том же виде, что и mls.coefs_calculate
+        """
+        indexes = np.arange(self.degree + 1)
+        system = np.empty((self.degree + 1, self.degree + 2))
+        system[:, :-1] = self.power_sums[indexes[:, None] + indexes]
+        system[:, -1] = self.weighted_sums
+        return system
+
+    def solve(self) -> mls.Polynomial:
+        """Построение полинома по накопленным суммам
+
+        :return: полином в виде mls.Polynomial
+        """
+        return mls.Polynomial(mls.solve_system(self.system()), self.shift, self.scale)
+
+    def residual(self, poly: mls.Polynomial = None) -> float:
+        """Сумма квадратов отклонений, вычисленная по накопленным суммам
+
+        sum((p(x) - y)^2) = sum(y^2) - 2 c * b + c * A * c, где A - матрица
+        сумм степеней, b - суммы y * t^k. При малом отклонении значение
+        теряет точность из-за вычитания близких чисел.
+
+        :param poly: полином, построенный с теми же shift и scale,
+        по умолчанию результат solve()
+        :return: стандартное отклонение
+        """
+        if poly is None:
+            poly = self.solve()
+        elif (poly.shift, poly.scale) != (self.shift, self.scale) \
+                or poly.degree > self.degree:
+            raise ValueError("poly should share shift, scale and degree with accumulator")
+        coefs = poly.coefs
+        size = coefs.size
+        indexes = np.arange(size)
+        matrix = self.power_sums[indexes[:, None] + indexes]
+        value = self.square_sum - 2 * coefs @ self.weighted_sums[:size] + coefs @ matrix @ coefs
+        return max(float(value), 0.)
+
+
+def _iter_values(file: typing.BinaryIO, chunk_size: int) -> typing.Iterator:
+    """Чтение чисел из текущей строки файла массивами фиксированного размера
+
+    :param file: файл, открытый в двоичном режиме на начале строки
+    :param chunk_size: размер массива
+    :return: генератор массивов numpy.ndarray
+    """
+    pending = np.empty(0)
+    tail = b""
+    line_end = False
+    while not line_end:
+        block = file.read(BLOCK_SIZE)
+        newline = block.find(b"\n")
+        if newline >= 0 or not block:
+            block = block[:newline] if newline >= 0 else block
+            line_end = True
+        block = tail + block
+        tail = b""
+        if not line_end:
+            split = max(block.rfind(b" "), block.rfind(b"\t"))
+            block, tail = block[:split + 1], block[split + 1:]
+        tokens = block.split()
+        if tokens:
+            pending = np.concatenate((pending, np.array(tokens).astype(float)))
+        while pending.size >= chunk_size:
+            yield pending[:chunk_size]
+            pending = pending[chunk_size:]
+    if pending.size:
+        yield pending
+
+
+def iter_chunks(path: str, chunk_size: int = 1 << 16) -> typing.Iterator:
+    """Чтение файла с данными частями
+    Формат файла тот же, что и для mls.read_data: \\n
+    x1 x2 x3 ... \\n
+    y1 y2 y3 ...
+
+    Строки аргументов и значений читаются параллельно через два
+    дескриптора файла, в памяти хранится не больше одной части данных.
+
+    :param path: путь к файлу
+    :param chunk_size: количество точек в одной части
+    :return: генератор кортежей (x_chunk, y_chunk)
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size should be >=1 ")
+    with open(path, "rb") as x_file, open(path, "rb") as y_file:
+        while True:
+            block = y_file.read(BLOCK_SIZE)
+            if not block:
+                raise ValueError("file should contain two lines")
+            newline = block.find(b"\n")
+            if newline >= 0:
+                y_file.seek(newline - len(block) + 1, 1)
+                break
+        x_values = _iter_values(x_file, chunk_size)
+        y_values = _iter_values(y_file, chunk_size)
+        for x_chunk in x_values:
+            y_chunk = next(y_values, np.empty(0))
+            if x_chunk.size != y_chunk.size:
+                raise ValueError("x and y lines should have same length")
+            yield x_chunk, y_chunk
+        if next(y_values, None) is not None:
+            raise ValueError("x and y lines should have same length")
+
+
+def fit_chunks(chunks: typing.Iterable, degree: int, shift: float = 0.,
+               scale: float = 1.) -> MomentAccumulator:
+    """Накопление сумм по последовательности частей данных
+
+    :param chunks: итерируемый объект с кортежами (x_chunk, y_chunk)
+    :param degree: степень полинома
+    :param shift: сдвиг аргумента
+    :param scale: масштаб аргумента
+    :return: заполненный накопитель
+    """
+    accumulator = MomentAccumulator(degree, shift, scale)
+    for x_chunk, y_chunk in chunks:
+        accumulator.partial_fit(x_chunk, y_chunk)
+    return accumulator
+
+
+def fit_file(path: str, degree: int, chunk_size: int = 1 << 16,
+             shift: float = 0., scale: float = 1.) -> MomentAccumulator:
+    """Накопление сумм по файлу с данными, прочитанному частями
+
+    :param path: путь к файлу
+    :param degree: степень полинома
+    :param chunk_size: количество точек в одной части
+    :param shift: сдвиг аргумента
+    :param scale: масштаб аргумента
+    :return: заполненный накопитель
+    """
+    return fit_chunks(iter_chunks(path, chunk_size), degree, shift, scale)
+
+
+def _fit_shard(shard, degree: int, chunk_size: int, shift: float,
+               scale: float) -> MomentAccumulator:
+    """Накопление сумм по одной части данных в процессе-исполнителе
+
+    :param shard: путь к файлу или кортеж массивов (x_data, y_data)
+    :param degree: степень полинома
+    :param chunk_size: количество точек в одной части файла
+    :param shift: сдвиг аргумента
+    :param scale: масштаб аргумента
+    :return: заполненный накопитель
+    """
+    if isinstance(shard, str):
+        return fit_file(shard, degree, chunk_size, shift, scale)
+    return MomentAccumulator(degree, shift, scale).partial_fit(*shard)
+
+
+# pylint: disable=too-many-arguments
+def parallel_fit(shards: list, degree: int, processes: int = None, *,
+                 chunk_size: int = 1 << 16, shift: float = 0.,
+                 scale: float = 1.) -> MomentAccumulator:
+    """Накопление сумм по нескольким частям данных в пуле процессов
+
+    Каждая часть обрабатывается в отдельном процессе, полученные
+    накопители объединяются через MomentAccumulator.merge.
+
+    :param shards: список путей к файлам или кортежей (x_data, y_data)
+    :param degree: степень полинома
+    :param processes: количество процессов, по умолчанию число ядер
+    :param chunk_size: количество точек в одной части файла
+    :param shift: сдвиг аргумента
+    :param scale: масштаб аргумента
+    :return: накопитель по всем данным
+    """
+    worker = functools.partial(_fit_shard, degree=degree, chunk_size=chunk_size,
+                               shift=shift, scale=scale)
+    result = MomentAccumulator(degree, shift, scale)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for state in executor.map(worker, shards):
+            result.merge(state)
+    return result
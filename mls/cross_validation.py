@@ -0,0 +1,177 @@
+"""Выбор степени полинома перекрёстной проверкой
+
+Ошибка на обучающих данных всегда уменьшается с ростом степени, поэтому
+степень выбирается по ошибке предсказания на отложенных точках.
+
+Скользящий контроль (leave-one-out) вычисляется без повторного построения
+полиномов: отклонение в точке i при её исключении равно e_i / (1 - h_ii),
+где h_ii - диагональ матрицы проекции. Для вложенных базисов степеней
+0..D диагональ накапливается по столбцам одного QR-разложения.
+
+Для k-блочной проверки по каждому блоку один раз вычисляются моменты в
+базисе Чебышёва, матрица обучающей системы каждого блока получается
+вычитанием моментов блока из общих, и все блоки решаются одним вызовом.
+
+Классы:
+    CrossValidationResult - результат перекрёстной проверки
+
+Функции:
+    loo_scores(list, list, list) -> numpy.ndarray
+    kfold_scores(list, list, list, int) -> numpy.ndarray
+    select_degree(list, list, list, str) -> CrossValidationResult
+"""
+from typing import NamedTuple
+import numpy as np
+from mls import mls_algorythm as mls
+
+
+class CrossValidationResult(NamedTuple):
+    """Результат перекрёстной проверки
+
+    Поля:
+        degrees: numpy.ndarray - проверенные степени
+        scores: numpy.ndarray - средний квадрат ошибки предсказания
+        best_degree: int - степень с наименьшей ошибкой
+    """
+    degrees: np.ndarray
+    scores: np.ndarray
+    best_degree: int
+
+
+def _check_degrees(x_data: list, y_data: list, degrees: list) -> np.ndarray:
+    """Проверка исходных данных и списка степеней
+
+    :param x_data: список значений аргументов исходной функции
+    :param y_data: список значений исходной функции
+    :param degrees: список степеней
+    :return: степени в виде numpy.ndarray
+    """
+    degrees = np.asarray(degrees, dtype=int)
+    if degrees.ndim != 1 or degrees.size == 0:
+        raise ValueError("degrees should be a non-empty list")
+    mls.check_data(x_data, y_data, int(degrees.min()))
+    return degrees
+
+
+def loo_scores(x_data: list, y_data: list, degrees: list) -> np.ndarray:
+    """Ошибка скользящего контроля для каждой степени
+
+    :param x_data: список значений аргументов исходной функции
+    :param y_data: список значений исходной функции
+    :param degrees: список степеней
+    :return: средний квадрат ошибки предсказания по степеням
+    """
+    degrees = _check_degrees(x_data, y_data, degrees)
+    max_degree = int(degrees.max())
+    matrix = mls.design_matrix(x_data, max_degree, "chebyshev")[0]
+    if matrix.shape[0] <= max_degree + 1:
+        raise np.linalg.LinAlgError("Singular matrix")
+    q_matrix, r_matrix = np.linalg.qr(matrix)
+    diagonal = np.abs(np.diag(r_matrix))
+    if diagonal.min() <= matrix.shape[0] * np.finfo(float).eps * diagonal.max():
+        raise np.linalg.LinAlgError("Singular matrix")
+    residual = np.array(y_data, dtype=float)
+    leverage = np.zeros_like(residual)
+    scores = np.empty(max_degree + 1)
+    for degree in range(max_degree + 1):
+        column = q_matrix[:, degree]
+        residual -= column * (column @ residual)
+        leverage += column * column
+        with np.errstate(divide="ignore"):
+            errors = residual / (1 - leverage)
+        scores[degree] = np.mean(errors * errors)
+    return scores[degrees]
+
+
+def _fold_moments(t_data: np.ndarray, y_data: np.ndarray, fold_ids: np.ndarray,
+                  folds: int, max_degree: int) -> tuple:
+    """Моменты в базисе Чебышёва по блокам
+
+    :param t_data: масштабированные аргументы из [-1, 1]
+    :param y_data: значения функции
+    :param fold_ids: номера блоков точек
+    :param folds: количество блоков
+    :param max_degree: максимальная степень
+    :return: суммы T_k(t), k = 0..2D, суммы y * T_k(t), k = 0..D и суммы y^2
+    по блокам, объединённые в кортеж
+    """
+    moments = np.empty((folds, 2 * max_degree + 1))
+    weighted = np.empty((folds, max_degree + 1))
+    previous = np.zeros_like(t_data)
+    current = np.ones_like(t_data)
+    for degree in range(2 * max_degree + 1):
+        moments[:, degree] = np.bincount(fold_ids, current, folds)
+        if degree <= max_degree:
+            weighted[:, degree] = np.bincount(fold_ids, y_data * current, folds)
+        following = (2 if degree else 1) * t_data * current - previous
+        previous, current = current, following
+    squares = np.bincount(fold_ids, y_data * y_data, folds)
+    return moments, weighted, squares
+
+
+# pylint: disable=too-many-arguments, too-many-locals
+def kfold_scores(x_data: list, y_data: list, degrees: list, folds: int = 5, *,
+                 seed: int = 0, fold_ids: np.ndarray = None) -> np.ndarray:
+    """Ошибка k-блочной перекрёстной проверки для каждой степени
+
+    Матрица системы в базисе Чебышёва выражается через моменты:
+    sum(T_i * T_j) = (M_{i+j} + M_{|i-j|}) / 2.
+
+    :param x_data: список значений аргументов исходной функции
+    :param y_data: список значений исходной функции
+    :param degrees: список степеней
+    :param folds: количество блоков
+    :param seed: зерно случайного разбиения на блоки
+    :param fold_ids: номера блоков точек, по умолчанию случайное разбиение
+    :return: средний квадрат ошибки предсказания по степеням
+    """
+    degrees = _check_degrees(x_data, y_data, degrees)
+    if folds < 2:
+        raise ValueError("folds should be >=2 ")
+    size = len(x_data)
+    if fold_ids is None:
+        fold_ids = np.random.default_rng(seed).permutation(size) % folds
+    fold_ids = np.asarray(fold_ids, dtype=np.intp)
+    if fold_ids.shape != (size,) or fold_ids.min() < 0 or fold_ids.max() >= folds:
+        raise ValueError("fold_ids should contain one block number per point")
+    shift, scale = mls.scaling(x_data)
+    t_data = (np.asarray(x_data, dtype=float) - shift) / scale
+    y_data = np.asarray(y_data, dtype=float)
+    moments, weighted, squares = _fold_moments(
+        t_data, y_data, fold_ids, folds, int(degrees.max()))
+    train_moments = moments.sum(axis=0) - moments
+    train_weighted = weighted.sum(axis=0) - weighted
+    scores = np.empty(degrees.size)
+    for index, degree in enumerate(degrees):
+        rows = np.arange(degree + 1)
+        plus, minus = rows[:, None] + rows, np.abs(rows[:, None] - rows)
+        train = (train_moments[:, plus] + train_moments[:, minus]) / 2
+        test = (moments[:, plus] + moments[:, minus]) / 2
+        coefs = np.linalg.solve(train, train_weighted[:, :degree + 1, None])[..., 0]
+        errors = squares - 2 * np.einsum("fi,fi->f", coefs, weighted[:, :degree + 1]) \
+            + np.einsum("fi,fij,fj->f", coefs, test, coefs)
+        scores[index] = np.maximum(errors, 0).sum() / size
+    return scores
+
+
+def select_degree(x_data: list, y_data: list, degrees: list = range(1, 16),
+                  method: str = "loo", *, folds: int = 5,
+                  seed: int = 0) -> CrossValidationResult:
+    """Выбор степени полинома с наименьшей ошибкой предсказания
+
+    :param x_data: список значений аргументов исходной функции
+    :param y_data: список значений исходной функции
+    :param degrees: список степеней
+    :param method: "loo" - скользящий контроль, "kfold" - k-блочная проверка
+    :param folds: количество блоков для "kfold"
+    :param seed: зерно случайного разбиения для "kfold"
+    :return: результат в виде CrossValidationResult
+    """
+    if method == "loo":
+        scores = loo_scores(x_data, y_data, degrees)
+    elif method == "kfold":
+        scores = kfold_scores(x_data, y_data, degrees, folds, seed=seed)
+    else:
+        raise ValueError(f"unknown method {method!r}, expected 'loo' or 'kfold'")
+    degrees = np.asarray(degrees, dtype=int)
+    return CrossValidationResult(degrees, scores, int(degrees[np.argmin(scores)]))
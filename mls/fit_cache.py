@@ -0,0 +1,182 @@
+"""Кэширование построенных полиномов
+
+Ключ кэша - хэш содержимого массивов x и y вместе со степенью полинома и
+способом решения, поэтому повторное построение на тех же данных не решает
+систему заново. Кэш состоит из уровня в памяти с вытеснением давно не
+использованных записей и необязательного уровня на диске, ограниченного
+по суммарному размеру файлов.
+
+Классы:
+    FitCache - двухуровневый кэш полиномов
+
+Функции:
+    fingerprint(list, list, int, str) -> str
+    cached_build_poly(list, list, int, str) -> mls.Polynomial
+"""
+import collections
+import hashlib
+import os
+import numpy as np
+from mls import mls_algorythm as mls
+
+
+def fingerprint(x_data: list, y_data: list, degree: int, method: str = "normal") -> str:
+    """Вычисление ключа кэша по данным и параметрам построения
+
+    :param x_data: список значений аргументов исходной функции
+    :param y_data: список значений исходной функции
+    :param degree: степень полинома
+    :param method: способ решения из mls.SOLVERS
+    :return: шестнадцатеричная строка хэша
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for data in (x_data, y_data):
+        array = np.ascontiguousarray(data, dtype=float)
+        digest.update(str(array.shape).encode())
+        digest.update(memoryview(array).cast("B"))
+    digest.update(f"{degree}:{method}".encode())
+    return digest.hexdigest()
+
+
+class FitCache:
+    """Двухуровневый кэш построенных полиномов
+
+    Возвращаемые полиномы разделяются между вызовами и не должны
+    изменяться.
+
+    Поля:
+        maxsize: int - максимальное количество записей в памяти
+        directory: str - каталог уровня на диске или None
+        max_bytes: int - максимальный суммарный размер файлов на диске
+        hits: int - количество попаданий в память
+        disk_hits: int - количество попаданий на диск
+        misses: int - количество промахов
+    Методы:
+        build_poly(list, list, int, str) -> mls.Polynomial
+        clear()
+    """
+    def __init__(self, maxsize: int = 128, directory: str = None,
+                 max_bytes: int = 64 << 20):
+        """Конструктор класса
+
+        :param maxsize: максимальное количество записей в памяти
+        :param directory: каталог уровня на диске, None - без диска
+        :param max_bytes: максимальный суммарный размер файлов на диске
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize should be >=1 ")
+        self.maxsize = maxsize
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.__memory = collections.OrderedDict()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self.__memory)
+
+    def build_poly(self, x_data: list, y_data: list, degree: int,
+                   method: str = "normal") -> mls.Polynomial:
+        """Построение полинома с использованием кэша
+
+        :param x_data: список значений аргументов исходной функции
+        :param y_data: список значений исходной функции
+        :param degree: степень полинома
+        :param method: способ решения из mls.SOLVERS
+        :return: полином в виде mls.Polynomial
+        """
+        key = fingerprint(x_data, y_data, degree, method)
+        poly = self.__memory.get(key)
+        if poly is not None:
+            self.__memory.move_to_end(key)
+            self.hits += 1
+            return poly
+        poly = self.__load(key)
+        if poly is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            poly = mls.build_poly(x_data, y_data, degree, method)
+            self.__store(key, poly)
+        self.__memory[key] = poly
+        if len(self.__memory) > self.maxsize:
+            self.__memory.popitem(last=False)
+        return poly
+
+    def clear(self):
+        """Очистка кэша в памяти и на диске и сброс счётчиков"""
+        self.__memory.clear()
+        for path, _, _ in self.__disk_entries():
+            os.remove(path)
+        self.hits = self.disk_hits = self.misses = 0
+
+    def __path(self, key: str) -> str:
+        """Путь к файлу записи на диске"""
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def __load(self, key: str):
+        """Чтение записи с диска
+
+        :param key: ключ записи
+        :return: полином или None, если записи нет
+        """
+        if self.directory is None or not os.path.exists(self.__path(key)):
+            return None
+        path = self.__path(key)
+        with np.load(path) as entry:
+            poly = mls.Polynomial(entry["coefs"], float(entry["shift"]), float(entry["scale"]))
+        os.utime(path)
+        return poly
+
+    def __store(self, key: str, poly: mls.Polynomial):
+        """Запись полинома на диск и вытеснение давно не использованных записей
+
+        :param key: ключ записи
+        :param poly: полином
+        """
+        if self.directory is None:
+            return
+        temp = f"{self.__path(key)}.{os.getpid()}.tmp"
+        with open(temp, "wb") as file:
+            np.savez(file, coefs=poly.coefs, shift=poly.shift, scale=poly.scale)
+        os.replace(temp, self.__path(key))
+        entries = sorted(self.__disk_entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    def __disk_entries(self) -> list:
+        """Список записей на диске
+
+        :return: список кортежей (путь, размер, время последнего использования)
+        """
+        if self.directory is None:
+            return []
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".npz"):
+                stat = entry.stat()
+                entries.append((entry.path, stat.st_size, stat.st_mtime_ns))
+        return entries
+
+
+DEFAULT_CACHE = FitCache()
+
+
+def cached_build_poly(x_data: list, y_data: list, degree: int,
+                      method: str = "normal") -> mls.Polynomial:
+    """Построение полинома с использованием общего кэша DEFAULT_CACHE
+
+    :param x_data: список значений аргументов исходной функции
+    :param y_data: список значений исходной функции
+    :param degree: степень полинома
+    :param method: способ решения из mls.SOLVERS
+    :return: полином в виде mls.Polynomial
+    """
+    return DEFAULT_CACHE.build_poly(x_data, y_data, degree, method)
@@ -1,131 +1,560 @@
 """Реализация аппроксимации функции с помощью метода наименьших квадратов
 
+Классы:
+    Polynomial - численный полином, найденный методом наименьших квадратов
+    BatchFit - полиномы для нескольких рядов значений на общей сетке
+
 Функции:
-    coefs_calculate(list, list, int) -> list
-    solve_system(list) -> numpy.ndarray
-    read_data() -> tuple
-    build_poly(list, list, int) -> sympy.Expr
-    std_dev(list, list, sympy.Expr) -> float
+    check_data(list, list, int)
+    power_sums(numpy.ndarray, int, numpy.ndarray) -> numpy.ndarray
+    coefs_calculate(list, list, int) -> numpy.ndarray
+    solve_system(numpy.ndarray | list) -> numpy.ndarray
+    scaling(numpy.ndarray) -> tuple
+    design_matrix(list, int, str) -> tuple
+    solve_lstsq(numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+    condition_number(list, int, str) -> float
+    read_data(str) -> tuple
+    build_poly(list, list, int, str) -> Polynomial
+    horner(numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+    std_dev(list, list, Polynomial | numpy.ndarray | sympy.Expr) -> float
+    build_poly_batch(list, numpy.ndarray, int, str) -> BatchFit
+    std_dev_batch(list, numpy.ndarray, numpy.ndarray) -> numpy.ndarray
     main()
 """
-import sympy as sm
-from sympy import lambdify
+import glob
+import os
+import re
+import sys
+from typing import NamedTuple, TYPE_CHECKING
 import numpy as np
-import matplotlib.pyplot as plt
+from rendering.batch import Curve, Figure, render, variants
 
+if TYPE_CHECKING:
+    import sympy
+
+SOLVERS = ("normal", "qr", "chebyshev")
+
+
+# pylint: disable=import-outside-toplevel
+def _sympy():
+    """Отложенный импорт sympy, нужного только для символьных вычислений
+
+    :return: модуль sympy
+    """
+    import sympy
+    return sympy
 
-def coefs_calculate(x_data: list, y_data: list, degree: int) -> list:
-    """ Формирование СЛАУ для нахождения коэффициентов полинома
+
+def _is_expr(value) -> bool:
+    """Проверка, является ли значение выражением sympy.Expr
+
+    Если sympy ещё не импортирован, значение не может быть его выражением,
+    поэтому sympy для проверки не загружается.
+
+    :param value: проверяемое значение
+    :return: результат проверки
+    """
+    sympy = sys.modules.get("sympy")
+    return sympy is not None and isinstance(value, sympy.Expr)
+
+
+def check_data(x_data: list, y_data: list, degree: int):
+    """Проверка исходных данных для построения полинома
 
     :param x_data: список аргументов целевой функции
     :param y_data: список значений целевой функции
     :param degree: степень полинома
-    :return: СЛАУ в виде двумерного списка
     """
     if len(x_data) != len(y_data):
         raise ValueError("x_data and y_data should have same length")
     if degree < 1:
         raise ValueError("degree should be >=1 ")
-    coefs = []
-    x_data = np.array(x_data)
-    y_data = np.array(y_data)
-    for row in range(degree+1):
-        coefs.append([])
-        for column in range(degree+1):
-            value = (x_data ** (column + row)).sum()
-            coefs[row].append(value)
-        x_value = x_data ** row
-        coefs[row].append((y_data * x_value).sum())
-    return coefs
-
-
-def solve_system(system: list) -> np.ndarray:
+
+
+def power_sums(x_data: np.ndarray, count: int,
+               weights: np.ndarray = None) -> np.ndarray:
+    """Вычисление сумм степеней аргумента накопительным произведением
+
+    :param x_data: массив аргументов
+    :param count: количество сумм (степени от 0 до count-1)
+    :param weights: веса слагаемых, например значения функции
+    :return: массив сумм weights * x^k в виде numpy.ndarray
+    """
+    x_data = np.asarray(x_data, dtype=float)
+    if weights is None:
+        power = np.ones_like(x_data)
+    else:
+        power = np.array(weights, dtype=float)
+    sums = np.empty(count)
+    for deg in range(count):
+        sums[deg] = power.sum()
+        if deg + 1 < count:
+            np.multiply(power, x_data, out=power)
+    return sums
+
+
+def coefs_calculate(x_data: list, y_data: list, degree: int,
+                    *, as_list: bool = False) -> np.ndarray:
+    """ Формирование СЛАУ для нахождения коэффициентов полинома
+
+    Каждая из 2*degree+1 сумм степеней вычисляется один раз, матрица
+    системы (ганкелева) заполняется напрямую из этих сумм.
+
+    :param x_data: список аргументов целевой функции
+    :param y_data: список значений целевой функции
+    :param degree: степень полинома
+    :param as_list: вернуть СЛАУ в виде двумерного списка
+    :return: расширенная матрица СЛАУ в виде numpy.ndarray
+    """
+    check_data(x_data, y_data, degree)
+    x_data = np.asarray(x_data, dtype=float)
+    indexes = np.arange(degree + 1)
+    sums = power_sums(x_data, 2 * degree + 1)
+    system = np.empty((degree + 1, degree + 2))
+    system[:, :-1] = sums[indexes[:, None] + indexes]
+    system[:, -1] = power_sums(x_data, degree + 1, y_data)
+    if as_list:
+        return system.tolist()
+    return system
+
+
+def solve_system(system: np.ndarray) -> np.ndarray:
     """Решение СЛАУ
 
-    :param system: СЛАУ в виде двумерного списка
+    :param system: расширенная матрица СЛАУ в виде numpy.ndarray
+    или двумерного списка
     :return: список коэффициентов в виде numpy.ndarray
     """
-    system = np.array(system)
+    system = np.asarray(system)
     column = system.shape[1]
     matrix = system[:, 0:column-1]
     vector = system[:, column-1]
     return np.linalg.solve(matrix, vector)
 
 
-def read_data(path: str) -> tuple:
+def scaling(x_data: np.ndarray) -> tuple:
+    """Параметры отображения отрезка [min(x), max(x)] на [-1, 1]
+
+    :param x_data: массив аргументов
+    :return: сдвиг и масштаб аргумента, объединённые в кортеж
+    """
+    x_data = np.asarray(x_data, dtype=float)
+    low, high = x_data.min(), x_data.max()
+    scale = (high - low) / 2
+    return float((high + low) / 2), float(scale) if scale > 0 else 1.
+
+
+def design_matrix(x_data: list, degree: int, method: str = "qr") -> tuple:
+    """Формирование матрицы плана в масштабированной переменной
+
+    :param x_data: список аргументов целевой функции
+    :param degree: степень полинома
+    :param method: "qr" - степенной базис, "chebyshev" - базис Чебышёва
+    :return: матрица плана, сдвиг и масштаб аргумента, объединённые в кортеж
+    """
+    shift, scale = scaling(x_data)
+    t_data = (np.asarray(x_data, dtype=float) - shift) / scale
+    if method == "qr":
+        return np.vander(t_data, degree + 1, increasing=True), shift, scale
+    if method == "chebyshev":
+        return np.polynomial.chebyshev.chebvander(t_data, degree), shift, scale
+    raise ValueError(f"unknown method {method!r}, expected one of {SOLVERS[1:]}")
+
+
+def solve_lstsq(matrix: np.ndarray, y_data: np.ndarray) -> np.ndarray:
+    """Решение задачи наименьших квадратов через QR-разложение
+
+    :param matrix: матрица плана
+    :param y_data: значения целевой функции
+    :return: вектор коэффициентов в виде numpy.ndarray
+    """
+    rows, columns = matrix.shape
+    if rows < columns:
+        raise np.linalg.LinAlgError("Singular matrix")
+    q_matrix, r_matrix = np.linalg.qr(matrix)
+    diagonal = np.abs(np.diag(r_matrix))
+    if diagonal.min() <= rows * np.finfo(float).eps * diagonal.max():
+        raise np.linalg.LinAlgError("Singular matrix")
+    return np.linalg.solve(r_matrix, q_matrix.T @ np.asarray(y_data, dtype=float))
+
+
+def condition_number(x_data: list, degree: int, method: str = "normal") -> float:
+    """Число обусловленности задачи для выбранного способа решения
+
+    :param x_data: список аргументов целевой функции
+    :param degree: степень полинома
+    :param method: способ решения из SOLVERS
+    :return: число обусловленности матрицы, с которой работает решатель
+    """
+    if method == "normal":
+        indexes = np.arange(degree + 1)
+        matrix = power_sums(x_data, 2 * degree + 1)[indexes[:, None] + indexes]
+    else:
+        matrix = design_matrix(x_data, degree, method)[0]
+    return float(np.linalg.cond(matrix))
+
+
+def _parse_text(path: str) -> np.ndarray:
+    """Разбор текстового файла с данными
+
+    :param path: путь к файлу
+    :return: массив формы (2, n)
+    """
+    data = np.loadtxt(path, dtype=float, max_rows=2, ndmin=2)
+    if data.shape[0] != 2:
+        raise ValueError("file should contain two lines")
+    return data
+
+
+def _read_cached(path: str) -> np.ndarray:
+    """Чтение текстового файла через двоичную копию рядом с ним
+
+    Имя копии содержит размер и время изменения исходного файла, поэтому
+    изменённый файл разбирается заново, а устаревшие копии удаляются.
+
+    :param path: путь к файлу
+    :return: массив формы (2, n), отображённый в память
+    """
+    stat = os.stat(path)
+    sidecar = f"{path}.{stat.st_size}-{stat.st_mtime_ns}.npy"
+    if not os.path.exists(sidecar):
+        data = _parse_text(path)
+        pattern = re.compile(rf"{re.escape(path)}\.\d+-\d+\.npy")
+        for stale in glob.glob(f"{glob.escape(path)}.*-*.npy"):
+            if pattern.fullmatch(stale):
+                os.remove(stale)
+        temp = f"{sidecar}.{os.getpid()}.tmp"
+        with open(temp, "wb") as file:
+            np.save(file, data)
+        os.replace(temp, sidecar)
+    return np.load(sidecar, mmap_mode="r")
+
+
+def read_data(path: str, *, cache: bool = False) -> tuple:
     """Считывание исходных данных из файла
-    Формат файла: \n
+    Формат текстового файла (разделитель - любые пробельные символы): \n
     x1 x2 x3 ... \n
     y1 y2 y3 ...
 
-    :return: список значений аргументов функции и список
+    Файлы .npy с массивом формы (2, n) и двоичные файлы .bin/.raw
+    (n значений x, затем n значений y в формате float64) отображаются
+    в память без копирования.
+
+    :param path: путь к файлу
+    :param cache: сохранять разобранный текстовый файл в двоичную копию
+    :return: массив значений аргументов функции и массив
     значений функции, объединённые в кортеж
     """
-    with open(path, "r", encoding="utf-8") as file:
-        x_data = [float(i) for i in file.readline().split(" ")]
-        y_data = [float(i) for i in file.readline().split(" ")]
-        return x_data, y_data
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".npy":
+        data = np.load(path, mmap_mode="r")
+    elif extension in (".bin", ".raw"):
+        data = np.memmap(path, dtype=np.float64, mode="r")
+        if data.size % 2:
+            raise ValueError("binary file should contain 2*n values")
+        data = data.reshape(2, -1)
+    elif cache:
+        data = _read_cached(path)
+    else:
+        data = _parse_text(path)
+    if data.ndim != 2 or data.shape[0] != 2:
+        raise ValueError("data should have shape (2, n)")
+    return data[0], data[1]
 
 
-def build_poly(x_data: list, y_data: list, degree: int) -> sm.Expr:
+def build_poly(x_data: list, y_data: list, degree: int,
+               method: str = "normal") -> "Polynomial":
     """Построение аппроксимирующего полинома
 
+    Способы решения:
+        "normal" - нормальные уравнения, самый быстрый способ;
+        "qr" - QR-разложение матрицы плана в масштабированной переменной;
+        "chebyshev" - QR-решение в базисе полиномов Чебышёва на [-1, 1].
+    Число обусловленности нормальных уравнений равно квадрату
+    обусловленности матрицы плана, поэтому для высоких степеней или
+    аргументов, далёких от нуля, следует выбирать "qr" или "chebyshev".
+
     :param x_data: список значений аргументов исходной функции
     :param y_data: список значений исходной функции
     :param degree: степень полинома
-    :return: полином в виде sympy.Expr
+    :param method: способ решения из SOLVERS
+    :return: полином в виде Polynomial
+    """
+    if method == "normal":
+        coefs_matrix = coefs_calculate(x_data, y_data, degree)
+        return Polynomial(solve_system(coefs_matrix))
+    check_data(x_data, y_data, degree)
+    matrix, shift, scale = design_matrix(x_data, degree, method)
+    coefs = solve_lstsq(matrix, y_data)
+    if method == "chebyshev":
+        coefs = np.polynomial.chebyshev.cheb2poly(coefs)
+    return Polynomial(coefs, shift, scale)
+
+
+def horner(coefs: np.ndarray, x_values: np.ndarray) -> np.ndarray:
+    """Вычисление значений полинома по схеме Горнера сразу для всего массива
+
+    :param coefs: коэффициенты полинома по возрастанию степеней
+    :param x_values: значения аргумента
+    :return: значения полинома в виде numpy.ndarray
     """
-    coefs_matrix = coefs_calculate(x_data, y_data, degree)
-    coefs = solve_system(coefs_matrix)
+    coefs = np.asarray(coefs, dtype=float)
+    x_values = np.asarray(x_values, dtype=float)
+    result = np.full_like(x_values, coefs[-1])
+    for coef in coefs[-2::-1]:
+        result *= x_values
+        result += coef
+    return result
+
+
+def _expr_coefs(expr: "sympy.Expr"):
+    """Извлечение коэффициентов полинома из sympy.Expr
+
+    :param expr: выражение от символа x
+    :return: коэффициенты по возрастанию степеней или None,
+    если выражение не является полиномом от x
+    """
+    sm = _sympy()
     x_sym = sm.symbols("x")
-    expr = 0 * x_sym
-    for deg in range(degree+1):
-        expr += coefs[deg] * x_sym ** deg
-    return expr
+    if not expr.free_symbols <= {x_sym} or not expr.is_polynomial(x_sym):
+        return None
+    return np.array(sm.Poly(expr, x_sym).all_coeffs()[::-1], dtype=float)
+
+
+class Polynomial:
+    """Численный полином с коэффициентами в виде numpy.ndarray
+
+    Полином задаётся в масштабированной переменной t = (x - shift) / scale:
+    p(x) = sum(coefs[k] * t^k). При shift=0 и scale=1 это обычный
+    полином от x. Символьное выражение sympy строится только при
+    обращении к полю expr.
+
+    Поля:
+        coefs: numpy.ndarray - коэффициенты по возрастанию степеней t
+        shift: float - сдвиг аргумента
+        scale: float - масштаб аргумента
+        degree: int - степень полинома
+        expr: sympy.Expr - полином в символьном виде
+    Методы:
+        derivative() -> Polynomial
+        integral(float) -> Polynomial
+    """
+    __slots__ = ("coefs", "shift", "scale", "_expr")
+
+    def __init__(self, coefs: np.ndarray, shift: float = 0., scale: float = 1.):
+        """Конструктор класса
+
+        :param coefs: коэффициенты полинома по возрастанию степеней
+        :param shift: сдвиг аргумента
+        :param scale: масштаб аргумента
+        """
+        self.coefs = np.ascontiguousarray(coefs, dtype=float)
+        if self.coefs.ndim != 1 or self.coefs.size == 0:
+            raise ValueError("coefs should be a non-empty one-dimensional array")
+        if scale == 0:
+            raise ValueError("scale should be non-zero")
+        self.shift = float(shift)
+        self.scale = float(scale)
+        self._expr = None
+
+    def __call__(self, x_values):
+        """Вычисление значений полинома
+
+        :param x_values: одно или несколько значений аргумента
+        :return: значения полинома
+        """
+        if self.shift == 0 and self.scale == 1:
+            return horner(self.coefs, x_values)
+        x_values = np.asarray(x_values, dtype=float)
+        return horner(self.coefs, (x_values - self.shift) / self.scale)
+
+    def __repr__(self) -> str:
+        if self.shift == 0 and self.scale == 1:
+            return f"Polynomial({self.coefs.tolist()})"
+        return f"Polynomial({self.coefs.tolist()}, shift={self.shift}, scale={self.scale})"
+
+    def __str__(self) -> str:
+        return str(self.expr)
+
+    @property
+    def degree(self) -> int:
+        """Степень полинома"""
+        return self.coefs.size - 1
+
+    @property
+    def expr(self) -> "sympy.Expr":
+        """Полином в виде sympy.Expr, строится при первом обращении"""
+        if self._expr is None:
+            sm = _sympy()
+            x_sym = sm.symbols("x")
+            t_sym = x_sym
+            if self.shift != 0 or self.scale != 1:
+                t_sym = (x_sym - self.shift) / self.scale
+            expr = 0 * x_sym
+            for deg, coef in enumerate(self.coefs):
+                expr += coef * t_sym ** deg
+            if t_sym is not x_sym:
+                expr = sm.expand(expr)
+            self._expr = expr
+        return self._expr
+
+    def derivative(self) -> "Polynomial":
+        """Производная полинома
+
+        :return: полином-производная
+        """
+        if self.degree == 0:
+            return Polynomial(np.zeros(1), self.shift, self.scale)
+        coefs = self.coefs[1:] * np.arange(1, self.coefs.size) / self.scale
+        return Polynomial(coefs, self.shift, self.scale)
 
+    def integral(self, constant: float = 0.) -> "Polynomial":
+        """Первообразная полинома
 
-def std_dev(x_data: list, y_data: list, expr: sm.Expr) -> float:
+        :param constant: значение первообразной в точке shift
+        (в нуле для полинома от x)
+        :return: полином-первообразная
+        """
+        coefs = np.empty(self.coefs.size + 1)
+        coefs[0] = constant
+        coefs[1:] = self.coefs * self.scale / np.arange(1, self.coefs.size + 1)
+        return Polynomial(coefs, self.shift, self.scale)
+
+
+def _symbolic_std_dev(x_data: list, y_data: list, expr: "sympy.Expr"):
+    """Вычисление стандартного отклонения подстановкой в sympy.Expr
+
+    :param x_data: список значений аргументов исходной функции
+    :param y_data: список значений исходной функции
+    :param expr: функция в виде sympy.Expr
+    :return: стандартное отклонение
+    """
+    x_sym = _sympy().symbols("x")
+    result = 0
+    for current_x, current_y in zip(x_data, y_data):
+        func_value = expr.subs(x_sym, current_x)
+        result += (func_value - current_y)**2
+    return result
+
+
+def std_dev(x_data: list, y_data: list, expr, *, symbolic: bool = False) -> float:
     """Вычисление стандартного отклонения найденного полинома
 
+    Полином вычисляется по схеме Горнера сразу для всего массива x_data.
+    Выражения sympy, не являющиеся полиномом от x, а также вызов с
+    symbolic=True вычисляются поточечной подстановкой.
+
     :param x_data: список значений аргументов исходной функции
     :param y_data: список значений исходной функции
-    :param expr: полином в виде sympy.Expr
+    :param expr: полином в виде Polynomial, коэффициенты полинома в виде
+    numpy.ndarray или sympy.Expr
+    :param symbolic: вычислять ли отклонение подстановкой в sympy.Expr
     :return: стандартное отклонение
     """
     if len(x_data) != len(y_data):
         raise ValueError("x and y must be the same length")
-    if not isinstance(expr, sm.Expr):
+    if isinstance(expr, Polynomial):
+        if symbolic:
+            return _symbolic_std_dev(x_data, y_data, expr.expr)
+    elif isinstance(expr, np.ndarray):
+        expr = Polynomial(expr)
+    elif _is_expr(expr):
+        coefs = None if symbolic else _expr_coefs(expr)
+        if coefs is None:
+            return _symbolic_std_dev(x_data, y_data, expr)
+        expr = Polynomial(coefs)
+    else:
         raise TypeError(f"expr must be an expression, but it is {type(expr)}")
-    result = 0
-    for _, (current_x, current_y) in enumerate(zip(x_data, y_data)):
-        func_value = expr.subs(sm.symbols("x"), current_x)
-        result += (func_value - current_y)**2
-    return result
+    residual = expr(x_data) - np.asarray(y_data, dtype=float)
+    return float((residual ** 2).sum())
 
 
-# pylint: disable=too-many-instance-attributes
-def plot(x_val: np.ndarray, np_poly2, np_poly3, x_data: list, y_data: list):
+class BatchFit(NamedTuple):
+    """Полиномы одной степени для нескольких рядов значений на общей сетке
+
+    Поля:
+        coefs: numpy.ndarray - матрица коэффициентов (ряды x степени t)
+        residuals: numpy.ndarray - стандартные отклонения по рядам
+        shift: float - сдвиг аргумента
+        scale: float - масштаб аргумента
+    Методы:
+        poly(int) -> Polynomial
     """
-    Отрисовка графика двух полиномов и точек
-    :param x_val: диапазон аргумента
-    :param np_poly2: функция первого полинома
-    :param np_poly3: функция второго полинома
-    :param x_data: координаты по оси абсцисс исходных точек
-    :param y_data: координаты по оси ординат исходных точек
+    coefs: np.ndarray
+    residuals: np.ndarray
+    shift: float = 0.
+    scale: float = 1.
+
+    def poly(self, index: int) -> Polynomial:
+        """Полином для одного ряда значений
+
+        :param index: номер ряда
+        :return: полином в виде Polynomial
+        """
+        return Polynomial(self.coefs[index], self.shift, self.scale)
+
+
+def build_poly_batch(x_data: list, y_data: np.ndarray, degree: int,
+                     method: str = "normal") -> BatchFit:
+    """Построение полиномов для нескольких рядов значений на общей сетке
+
+    Матрица системы (или QR-разложение матрицы плана) зависит только от
+    x_data, поэтому она разлагается один раз, а все ряды решаются
+    одним вызовом с матричной правой частью.
+
+    :param x_data: список значений аргументов исходной функции
+    :param y_data: двумерный массив значений (ряды x точки)
+    :param degree: степень полинома
+    :param method: способ решения из SOLVERS
+    :return: коэффициенты и отклонения в виде BatchFit
     """
-    fig = plt.figure(figsize=(7, 7))
-    axis = fig.add_subplot(1, 1, 1)
+    y_data = np.asarray(y_data, dtype=float)
+    if y_data.ndim != 2 or y_data.shape[0] == 0:
+        raise ValueError("y_data should be a non-empty two-dimensional array")
+    check_data(x_data, y_data[0], degree)
+    if method == "normal":
+        shift, scale = 0., 1.
+        indexes = np.arange(degree + 1)
+        matrix = power_sums(x_data, 2 * degree + 1)[indexes[:, None] + indexes]
+        vander = np.vander(np.asarray(x_data, dtype=float), degree + 1, increasing=True)
+        coefs = np.linalg.solve(matrix, (y_data @ vander).T).T
+    else:
+        matrix, shift, scale = design_matrix(x_data, degree, method)
+        coefs = solve_lstsq(matrix, y_data.T).T
+        if method == "chebyshev":
+            conversion = np.zeros((degree + 1, degree + 1))
+            for row in range(degree + 1):
+                conversion[row, :row + 1] = np.polynomial.chebyshev.cheb2poly(
+                    np.eye(degree + 1)[row])
+            coefs = coefs @ conversion
+    residuals = std_dev_batch(x_data, y_data, coefs, shift, scale)
+    return BatchFit(np.ascontiguousarray(coefs), residuals, shift, scale)
 
-    axis.spines['left'].set_position(("data", 0.0))
-    axis.spines['bottom'].set_position(("data", 0.0))
-    axis.spines['right'].set_color('none')
-    axis.spines['top'].set_color('none')
 
-    axis.plot(x_val, np_poly2(x_val), '--', label="Poly2")
-    axis.plot(x_val, np_poly3(x_val), label="Poly3")
-    axis.plot(x_data, y_data, "ro")
+def std_dev_batch(x_data: list, y_data: np.ndarray, coefs: np.ndarray,
+                  shift: float = 0., scale: float = 1.) -> np.ndarray:
+    """Вычисление стандартных отклонений сразу для нескольких полиномов
 
-    axis.legend()
+    :param x_data: список значений аргументов исходной функции
+    :param y_data: двумерный массив значений (ряды x точки)
+    :param coefs: матрица коэффициентов (ряды x степени)
+    :param shift: сдвиг аргумента
+    :param scale: масштаб аргумента
+    :return: массив стандартных отклонений по рядам
+    """
+    y_data = np.asarray(y_data, dtype=float)
+    coefs = np.asarray(coefs, dtype=float)
+    if y_data.ndim != 2 or y_data.shape[1] != len(x_data):
+        raise ValueError("y_data should have shape (series, len(x_data))")
+    if coefs.ndim != 2 or coefs.shape[0] != y_data.shape[0]:
+        raise ValueError("coefs should have one row per series")
+    t_data = (np.asarray(x_data, dtype=float) - shift) / scale
+    values = np.repeat(coefs[:, -1:], t_data.size, axis=1)
+    for column in range(coefs.shape[1] - 2, -1, -1):
+        values *= t_data
+        values += coefs[:, column:column + 1]
+    values -= y_data
+    return np.einsum("ij,ij->i", values, values)
 
 
 def main():
@@ -141,23 +570,15 @@ def main():
     print("2-degree", std_dev(x_data, y_data, poly2))
     print("3-degree", std_dev(x_data, y_data, poly3))
 
-    np_poly2 = lambdify(tuple(poly2.atoms(sm.Symbol)), poly2, modules=['numpy'])
-    np_poly3 = lambdify(tuple(poly3.atoms(sm.Symbol)), poly3, modules=['numpy'])
-
-    x_val = np.linspace(-10, 10, 200)
-    plot(x_val, np_poly2, np_poly3, x_data, y_data)
-    plt.savefig("../graphics/mls_all.jpg")
-    plt.style.use('dark_background')
-    plot(x_val, np_poly2, np_poly3, x_data, y_data)
-    plt.savefig("../graphics/mls_all_dark.jpg")
-
-    x_val = np.linspace(0,2.1, 100)
-    plt.style.use('default')
-    plot(x_val, np_poly2, np_poly3, x_data, y_data)
-    plt.savefig("../graphics/mls_points.jpg")
-    plt.style.use('dark_background')
-    plot(x_val, np_poly2, np_poly3, x_data, y_data)
-    plt.savefig("../graphics/mls_points_dark.jpg")
+    figures = []
+    for x_val, name in ((np.linspace(-10, 10, 200), "mls_all"),
+                        (np.linspace(0, 2.1, 100), "mls_points")):
+        curves = (Curve(x_val, poly2(x_val), "--", "Poly2"),
+                  Curve(x_val, poly3(x_val), label="Poly3"),
+                  Curve(x_data, y_data, "ro"))
+        figures += variants(Figure(f"../graphics/{name}.jpg", curves,
+                                   size=(7, 7), axes_at_zero=True))
+    render(figures)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,166 @@
+"""Тесты для проверки потоковой аппроксимации accumulator.py
+
+Классы:
+    TestAccumulator
+    TestChunks
+    TestParallel
+"""
+import pytest
+import numpy as np
+from mls import accumulator
+from mls.accumulator import MomentAccumulator, iter_chunks, fit_chunks, fit_file, \
+    parallel_fit
+from mls.mls_algorythm import build_poly, coefs_calculate, read_data, std_dev
+
+
+class TestAccumulator:
+    """Тесты для накопителя сумм
+
+    Методы:
+        test_system(int, int)
+        test_solve(float, float)
+        test_bad(int, float)
+    """
+    x_data = np.linspace(-1, 3, 101)
+    y_data = np.cos(x_data) + 0.3 * x_data
+
+    @pytest.mark.parametrize(("degree", "chunk_size"), [(1, 7), (3, 50), (4, 101)])
+    def test_system(self, degree, chunk_size):
+        """Проверка совпадения СЛАУ с построенной по всем данным сразу
+
+        :param degree: степень полинома
+        :param chunk_size: размер части данных
+        :return: None
+        """
+        chunks = ((self.x_data[i:i + chunk_size], self.y_data[i:i + chunk_size])
+                  for i in range(0, self.x_data.size, chunk_size))
+        result = fit_chunks(chunks, degree)
+        assert result.count == self.x_data.size
+        assert result.system() == pytest.approx(
+            coefs_calculate(self.x_data, self.y_data, degree))
+
+    @pytest.mark.parametrize(("shift", "scale"), [(0, 1), (1, 2)])
+    def test_solve(self, shift, scale):
+        """Проверка полинома и отклонения, найденных по накопленным суммам
+
+        :param shift: сдвиг аргумента
+        :param scale: масштаб аргумента
+        :return: None
+        """
+        result = MomentAccumulator(3, shift, scale)
+        result.partial_fit(self.x_data[:30], self.y_data[:30])
+        result.partial_fit(self.x_data[30:], self.y_data[30:])
+        expected = build_poly(self.x_data, self.y_data, 3)
+        poly = result.solve()
+        assert poly(self.x_data) == pytest.approx(expected(self.x_data))
+        assert result.residual() == pytest.approx(
+            std_dev(self.x_data, self.y_data, expected), rel=1e-6)
+
+    @pytest.mark.parametrize(("degree", "scale"), [(0, 1), (2, 0)])
+    def test_bad(self, degree, scale):
+        """Проверка обработки некорректных параметров
+
+        :param degree: степень полинома
+        :param scale: масштаб аргумента
+        :return: None
+        """
+        with pytest.raises(ValueError):
+            MomentAccumulator(degree, scale=scale)
+
+
+class TestChunks:
+    """Тесты для чтения файла частями
+
+    Методы:
+        test_chunks(int, int)
+        test_fit_file()
+        test_bad(str)
+    """
+    @pytest.mark.parametrize(("chunk_size", "block_size"), [(3, 5), (7, 1 << 20), (100, 16)])
+    def test_chunks(self, monkeypatch, chunk_size, block_size):
+        """Проверка совпадения с чтением файла целиком
+
+        :param chunk_size: размер части данных
+        :param block_size: размер блока чтения файла
+        :return: None
+        """
+        monkeypatch.setattr(accumulator, "BLOCK_SIZE", block_size)
+        x_data, y_data = read_data("mls/mls_data.txt")
+        chunks = list(iter_chunks("mls/mls_data.txt", chunk_size))
+        assert all(x.size == chunk_size for x, _ in chunks[:-1])
+        assert np.concatenate([x for x, _ in chunks]).tolist() == list(x_data)
+        assert np.concatenate([y for _, y in chunks]).tolist() == list(y_data)
+
+    def test_fit_file(self):
+        """Проверка построения полинома по файлу
+
+        :return: None
+        """
+        x_data, y_data = read_data("mls/mls_data.txt")
+        poly = fit_file("mls/mls_data.txt", 2, chunk_size=6).solve()
+        assert poly(np.array(x_data)) == pytest.approx(build_poly(x_data, y_data, 2)(x_data))
+
+    @pytest.mark.parametrize("content", ["1 2 3\n4 5\n", "1 2 3"])
+    def test_bad(self, tmp_path, content):
+        """Проверка обработки некорректных файлов
+
+        :param content: содержимое файла
+        :return: None
+        """
+        path = tmp_path / "data.txt"
+        path.write_text(content)
+        with pytest.raises(ValueError):
+            list(iter_chunks(str(path), 2))
+
+
+class TestParallel:
+    """Тесты для объединения накопителей и параллельного построения
+
+    Методы:
+        test_merge()
+        test_merge_bad()
+        test_parallel()
+    """
+    x_data = np.linspace(0, 4, 300)
+    y_data = np.exp(-x_data) + 0.1 * x_data
+
+    def test_merge(self):
+        """Проверка совпадения объединённых накопителей с общим
+
+        :return: None
+        """
+        first = MomentAccumulator(3).partial_fit(self.x_data[:100], self.y_data[:100])
+        second = MomentAccumulator(3).partial_fit(self.x_data[100:], self.y_data[100:])
+        expected = MomentAccumulator(3).partial_fit(self.x_data, self.y_data)
+        merged = first.merge(second)
+        assert merged.count == expected.count
+        assert merged.system() == pytest.approx(expected.system())
+        assert merged.residual() == pytest.approx(expected.residual())
+
+    def test_merge_bad(self):
+        """Проверка запрета объединения несовместимых накопителей
+
+        :return: None
+        """
+        with pytest.raises(ValueError):
+            MomentAccumulator(3).merge(MomentAccumulator(2))
+        with pytest.raises(ValueError):
+            MomentAccumulator(3).merge(MomentAccumulator(3, shift=1))
+
+    def test_parallel(self, tmp_path):
+        """Проверка построения полинома по файлам в пуле процессов
+
+        :return: None
+        """
+        shards = []
+        for index in range(3):
+            path = tmp_path / f"shard{index}.txt"
+            part = slice(index * 100, (index + 1) * 100)
+            path.write_text(" ".join(map(str, self.x_data[part])) + "\n"
+                            + " ".join(map(str, self.y_data[part])) + "\n")
+            shards.append(str(path))
+        shards.append((self.x_data[:0], self.y_data[:0]))
+        result = parallel_fit(shards, 4, processes=2, shift=2, scale=2)
+        expected = build_poly(self.x_data, self.y_data, 4)
+        assert result.count == self.x_data.size
+        assert result.solve()(self.x_data) == pytest.approx(expected(self.x_data))
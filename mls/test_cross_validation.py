@@ -0,0 +1,127 @@
+"""Тесты для проверки перекрёстной проверки cross_validation.py
+
+Классы:
+    TestLoo
+    TestKFold
+    TestSelect
+"""
+import pytest
+import numpy as np
+from mls.cross_validation import loo_scores, kfold_scores, select_degree
+from mls.mls_algorythm import build_poly
+
+X_DATA = np.linspace(-2, 3, 40)
+Y_DATA = 0.5 * X_DATA ** 3 - X_DATA + np.random.default_rng(0).normal(0, 0.5, 40)
+
+
+class TestLoo:
+    """Тесты для скользящего контроля
+
+    Методы:
+        test_good(list)
+        test_bad(list, list, list)
+    """
+    @pytest.mark.parametrize("degrees", [[1, 2, 3], [4, 6], [3]])
+    def test_good(self, degrees):
+        """Проверка совпадения с построением полиномов без каждой точки
+
+        :param degrees: список степеней
+        :return: None
+        """
+        expected = []
+        for degree in degrees:
+            errors = []
+            for index in range(X_DATA.size):
+                poly = build_poly(np.delete(X_DATA, index), np.delete(Y_DATA, index),
+                                  degree, "qr")
+                errors.append((poly(X_DATA[index]) - Y_DATA[index]) ** 2)
+            expected.append(np.mean(errors))
+        assert loo_scores(X_DATA, Y_DATA, degrees) == pytest.approx(expected)
+
+    @pytest.mark.parametrize(
+        ("x_data", "y_data", "degrees", "exception"), [
+            ([1, 2, 3], [1, 2], [1], ValueError),
+            ([1, 2, 3], [1, 2, 3], [], ValueError),
+            ([1, 2, 3], [1, 2, 3], [0, 1], ValueError),
+            ([1, 2, 3], [1, 2, 3], [2], np.linalg.LinAlgError)
+        ]
+    )
+    def test_bad(self, x_data, y_data, degrees, exception):
+        """Проверка обработки некорректных данных
+
+        :param x_data: список значений аргументов
+        :param y_data: список значений функции
+        :param degrees: список степеней
+        :param exception: ожидаемая ошибка
+        :return: None
+        """
+        with pytest.raises(exception):
+            loo_scores(x_data, y_data, degrees)
+
+
+class TestKFold:
+    """Тесты для k-блочной проверки
+
+    Методы:
+        test_good(int, list)
+        test_bad(int, list)
+    """
+    @pytest.mark.parametrize(("folds", "degrees"), [(4, [1, 2, 3]), (5, [5, 2])])
+    def test_good(self, folds, degrees):
+        """Проверка совпадения с построением полиномов по каждому блоку
+
+        :param folds: количество блоков
+        :param degrees: список степеней
+        :return: None
+        """
+        fold_ids = np.arange(X_DATA.size) % folds
+        expected = []
+        for degree in degrees:
+            error = 0
+            for fold in range(folds):
+                train = fold_ids != fold
+                poly = build_poly(X_DATA[train], Y_DATA[train], degree, "qr")
+                error += ((poly(X_DATA[~train]) - Y_DATA[~train]) ** 2).sum()
+            expected.append(error / X_DATA.size)
+        result = kfold_scores(X_DATA, Y_DATA, degrees, folds, fold_ids=fold_ids)
+        assert result == pytest.approx(expected)
+
+    @pytest.mark.parametrize(("folds", "fold_ids"), [(1, None), (3, [0, 1, 3])])
+    def test_bad(self, folds, fold_ids):
+        """Проверка обработки некорректных параметров
+
+        :param folds: количество блоков
+        :param fold_ids: номера блоков точек
+        :return: None
+        """
+        with pytest.raises(ValueError):
+            kfold_scores([1, 2, 3], [1, 2, 3], [1], folds, fold_ids=fold_ids)
+
+
+class TestSelect:
+    """Тесты для выбора степени
+
+    Методы:
+        test_good(str)
+        test_bad()
+    """
+    @pytest.mark.parametrize("method", ["loo", "kfold"])
+    def test_good(self, method):
+        """Проверка выбора степени зашумлённого кубического полинома
+
+        :param method: способ проверки
+        :return: None
+        """
+        x_data = np.linspace(-3, 5, 2000)
+        y_data = 0.5 * x_data ** 3 - x_data + np.random.default_rng(1).normal(0, 1, x_data.size)
+        result = select_degree(x_data, y_data, range(1, 8), method)
+        assert result.best_degree == 3
+        assert result.scores.shape == (7,)
+
+    def test_bad(self):
+        """Проверка обработки неизвестного способа проверки
+
+        :return: None
+        """
+        with pytest.raises(ValueError):
+            select_degree(X_DATA, Y_DATA, method="holdout")
@@ -0,0 +1,120 @@
+"""Тесты для проверки кэширования полиномов fit_cache.py
+
+Классы:
+    TestFingerprint
+    TestFitCache
+"""
+import pytest
+import numpy as np
+from mls.fit_cache import FitCache, fingerprint
+from mls.mls_algorythm import build_poly
+
+
+class TestFingerprint:
+    """Тесты для ключа кэша
+
+    Методы:
+        test_equal()
+        test_different(list, list, int, str)
+    """
+    x_data = [1, 2, 3, 4]
+    y_data = [2, 3, 5, 4]
+
+    def test_equal(self):
+        """Проверка совпадения ключей для одинаковых данных разных типов
+
+        :return: None
+        """
+        assert fingerprint(self.x_data, self.y_data, 2) == fingerprint(
+            np.array(self.x_data, dtype=float), tuple(self.y_data), 2, "normal")
+
+    @pytest.mark.parametrize(
+        ("x_data", "y_data", "degree", "method"), [
+            ([1, 2, 3, 5], [2, 3, 5, 4], 2, "normal"),
+            ([1, 2, 3, 4], [2, 3, 5, 4], 3, "normal"),
+            ([1, 2, 3, 4], [2, 3, 5, 4], 2, "qr"),
+            ([1, 2, 3], [4, 2, 3, 5, 4], 2, "normal")
+        ]
+    )
+    def test_different(self, x_data, y_data, degree, method):
+        """Проверка различия ключей для разных данных и параметров
+
+        :param x_data: список значений аргументов
+        :param y_data: список значений функции
+        :param degree: степень полинома
+        :param method: способ решения
+        :return: None
+        """
+        assert fingerprint(self.x_data, self.y_data, 2) != fingerprint(
+            x_data, y_data, degree, method)
+
+
+class TestFitCache:
+    """Тесты для двухуровневого кэша
+
+    Методы:
+        test_memory()
+        test_eviction()
+        test_disk()
+        test_disk_eviction()
+        test_bad()
+    """
+    x_data = np.linspace(0, 2, 30)
+    y_data = np.exp(x_data)
+
+    def test_memory(self):
+        """Проверка попаданий в кэш в памяти
+
+        :return: None
+        """
+        cache = FitCache()
+        first = cache.build_poly(self.x_data, self.y_data, 3)
+        second = cache.build_poly(self.x_data.copy(), self.y_data.copy(), 3)
+        assert second is first
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert first(self.x_data) == pytest.approx(
+            build_poly(self.x_data, self.y_data, 3)(self.x_data))
+
+    def test_eviction(self):
+        """Проверка вытеснения давно не использованных записей
+
+        :return: None
+        """
+        cache = FitCache(maxsize=2)
+        for degree in (1, 2, 1, 3, 1, 2):
+            cache.build_poly(self.x_data, self.y_data, degree)
+        assert len(cache) == 2
+        assert (cache.hits, cache.misses) == (2, 4)
+
+    def test_disk(self, tmp_path):
+        """Проверка сохранения записей на диске между экземплярами кэша
+
+        :return: None
+        """
+        first = FitCache(directory=str(tmp_path)).build_poly(
+            self.x_data, self.y_data, 4, "chebyshev")
+        cache = FitCache(directory=str(tmp_path))
+        second = cache.build_poly(self.x_data, self.y_data, 4, "chebyshev")
+        assert (cache.hits, cache.disk_hits, cache.misses) == (0, 1, 0)
+        assert second(self.x_data) == pytest.approx(first(self.x_data))
+        assert (second.shift, second.scale) == (first.shift, first.scale)
+        cache.clear()
+        assert not list(tmp_path.iterdir())
+
+    def test_disk_eviction(self, tmp_path):
+        """Проверка ограничения размера уровня на диске
+
+        :return: None
+        """
+        cache = FitCache(directory=str(tmp_path), max_bytes=1)
+        cache.build_poly(self.x_data, self.y_data, 2)
+        cache.build_poly(self.x_data, self.y_data, 3)
+        assert not list(tmp_path.glob("*.npz"))
+
+    def test_bad(self):
+        """Проверка обработки некорректных параметров
+
+        :return: None
+        """
+        with pytest.raises(ValueError):
+            FitCache(maxsize=0)
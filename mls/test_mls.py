@@ -4,12 +4,17 @@
     TestCoefs
     TestSolver
     TestPolyBuilder
+    TestPolynomial
     TestStdDev
+    TestBatch
+    TestReadData
 """
 import pytest
 import numpy as np
 import sympy as sm
-from mls.mls_algorythm import coefs_calculate, solve_system, build_poly, std_dev
+from mls.mls_algorythm import coefs_calculate, solve_system, build_poly, std_dev, \
+    horner, Polynomial, SOLVERS, condition_number, build_poly_batch, std_dev_batch, \
+    read_data
 
 
 class TestCoefs:
@@ -17,6 +22,7 @@ class TestCoefs:
 
     Методы:
         test_good(list, list, int, list) \n
+        test_array(list, list, int) \n
         test_bad(list, list, int)
     """
     @pytest.mark.parametrize(
@@ -42,7 +48,31 @@ class TestCoefs:
         :param matrix: корректная СЛАУ
         :return: None
         """
-        assert coefs_calculate(x_data, y_data, degree) == matrix
+        assert coefs_calculate(x_data, y_data, degree, as_list=True) == matrix
+        assert coefs_calculate(x_data, y_data, degree).tolist() == matrix
+
+    @pytest.mark.parametrize(
+        ("x_data", "y_data", "degree"), [
+            ([0.5, 1.5, -2, 3], [1, -1, 2, 0.5], 3),
+            (np.linspace(-1, 2, 50), np.linspace(3, 4, 50), 6)
+        ]
+    )
+    def test_array(self, x_data, y_data, degree):
+        """Проверка совпадения с поэлементным вычислением сумм степеней
+
+        :param x_data: список значений аргумента исходной функции
+        :param y_data: список значений исходной функции
+        :param degree: степень полинома
+        :return: None
+        """
+        x_array = np.array(x_data, dtype=float)
+        y_array = np.array(y_data, dtype=float)
+        expected = [[(x_array ** (row + column)).sum() for column in range(degree + 1)]
+                    + [(y_array * x_array ** row).sum()] for row in range(degree + 1)]
+        system = coefs_calculate(x_data, y_data, degree)
+        assert isinstance(system, np.ndarray)
+        assert system.flags.c_contiguous
+        assert system == pytest.approx(np.array(expected))
 
     @pytest.mark.parametrize(
         ("x_data", "y_data", "degree"), [
@@ -124,6 +154,9 @@ class TestPolyBuilder:
         x_sym: sympy.symbols - символ икса
     Методы:
         test_good(list, list, int, tuple)
+        test_methods(str)
+        test_far_from_zero(str)
+        test_condition()
         test_bad(list, list int)
     """
     x_sym = sm.symbols("x")
@@ -146,23 +179,168 @@ class TestPolyBuilder:
         :return: None
         """
         func_data = build_poly(x_data, y_data, degree)
-        assert (func_data - expected[0]).subs(self.x_sym, 1) <= expected[1]
+        assert (func_data.expr - expected[0]).subs(self.x_sym, 1) <= expected[1]
+
+    @pytest.mark.parametrize("method", SOLVERS)
+    def test_methods(self, method):
+        """Проверка совпадения результатов разных способов решения
+
+        :param method: способ решения
+        :return: None
+        """
+        x_data = [1, 5, 6, 7]
+        y_data = [3, 5, 7, 9]
+        expected = [-0.05, 0.9, -3.35, 5.5][::-1]
+        poly = build_poly(x_data, y_data, 3, method)
+        assert poly(np.array(x_data)) == pytest.approx(
+            np.polynomial.polynomial.polyval(x_data, expected), abs=0.01)
+
+    @pytest.mark.parametrize("method", SOLVERS[1:])
+    def test_far_from_zero(self, method):
+        """Проверка устойчивости полинома высокой степени вдали от нуля
+
+        :param method: способ решения
+        :return: None
+        """
+        x_data = np.linspace(1000, 1010, 200)
+        expected = Polynomial([1, -2, 0.5, 3, -1, 0.2, 0.1], 1005, 5)
+        poly = build_poly(x_data, expected(x_data), 6, method)
+        assert poly(x_data) == pytest.approx(expected(x_data), abs=1e-9)
+
+    def test_condition(self):
+        """Проверка оценки числа обусловленности
+
+        :return: None
+        """
+        x_data = np.linspace(10, 12, 100)
+        normal = condition_number(x_data, 5)
+        assert normal > condition_number(x_data, 5, "qr") ** 2 / 10
+        assert condition_number(x_data, 5, "chebyshev") < 10
 
     @pytest.mark.parametrize(
         ("x_data", "y_data", "degree"), [
             ([1, 2], [2, 5], 2)
         ]
     )
-    def test_bad(self, x_data, y_data, degree):
+    @pytest.mark.parametrize("method", SOLVERS)
+    def test_bad(self, x_data, y_data, degree, method):
         """Проверка обработки некорректных данных
 
         :param x_data: список значений аргументов исходной функции
         :param y_data: список значений исходной функции
         :param degree: степень полинома
+        :param method: способ решения
         :return: None
         """
         with pytest.raises(np.linalg.LinAlgError):
-            build_poly(x_data, y_data, degree)
+            build_poly(x_data, y_data, degree, method)
+
+
+class TestPolynomial:
+    """Тестирование численного полинома
+
+    Поля:
+        x_sym: sympy.symbols - символ икса
+    Методы:
+        test_call(list, list)
+        test_derivative(list, list)
+        test_integral(list, float, list)
+        test_scaled()
+        test_expr(list, sympy.Expr)
+        test_bad(list)
+    """
+    x_sym = sm.symbols("x")
+
+    @pytest.mark.parametrize(
+        ("coefs", "x_values"), [
+            ([1, 2, 3], [0, 1, -2.5]),
+            ([4], [0, 1, 2]),
+            ([0.5, 0, 0, -1], [3, 0.1])
+        ]
+    )
+    def test_call(self, coefs, x_values):
+        """Проверка векторного вычисления значений полинома
+
+        :param coefs: коэффициенты полинома
+        :param x_values: значения аргумента
+        :return: None
+        """
+        poly = Polynomial(coefs)
+        expected = [float(poly.expr.subs(self.x_sym, x)) for x in x_values]
+        assert poly(np.array(x_values)) == pytest.approx(expected)
+
+    @pytest.mark.parametrize(
+        ("coefs", "expected"), [
+            ([1, 2, 3], [2, 6]),
+            ([4], [0]),
+            ([0.5, 0, 0, -1], [0, 0, -3])
+        ]
+    )
+    def test_derivative(self, coefs, expected):
+        """Проверка вычисления производной
+
+        :param coefs: коэффициенты полинома
+        :param expected: коэффициенты производной
+        :return: None
+        """
+        assert Polynomial(coefs).derivative().coefs.tolist() == expected
+
+    @pytest.mark.parametrize(
+        ("coefs", "constant", "expected"), [
+            ([2, 6], 1, [1, 2, 3]),
+            ([4], 0, [0, 4])
+        ]
+    )
+    def test_integral(self, coefs, constant, expected):
+        """Проверка вычисления первообразной
+
+        :param coefs: коэффициенты полинома
+        :param constant: значение первообразной в нуле
+        :param expected: коэффициенты первообразной
+        :return: None
+        """
+        assert Polynomial(coefs).integral(constant).coefs.tolist() == expected
+
+    def test_scaled(self):
+        """Проверка полинома от масштабированной переменной
+
+        :return: None
+        """
+        poly = Polynomial([1, 2, 3], shift=2, scale=0.5)
+        plain = Polynomial([41, -44, 12])
+        x_values = np.array([-1, 0.5, 2, 3])
+        assert poly(x_values) == pytest.approx(plain(x_values))
+        assert poly.derivative()(x_values) == pytest.approx(plain.derivative()(x_values))
+        antiderivative = poly.integral(1)
+        assert antiderivative(2.) == pytest.approx(1)
+        assert antiderivative(3.) - antiderivative(1.) == pytest.approx(
+            plain.integral()(3.) - plain.integral()(1.))
+        assert sm.simplify(poly.expr - plain.expr) == 0
+
+    @pytest.mark.parametrize(
+        ("coefs", "expr"), [
+            ([1, 2, 3], 3 * x_sym ** 2 + 2 * x_sym + 1),
+            ([0, -1], -x_sym)
+        ]
+    )
+    def test_expr(self, coefs, expr):
+        """Проверка построения символьного выражения
+
+        :param coefs: коэффициенты полинома
+        :param expr: ожидаемое выражение
+        :return: None
+        """
+        assert sm.simplify(Polynomial(coefs).expr - expr) == 0
+
+    @pytest.mark.parametrize("coefs", [[], [[1, 2], [3, 4]]])
+    def test_bad(self, coefs):
+        """Проверка обработки некорректных коэффициентов
+
+        :param coefs: коэффициенты полинома
+        :return: None
+        """
+        with pytest.raises(ValueError):
+            Polynomial(coefs)
 
 
 class TestStdDev:
@@ -172,6 +350,8 @@ class TestStdDev:
         x_sym: sympy.symbols - символ икса
     Методы:
         test_good(list, list, sympy.Expr, float)
+        test_numeric(list, list, numpy.ndarray, float)
+        test_symbolic(list, list, sympy.Expr)
         test_bad(list, list sympy.Expr, Exception)
     """
     x_sym = sm.symbols("x")
@@ -194,6 +374,44 @@ class TestStdDev:
         """
         assert std_dev(x_data, y_data, expr) == expected
 
+    @pytest.mark.parametrize(
+        ("x_data", "y_data", "coefs", "expected"), [
+            ([1, 2, 3], [1, 1, 1], np.array([0, 2]), 35),
+            ([1, 2], [5, 0], np.array([0, 3]), 40),
+            ([-1, 0, 2], [2, 1, 9], np.array([1, 0, 2]), 1)
+        ]
+    )
+    def test_numeric(self, x_data, y_data, coefs, expected):
+        """Проверка вычисления отклонения по коэффициентам полинома
+
+        :param x_data: список значений аргументов исходной функции
+        :param y_data: список значений исходной функции
+        :param coefs: коэффициенты полинома по возрастанию степеней
+        :param expected: значение стандартного отклонения
+        :return: None
+        """
+        assert std_dev(x_data, y_data, coefs) == pytest.approx(expected)
+        assert horner(coefs, x_data) == pytest.approx(
+            np.polynomial.polynomial.polyval(x_data, coefs))
+
+    @pytest.mark.parametrize(
+        ("x_data", "y_data", "expr"), [
+            ([1, 2, 3], [1, 1, 1], 2 * x_sym),
+            ([0.5, 1.5, 4], [2, 3, 1], x_sym ** 3 - 0.5 * x_sym + 1)
+        ]
+    )
+    def test_symbolic(self, x_data, y_data, expr):
+        """Проверка совпадения численного и символьного вычисления
+
+        :param x_data: список значений аргументов исходной функции
+        :param y_data: список значений исходной функции
+        :param expr: полином в виде sympy.Expr
+        :return: None
+        """
+        numeric = std_dev(x_data, y_data, expr)
+        symbolic = std_dev(x_data, y_data, expr, symbolic=True)
+        assert numeric == pytest.approx(float(symbolic))
+
     @pytest.mark.parametrize(
         ("x_data", "y_data", "expr", "exception"), [
             ([1, 2], [2], 2 * x_sym, ValueError),
@@ -214,3 +432,147 @@ class TestStdDev:
         """
         with pytest.raises(exception):
             std_dev(x_data, y_data, expr)
+
+
+class TestBatch:
+    """Тестирование построения полиномов для нескольких рядов значений
+
+    Методы:
+        test_good(str)
+        test_std_dev()
+        test_bad(list, numpy.ndarray, int)
+    """
+    x_data = np.linspace(-2, 3, 60)
+    y_data = np.sin(np.outer(np.arange(1, 6), x_data)) + np.arange(1, 6)[:, None]
+
+    @pytest.mark.parametrize("method", SOLVERS)
+    def test_good(self, method):
+        """Проверка совпадения с построением полиномов по одному
+
+        :param method: способ решения
+        :return: None
+        """
+        result = build_poly_batch(self.x_data, self.y_data, 4, method)
+        assert result.coefs.shape == (5, 5)
+        for index, y_row in enumerate(self.y_data):
+            expected = build_poly(self.x_data, y_row, 4, method)
+            assert result.poly(index)(self.x_data) == pytest.approx(expected(self.x_data))
+            assert result.residuals[index] == pytest.approx(
+                std_dev(self.x_data, y_row, expected))
+
+    def test_std_dev(self):
+        """Проверка векторного вычисления отклонений
+
+        :return: None
+        """
+        coefs = np.array([[1, 2, 0], [0, 0, 1]])
+        result = std_dev_batch([0, 1, 2], [[1, 2, 5], [0, 1, 4]], coefs)
+        assert result.tolist() == [1, 0]
+
+    @pytest.mark.parametrize(
+        ("x_data", "y_data", "degree"), [
+            ([1, 2, 3], np.array([1, 2, 3]), 1),
+            ([1, 2, 3], np.ones((2, 4)), 1),
+            ([1, 2, 3], np.ones((2, 3)), 0),
+            ([1, 2, 3], np.ones((0, 3)), 1)
+        ]
+    )
+    def test_bad(self, x_data, y_data, degree):
+        """Проверка обработки некорректных данных
+
+        :param x_data: список значений аргументов исходной функции
+        :param y_data: массив значений функции
+        :param degree: степень полинома
+        :return: None
+        """
+        with pytest.raises(ValueError):
+            build_poly_batch(x_data, y_data, degree)
+
+
+class TestReadData:
+    """Тестирование чтения исходных данных
+
+    Методы:
+        test_text(str)
+        test_binary(str)
+        test_cache()
+        test_bad(str, str)
+    """
+    x_data = [0.1, 0.2, 0.3]
+    y_data = [2.5, -1.0, 4.0]
+
+    @pytest.mark.parametrize(
+        "content", [
+            "0.1 0.2 0.3\n2.5 -1.0 4.0\n",
+            "  0.1\t0.2   0.3 \r\n2.5 -1 4\r\n",
+            "0.1 0.2 0.3\n2.5 -1.0 4.0"
+        ]
+    )
+    def test_text(self, tmp_path, content):
+        """Проверка разбора текстового файла с произвольными пробелами
+
+        :param content: содержимое файла
+        :return: None
+        """
+        path = tmp_path / "data.txt"
+        path.write_text(content)
+        x_data, y_data = read_data(str(path))
+        assert x_data.tolist() == self.x_data
+        assert y_data.tolist() == self.y_data
+
+    @pytest.mark.parametrize("extension", [".npy", ".bin", ".raw"])
+    def test_binary(self, tmp_path, extension):
+        """Проверка чтения двоичных файлов с отображением в память
+
+        :param extension: расширение файла
+        :return: None
+        """
+        path = tmp_path / f"data{extension}"
+        data = np.array([self.x_data, self.y_data])
+        if extension == ".npy":
+            np.save(path, data)
+        else:
+            data.tofile(path)
+        x_data, y_data = read_data(str(path))
+        assert isinstance(x_data.base, np.memmap) or isinstance(x_data, np.memmap)
+        assert x_data.tolist() == self.x_data
+        assert y_data.tolist() == self.y_data
+
+    def test_cache(self, tmp_path):
+        """Проверка создания и обновления двоичной копии
+
+        :return: None
+        """
+        path = tmp_path / "data.txt"
+        path.write_text("1 2 3\n4 5 6\n")
+        user_file = tmp_path / "data.txt.v1-final.npy"
+        np.save(user_file, np.zeros(3))
+        assert read_data(str(path), cache=True)[1].tolist() == [4, 5, 6]
+        assert len(list(tmp_path.glob("data.txt.*.npy"))) == 2
+        assert read_data(str(path), cache=True)[0].tolist() == [1, 2, 3]
+        path.write_text("1 2 3 4\n4 5 6 7\n")
+        assert read_data(str(path), cache=True)[1].tolist() == [4, 5, 6, 7]
+        assert len(list(tmp_path.glob("data.txt.*.npy"))) == 2
+        assert user_file.exists()
+
+    @pytest.mark.parametrize(
+        ("name", "content"), [
+            ("data.txt", "1 2 3\n4 5\n"),
+            ("data.txt", "1 2 3\n"),
+            ("data.bin", b"\0" * 24)
+        ]
+    )
+    def test_bad(self, tmp_path, name, content):
+        """Проверка обработки некорректных файлов
+
+        :param name: имя файла
+        :param content: содержимое файла
+        :return: None
+        """
+        path = tmp_path / name
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content)
+        with pytest.raises(ValueError):
+            read_data(str(path))
@@ -1,14 +1,19 @@
 """
 Модуль, реализующий простейшую линейную регрессию
 
+Классы:
+    IncrementalFit - последовательное повышение степени полинома
+    DegreeSearchResult - результат поиска степени полинома
+
 Функции:
     eps1_calculate(list) - вычисление отклонения
+    degree_search(list, list, str) - поиск степени полинома
     main() - поиск полинома
 """
+from typing import NamedTuple
 import numpy as np
-from sympy.plotting import plot
-import matplotlib.pyplot as plt
 import mls.mls_algorythm as mls
+from rendering.batch import Curve, Figure, render
 
 
 def eps1_calculate(y_list: list) -> float:
@@ -20,28 +25,183 @@ def eps1_calculate(y_list: list) -> float:
     return ((y_array - y_array.mean())**2).sum()
 
 
+# pylint: disable=too-many-instance-attributes
+class IncrementalFit:
+    """Аппроксимация с последовательным повышением степени полинома
+
+    Полиномы, ортогональные на исходных точках, строятся по трёхчленной
+    рекуррентной формуле Форсайта, поэтому переход от степени d к d+1
+    требует O(n) операций и не пересчитывает предыдущие коэффициенты.
+
+    Поля:
+        degree: int - текущая степень полинома
+        rss: float - сумма квадратов отклонений текущего полинома
+        poly: mls.Polynomial - текущий полином
+    Методы:
+        extend() -> float
+    """
+    def __init__(self, x_data: list, y_data: list):
+        """Конструктор класса, строит полином нулевой степени
+
+        :param x_data: список значений аргументов исходной функции
+        :param y_data: список значений исходной функции
+        """
+        if len(x_data) != len(y_data):
+            raise ValueError("x_data and y_data should have same length")
+        self.__shift, self.__scale = mls.scaling(x_data)
+        self.__t_data = (np.asarray(x_data, dtype=float) - self.__shift) / self.__scale
+        self.__previous = np.zeros_like(self.__t_data)
+        self.__current = np.ones_like(self.__t_data)
+        self.__previous_norm = 1.
+        self.__current_norm = float(self.__t_data.size)
+        # коэффициенты ортогональных полиномов и итогового полинома по степеням t
+        self.__previous_coefs = np.zeros(1)
+        self.__current_coefs = np.ones(1)
+        coef = float(np.mean(y_data))
+        self.__coefs = np.array([coef])
+        self.__residual = np.asarray(y_data, dtype=float) - coef
+        self.degree = 0
+        self.rss = float(self.__residual @ self.__residual)
+
+    @property
+    def poly(self) -> mls.Polynomial:
+        """Текущий полином"""
+        return mls.Polynomial(self.__coefs, self.__shift, self.__scale)
+
+    def extend(self) -> float:
+        """Повышение степени полинома на единицу
+
+        :return: сумма квадратов отклонений нового полинома
+        """
+        alpha = (self.__t_data * self.__current) @ self.__current / self.__current_norm
+        beta = self.__current_norm / self.__previous_norm if self.degree else 0.
+        following = (self.__t_data - alpha) * self.__current - beta * self.__previous
+        norm = float(following @ following)
+        if norm <= self.__t_data.size * np.finfo(float).eps * self.__current_norm:
+            raise np.linalg.LinAlgError("Singular matrix")
+
+        coefs = np.zeros(self.degree + 2)
+        coefs[1:] = self.__current_coefs
+        coefs[:-1] -= alpha * self.__current_coefs
+        coefs[:-2] -= beta * self.__previous_coefs
+
+        self.__previous, self.__current = self.__current, following
+        self.__previous_norm, self.__current_norm = self.__current_norm, norm
+        self.__previous_coefs, self.__current_coefs = self.__current_coefs, coefs
+
+        coef = float(self.__residual @ following) / norm
+        self.__residual -= coef * following
+        self.__coefs = np.append(self.__coefs, 0.) + coef * coefs
+        self.degree += 1
+        self.rss = float(self.__residual @ self.__residual)
+        return self.rss
+
+
+class DegreeSearchResult(NamedTuple):
+    """Результат поиска степени полинома
+
+    Поля:
+        poly: mls.Polynomial - выбранный полином
+        degree: int - степень выбранного полинома
+        residuals: numpy.ndarray - суммы квадратов отклонений по степеням от 0
+        scores: numpy.ndarray - значения критерия по степеням от 0
+    """
+    poly: mls.Polynomial
+    degree: int
+    residuals: np.ndarray
+    scores: np.ndarray
+
+
+CRITERIA = ("difference", "aic", "bic", "tolerance")
+
+
+def _score(criterion: str, rss: float, degree: int, size: int) -> float:
+    """Значение информационного критерия
+
+    :param criterion: "aic" или "bic"
+    :param rss: сумма квадратов отклонений
+    :param degree: степень полинома
+    :param size: количество точек
+    :return: значение критерия
+    """
+    penalty = 2. if criterion == "aic" else np.log(size)
+    return size * np.log(max(rss, np.finfo(float).tiny) / size) + penalty * (degree + 1)
+
+
+# pylint: disable=too-many-arguments
+def degree_search(x_data: list, y_data: list, criterion: str = "difference", *,
+                  threshold: float = 0.1, max_degree: int = None,
+                  patience: int = 2) -> DegreeSearchResult:
+    """Поиск степени полинома с последовательным повышением степени
+
+    Критерии остановки:
+        "difference" - первая степень, при которой отклонение от среднего
+        (eps1) и отклонение полинома отличаются не меньше чем на threshold;
+        "aic", "bic" - минимум информационного критерия Акаике или
+        Шварца, поиск прекращается, если критерий не улучшается patience
+        степеней подряд;
+        "tolerance" - последняя степень, повышение которой уменьшает
+        сумму квадратов отклонений больше чем в (1 - threshold) раз.
+
+    :param x_data: список значений аргументов исходной функции
+    :param y_data: список значений исходной функции
+    :param criterion: критерий остановки из CRITERIA
+    :param threshold: порог для критериев "difference" и "tolerance"
+    :param max_degree: максимальная степень, по умолчанию n-1
+    :param patience: число степеней без улучшения для "aic" и "bic"
+    :return: результат поиска в виде DegreeSearchResult
+    """
+    if criterion not in CRITERIA:
+        raise ValueError(f"unknown criterion {criterion!r}, expected one of {CRITERIA}")
+    size = len(x_data)
+    max_degree = size - 1 if max_degree is None else min(max_degree, size - 1)
+    if max_degree < 1:
+        raise ValueError("max_degree should be >=1 ")
+    fit = IncrementalFit(x_data, y_data)
+    residuals = [fit.rss]
+    polys = [fit.poly]
+    scores = [_score(criterion, fit.rss, 0, size)] if criterion in ("aic", "bic") else []
+    best = 0
+    while fit.degree < max_degree:
+        try:
+            rss = fit.extend()
+        except np.linalg.LinAlgError:
+            break
+        residuals.append(rss)
+        polys.append(fit.poly)
+        if criterion == "difference":
+            best = fit.degree
+            if abs(residuals[0] - rss) >= threshold:
+                break
+        elif criterion == "tolerance":
+            if residuals[-2] - rss <= threshold * residuals[-2]:
+                break
+            best = fit.degree
+        else:
+            scores.append(_score(criterion, rss, fit.degree, size))
+            if scores[-1] < scores[best]:
+                best = fit.degree
+            elif fit.degree - best >= patience:
+                break
+    return DegreeSearchResult(polys[best], best, np.array(residuals), np.array(scores))
+
+
 def main():
     """Основная функция поиска полинома и его отрисовки"""
     x_data, y_data = mls.read_data("reg_data.txt")
-    degree = 1
     eps1 = eps1_calculate(y_data)
-    eps2 = eps1
-    poly = 0
-    while abs(eps2 - eps1) < 0.1:
-        poly = mls.build_poly(x_data, y_data, degree)
-        eps2 = mls.std_dev(x_data, y_data, poly)
-        degree += 1
+    poly, degree, residuals, _ = degree_search(x_data, y_data)
+    eps2 = residuals[degree]
     print(f"Poly: {poly}")
     print(f"eps1: {eps1}, eps2: {eps2}, difference: {abs(eps2-eps1)}")
 
-    plt.style.use('dark_background')
-    palette = plot(poly, show=True, legend=False,
-                   size=(7, 7), label=f"poly{degree}",
-                   markers=[{'args': [x_data, y_data, "ro"]}],
-                   xlim=(min(x_data)-0.1, max(x_data)+0.1),
-                   ylim=(-5, 9),
-                   )
-    palette.save("../graphics/regression_dark.jpg")
+    xlim = (min(x_data) - 0.1, max(x_data) + 0.1)
+    x_val = np.linspace(*xlim, 200)
+    curves = (Curve(x_val, poly(x_val), label=f"poly{degree}"),
+              Curve(x_data, y_data, "ro"))
+    render([Figure("../graphics/regression_dark.jpg", curves, "dark_background",
+                   size=(7, 7), legend=False, axes_at_zero=True,
+                   xlim=xlim, ylim=(-5, 9))])
 
 
 if __name__ == "__main__":
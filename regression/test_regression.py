@@ -3,9 +3,16 @@
 
 Функции:
     test_eps1(list, float, float) - тестирование вычисления отклонения
+    test_incremental(int) - тестирование последовательного повышения степени
+    test_degree_search(str, int) - тестирование поиска степени полинома
+    test_degree_search_difference() - тестирование критерия разности отклонений
+    test_degree_search_bad(str, int) - тестирование обработки некорректных данных
 """
 import pytest
-from regression.regression_algorythm import eps1_calculate
+import numpy as np
+import mls.mls_algorythm as mls
+from regression.regression_algorythm import eps1_calculate, IncrementalFit, \
+    degree_search
 
 
 @pytest.mark.parametrize(
@@ -23,3 +30,71 @@ def test_eps1(y_value: list, expected: float, accuracy: float):
     :param accuracy: точность сравнения
     """
     assert eps1_calculate(y_value) == pytest.approx(expected, abs=accuracy)
+
+
+@pytest.mark.parametrize("degree", [1, 3, 6])
+def test_incremental(degree: int):
+    """Тестирование совпадения с построением полинома заданной степени
+
+    :param degree: степень полинома
+    """
+    x_data = np.linspace(-2, 3, 40)
+    y_data = np.sin(x_data) + 0.1 * x_data ** 2
+    fit = IncrementalFit(x_data, y_data)
+    assert fit.rss == pytest.approx(eps1_calculate(y_data))
+    for _ in range(degree):
+        fit.extend()
+    expected = mls.build_poly(x_data, y_data, degree, "qr")
+    assert fit.degree == degree
+    assert fit.rss == pytest.approx(mls.std_dev(x_data, y_data, expected))
+    assert fit.poly(x_data) == pytest.approx(expected(x_data))
+
+
+@pytest.mark.parametrize(
+    ("criterion", "expected"), [
+        ("aic", 3),
+        ("bic", 3),
+        ("tolerance", 3)
+    ]
+)
+def test_degree_search(criterion: str, expected: int):
+    """Тестирование выбора степени зашумлённого кубического полинома
+
+    :param criterion: критерий остановки
+    :param expected: ожидаемая степень
+    """
+    x_data = np.linspace(-3, 5, 500)
+    noise = np.random.default_rng(1).normal(0, 1, x_data.size)
+    y_data = 0.5 * x_data ** 3 - x_data + 2 + noise
+    result = degree_search(x_data, y_data, criterion, threshold=0.01, patience=3)
+    assert result.degree == expected
+    assert result.residuals[0] == pytest.approx(eps1_calculate(y_data))
+    assert result.poly.degree == expected
+
+
+def test_degree_search_difference():
+    """Тестирование критерия разности отклонений на исходных данных"""
+    x_data, y_data = mls.read_data("regression/reg_data.txt")
+    eps1 = eps1_calculate(y_data)
+    result = degree_search(x_data, y_data)
+    degree = 1
+    while abs(mls.std_dev(x_data, y_data, mls.build_poly(x_data, y_data, degree)) - eps1) < 0.1:
+        degree += 1
+    assert result.degree == degree
+    assert abs(result.residuals[degree] - eps1) >= 0.1
+
+
+@pytest.mark.parametrize(
+    ("criterion", "max_degree"), [
+        ("cv", 3),
+        ("aic", 0)
+    ]
+)
+def test_degree_search_bad(criterion: str, max_degree: int):
+    """Тестирование обработки некорректных данных
+
+    :param criterion: критерий остановки
+    :param max_degree: максимальная степень
+    """
+    with pytest.raises(ValueError):
+        degree_search([1, 2, 3], [3, 2, 5], criterion, max_degree=max_degree)
@@ -0,0 +1,3 @@
+"""
+Инициализация пакета rendering
+"""
@@ -0,0 +1,134 @@
+"""
+Пакетная отрисовка графиков без интерактивного окна
+
+Графики описываются заранее вычисленными данными (Figure, Curve), поэтому
+одни и те же значения функций используются для всех вариантов оформления,
+а независимые графики отрисовываются параллельно в пуле процессов.
+Графики строятся через matplotlib.figure.Figure с холстом Agg без pyplot,
+поэтому глобальный бэкенд вызывающего процесса не меняется и plt.show
+никогда не вызывается.
+
+Классы:
+    Curve - кривая или набор точек на графике
+    Figure - описание графика
+
+Функции:
+    variants(Figure, dict) - варианты графика с разными стилями
+    draw(Figure) - отрисовка и сохранение одного графика
+    render(list, int) - отрисовка и сохранение нескольких графиков
+"""
+import os
+import typing
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+STYLES = {"": "default", "_dark": "dark_background"}
+
+
+class Curve(typing.NamedTuple):
+    """Кривая или набор точек на графике
+
+    Поля:
+        x_values: numpy.ndarray - значения по оси абсцисс
+        y_values: numpy.ndarray - значения по оси ординат
+        fmt: str - формат линии matplotlib
+        label: str - подпись для легенды
+    """
+    x_values: np.ndarray
+    y_values: np.ndarray
+    fmt: str = "-"
+    label: str = None
+
+
+class Figure(typing.NamedTuple):
+    """Описание графика
+
+    Поля:
+        path: str - путь для сохранения
+        curves: tuple - кривые графика
+        style: str - стиль matplotlib
+        size: tuple - размер в дюймах
+        title: str - заголовок
+        xlabel: str - подпись оси абсцисс
+        ylabel: str - подпись оси ординат
+        legend: bool - отображать ли легенду
+        axes_at_zero: bool - проводить ли оси через начало координат
+        xlim: tuple - границы оси абсцисс
+        ylim: tuple - границы оси ординат
+    """
+    path: str
+    curves: tuple
+    style: str = "default"
+    size: tuple = None
+    title: str = None
+    xlabel: str = None
+    ylabel: str = None
+    legend: bool = True
+    axes_at_zero: bool = False
+    xlim: tuple = None
+    ylim: tuple = None
+
+
+def variants(figure: Figure, styles: dict = None) -> list:
+    """Варианты графика с разными стилями и общими данными
+
+    :param figure: исходный график
+    :param styles: словарь {суффикс имени файла: стиль}, по умолчанию STYLES
+    :return: список графиков
+    """
+    root, extension = os.path.splitext(figure.path)
+    return [figure._replace(path=f"{root}{suffix}{extension}", style=style)
+            for suffix, style in (styles or STYLES).items()]
+
+
+# pylint: disable=import-outside-toplevel
+def draw(figure: Figure) -> str:
+    """Отрисовка и сохранение одного графика на холсте Agg
+
+    :param figure: описание графика
+    :return: путь к сохранённому файлу
+    """
+    from matplotlib import style
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure as CanvasFigure
+
+    with style.context(figure.style):
+        fig = CanvasFigure(figsize=figure.size)
+        FigureCanvasAgg(fig)
+        axis = fig.add_subplot(1, 1, 1)
+        if figure.axes_at_zero:
+            axis.spines['left'].set_position(("data", 0.0))
+            axis.spines['bottom'].set_position(("data", 0.0))
+            axis.spines['right'].set_color('none')
+            axis.spines['top'].set_color('none')
+        for curve in figure.curves:
+            axis.plot(curve.x_values, curve.y_values, curve.fmt, label=curve.label)
+        if figure.title:
+            axis.set_title(figure.title)
+        if figure.xlabel:
+            axis.set_xlabel(figure.xlabel)
+        if figure.ylabel:
+            axis.set_ylabel(figure.ylabel)
+        if figure.xlim:
+            axis.set_xlim(*figure.xlim)
+        if figure.ylim:
+            axis.set_ylim(*figure.ylim)
+        if figure.legend and any(curve.label for curve in figure.curves):
+            axis.legend()
+        fig.savefig(figure.path)
+    return figure.path
+
+
+def render(figures: list, processes: int = None) -> list:
+    """Отрисовка и сохранение нескольких графиков
+
+    :param figures: список описаний графиков
+    :param processes: количество процессов, 1 - без пула,
+    по умолчанию число ядер
+    :return: список путей к сохранённым файлам
+    """
+    figures = list(figures)
+    if processes == 1 or len(figures) <= 1:
+        return [draw(figure) for figure in figures]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(executor.map(draw, figures))
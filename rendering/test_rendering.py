@@ -0,0 +1,55 @@
+"""
+Тестирование пакетной отрисовки графиков
+
+Функции:
+    test_variants - тестирование вариантов оформления графика
+    test_render - тестирование отрисовки и сохранения графиков
+    test_backend - тестирование сохранения бэкенда вызывающего процесса
+"""
+import subprocess
+import sys
+import pytest
+import numpy as np
+from rendering.batch import Curve, Figure, render, variants
+
+
+def test_variants():
+    """Тестирование вариантов оформления графика"""
+    curves = (Curve(np.arange(3), np.arange(3)),)
+    result = variants(Figure("graphics/plot.jpg", curves, size=(7, 7)))
+    assert [figure.path for figure in result] == ["graphics/plot.jpg",
+                                                  "graphics/plot_dark.jpg"]
+    assert [figure.style for figure in result] == ["default", "dark_background"]
+    assert all(figure.curves is curves and figure.size == (7, 7) for figure in result)
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_render(tmp_path, processes: int):
+    """Тестирование отрисовки и сохранения графиков
+
+    :param processes: количество процессов
+    """
+    x_values = np.linspace(-1, 1, 50)
+    curves = (Curve(x_values, x_values ** 2, "--", "square"),
+              Curve([0, 0.5], [0, 0.25], "ro"))
+    figures = variants(Figure(str(tmp_path / "plot.png"), curves, axes_at_zero=True,
+                              title="square", xlim=(-1, 1), ylim=(0, 1)))
+    figures.append(Figure(str(tmp_path / "points.png"), curves[1:], legend=False))
+    paths = render(figures, processes)
+    assert paths == [figure.path for figure in figures]
+    assert sorted(path.name for path in tmp_path.iterdir()) == \
+        ["plot.png", "plot_dark.png", "points.png"]
+    assert all(path.stat().st_size > 0 for path in tmp_path.iterdir())
+
+
+def test_backend(tmp_path):
+    """Тестирование того, что отрисовка не меняет бэкенд и не загружает pyplot"""
+    code = ("import sys, matplotlib\n"
+            "matplotlib.use('pdf')\n"
+            "from rendering.batch import Curve, Figure, render\n"
+            f"render([Figure({str(tmp_path / 'plot.png')!r}, (Curve([0, 1], [0, 1]),))], 1)\n"
+            "print(matplotlib.get_backend(), 'matplotlib.pyplot' in sys.modules)\n")
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                            text=True, check=True).stdout.split()
+    assert output == ["pdf", "False"]
+    assert (tmp_path / "plot.png").stat().st_size > 0
@@ -0,0 +1,38 @@
+"""
+Тестирование времени запуска численных вычислений во всех пакетах
+
+Функции:
+    test_import_budget - тестирование отложенного импорта тяжёлых библиотек
+"""
+import subprocess
+import sys
+import pytest
+
+BUDGET = 1.0
+
+
+@pytest.mark.parametrize(
+    "statement", [
+        "import mls.mls_algorythm as m; p = m.build_poly([1, 2, 3], [1, 2, 4], 2); "
+        "m.std_dev([1, 2, 3], [1, 2, 4], p); p.derivative()(2.)",
+        "import mls.accumulator, mls.fit_cache, mls.cross_validation",
+        "import regression.regression_algorythm as r; r.degree_search([1, 2, 3], [1, 2, 4])",
+        "import diff_eq",
+        "import golden_ratio"
+    ]
+)
+def test_import_budget(statement: str):
+    """Проверка, что численные вычисления не загружают sympy, matplotlib и pytest
+    и укладываются в допустимое время BUDGET
+
+    :param statement: выполняемый код
+    """
+    code = ("import sys, time\n"
+            "start = time.perf_counter()\n"
+            f"{statement}\n"
+            "print(time.perf_counter() - start)\n"
+            "print(*sorted({'sympy', 'matplotlib', 'pytest'} & set(sys.modules)))\n")
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                            text=True, check=True).stdout.split("\n")
+    assert output[1] == ""
+    assert float(output[0]) < BUDGET